@@ -1,7 +1,43 @@
 # Explicitly "import ... as" to make mypy --strict happy
+from ._aligned import aligned_buffer as aligned_buffer
+from ._async import AsyncCRC32CHash as AsyncCRC32CHash
+from ._async import acrc32c as acrc32c
+from ._cache import ChecksumCache as ChecksumCache
+from ._calibrate import Calibration as Calibration
+from ._calibrate import calibrate as calibrate
 from ._cli import main
+from ._crc32c import CRC32CHash as CRC32CHash
+from ._crc32c import RollingCRC32C as RollingCRC32C
+from ._crc32c import available_backends as available_backends
+from ._crc32c import backend as backend
 from ._crc32c import big_endian as big_endian
+from ._crc32c import copy_crc32c as copy_crc32c
 from ._crc32c import crc32 as crc32
 from ._crc32c import crc32c as crc32c
+from ._crc32c import crc32c_combine as crc32c_combine
+from ._crc32c import crc32c_combine_many as crc32c_combine_many
+from ._crc32c import crc32c_file as crc32c_file
+from ._crc32c import crc32c_many as crc32c_many
+from ._crc32c import crc32c_parallel as crc32c_parallel
+from ._crc32c import crc32c_strided as crc32c_strided
+from ._crc32c import enable_stats as enable_stats
+from ._crc32c import frame_records as frame_records
+from ._crc32c import get_backend as get_backend
+from ._crc32c import get_gil_release_threshold as get_gil_release_threshold
 from ._crc32c import hardware_based as hardware_based
-from ._crc32hash import CRC32CHash as CRC32CHash
+from ._crc32c import mask_crc32c as mask_crc32c
+from ._crc32c import new as new
+from ._crc32c import reset_stats as reset_stats
+from ._crc32c import scan_masked_records as scan_masked_records
+from ._crc32c import set_backend as set_backend
+from ._crc32c import set_gil_release_threshold as set_gil_release_threshold
+from ._crc32c import stats as stats
+from ._crc32c import unmask_crc32c as unmask_crc32c
+from ._io import ChecksumReader as ChecksumReader
+from ._io import ChecksumWriter as ChecksumWriter
+from ._manifest import FileManifest as FileManifest
+from ._manifest import create_manifest as create_manifest
+from ._manifest import read_manifests as read_manifests
+from ._manifest import verify_manifest as verify_manifest
+from ._manifest import write_manifests as write_manifests
+from ._stream import crc32c_stream as crc32c_stream
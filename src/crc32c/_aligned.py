@@ -0,0 +1,25 @@
+"""Allocation of aligned buffers for I/O and checksumming."""
+
+from __future__ import annotations
+
+import mmap
+
+
+def aligned_buffer(size: int, huge_pages: bool = False) -> mmap.mmap:
+    """
+    Allocates a zero-filled, writable buffer of size bytes starting at a page boundary,
+    backed by an anonymous memory map that is released when closed or garbage collected.
+    If huge_pages is True the kernel is asked to back it with transparent huge pages,
+    where supported (Linux); otherwise this is silently ignored.
+    """
+    if size <= 0:
+        raise ValueError("size must be positive")
+    buffer = mmap.mmap(-1, size)
+    madv_hugepage = getattr(mmap, "MADV_HUGEPAGE", None)
+    if huge_pages and madv_hugepage is not None:
+        try:
+            buffer.madvise(madv_hugepage)
+        except OSError:
+            # e.g., transparent huge pages are disabled in this kernel
+            pass
+    return buffer
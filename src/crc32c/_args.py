@@ -0,0 +1,19 @@
+"""Command-line argument parsing shared by the crc32c script and the benchmark."""
+
+import argparse
+
+_SIZE_SUFFIXES = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(value: str) -> int:
+    """Parses sizes like 4096, 64K or 1G"""
+    multiplier = _SIZE_SUFFIXES.get(value[-1:].upper(), 1)
+    if multiplier != 1:
+        value = value[:-1]
+    try:
+        size = int(value) * multiplier
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    if size <= 0:
+        raise argparse.ArgumentTypeError("size must be positive")
+    return size
@@ -0,0 +1,135 @@
+"""asyncio-friendly crc32c calculation."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import typing
+
+from ._crc32c import CRC32CHash, crc32c, get_gil_release_threshold
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Buffer, Self
+
+_T = typing.TypeVar("_T")
+
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """The executor shared by all asynchronous calculations, created on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="crc32c"
+            )
+        return _executor
+
+
+async def _run(
+    nbytes: int,
+    executor: concurrent.futures.Executor | None,
+    func: typing.Callable[..., _T],
+    *args: typing.Any,
+) -> _T:
+    """
+    Calls func inline if nbytes are below the GIL release threshold,
+    otherwise in the given executor (or the shared one).
+    """
+    if nbytes < get_gil_release_threshold():
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or _get_executor(), functools.partial(func, *args)
+    )
+
+
+async def acrc32c(
+    data: Buffer,
+    value: int = 0,
+    executor: concurrent.futures.Executor | None = None,
+) -> int:
+    """
+    Asynchronous version of crc32c.
+    Inputs smaller than the GIL release threshold are checksummed inline,
+    larger ones in the given executor (or a shared one) with the GIL released.
+    """
+    return await _run(memoryview(data).nbytes, executor, crc32c, data, value)
+
+
+class AsyncCRC32CHash:
+    """
+    A wrapper around CRC32CHash with asynchronous update and extend methods
+    that don't block the event loop when given large inputs,
+    which are checksummed in the given executor (or a shared one).
+    data, if given, is checksummed synchronously.
+    """
+
+    def __init__(
+        self,
+        data: Buffer = b"",
+        executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        self._hash = CRC32CHash(data)
+        self._executor = executor
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def digest_size(self) -> int:
+        return self._hash.digest_size
+
+    @property
+    def block_size(self) -> int:
+        return self._hash.block_size
+
+    @property
+    def name(self) -> str:
+        return self._hash.name
+
+    @property
+    def checksum(self) -> int:
+        return self._hash.checksum
+
+    @property
+    def length(self) -> int:
+        return self._hash.length
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Created lazily, as it binds to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def update(self, data: Buffer) -> None:
+        """
+        Update the hash object with the bytes-like object.
+        Concurrent calls to update and extend are applied in the order they started.
+        """
+        async with self._get_lock():
+            await _run(memoryview(data).nbytes, self._executor, self._hash.update, data)
+
+    async def extend(self, other: CRC32CHash | AsyncCRC32CHash) -> None:
+        """
+        Update the hash object as if it had been given the data of other, see CRC32CHash.extend.
+        Ordered with concurrent calls to update, but always done inline,
+        as combining checksums is cheap.
+        """
+        async with self._get_lock():
+            self._hash.extend(
+                other._hash if isinstance(other, AsyncCRC32CHash) else other
+            )
+
+    def digest(self) -> bytes:
+        return self._hash.digest()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def copy(self) -> Self:
+        res = type(self)(executor=self._executor)
+        res._hash = self._hash.copy()
+        return res
@@ -0,0 +1,141 @@
+"""On-disk cache of file checksums, keyed by file identity."""
+
+from __future__ import annotations
+
+import collections
+import json
+import os
+import tempfile
+import threading
+import time
+import typing
+
+from ._crc32c import crc32c_file
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Self
+
+DEFAULT_MAX_ENTRIES = 1000000
+CACHE_VERSION = 1
+# Files modified this recently might still be modified within the same
+# mtime granularity without it changing, so they are not cached
+_MIN_AGE_NS = 2 * 10**9
+
+
+def _file_key(st: os.stat_result) -> str:
+    return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+class ChecksumCache:
+    """
+    Cache of file checksums keyed by (device, inode, size, mtime_ns),
+    optionally persisted to a JSON file.
+    When it holds more than max_entries entries the least recently used are evicted.
+    Can be used as a context manager, saving it on exit.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[str, int] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path is not None:
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.save()
+
+    def _load(self, path: str | os.PathLike[str]) -> None:
+        try:
+            with open(path, "rt") as f:
+                contents = json.load(f)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            # A corrupted cache is discarded
+            return
+        if not isinstance(contents, dict) or contents.get("version") != CACHE_VERSION:
+            return
+        try:
+            for key, checksum in contents.get("entries", []):
+                self._entries[str(key)] = int(checksum)
+        except (TypeError, ValueError):
+            self._entries.clear()
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def checksum(
+        self,
+        filename: str,
+        compute: typing.Callable[[str], int] = crc32c_file,
+    ) -> int:
+        """
+        Returns the checksum of a file, calculating it with compute
+        only if the file has changed since it was last cached.
+        """
+        st = os.stat(filename)
+        key = _file_key(st)
+        with self._lock:
+            checksum = self._entries.get(key)
+            if checksum is not None:
+                # The new LRU order alone isn't worth rewriting the cache for,
+                # but is saved along with the next change
+                self._entries.move_to_end(key)
+                return checksum
+
+        checksum = compute(filename)
+        # Don't cache files that changed while being checksummed, or that might
+        # change again without their size and mtime_ns changing
+        after = os.stat(filename)
+        if _file_key(after) != key or time.time_ns() - st.st_mtime_ns < _MIN_AGE_NS:
+            return checksum
+        with self._lock:
+            self._entries[key] = checksum
+            self._evict()
+            self._dirty = True
+        return checksum
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._dirty = self._dirty or bool(self._entries)
+            self._entries.clear()
+
+    def save(self) -> None:
+        """Atomically writes the cache to its path, if it has changed."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            contents = {
+                "version": CACHE_VERSION,
+                "entries": list(self._entries.items()),
+            }
+            self._dirty = False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".crc32c-cache")
+        try:
+            with os.fdopen(fd, "wt") as f:
+                json.dump(contents, f)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
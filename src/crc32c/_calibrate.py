@@ -0,0 +1,140 @@
+"""Per-host tuning of the backend and GIL release threshold."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import tempfile
+import time
+import typing
+
+from ._crc32c import (
+    available_backends,
+    crc32c,
+    get_backend,
+    get_gil_release_threshold,
+    set_backend,
+    set_gil_release_threshold,
+)
+
+DEFAULT_MAX_OVERHEAD = 0.05
+_SMALL_SIZE = 64
+_LARGE_SIZE = 1024 * 1024
+_BACKEND_SIZE = 64 * 1024
+_MEASUREMENT_DURATION = 0.002
+_REPEATS = 5
+
+
+class Calibration(typing.NamedTuple):
+    backend: typing.Optional[str]
+    gil_release_threshold: int
+
+
+def _time_call(
+    data: bytes, gil_release_mode: int = -1, backend: str | None = None
+) -> float:
+    """Returns the best time in seconds taken by a crc32c call over several repeats"""
+    calls = max(1, int(_MEASUREMENT_DURATION / max(len(data), 1) * 1e9))
+    best = float("inf")
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        for _ in range(calls):
+            crc32c(data, gil_release_mode=gil_release_mode, backend=backend)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def _fastest_backend() -> str | None:
+    data = b" " * _BACKEND_SIZE
+    timings = {
+        backend: _time_call(data, backend=backend) for backend in available_backends()
+    }
+    return min(timings, key=timings.__getitem__) if timings else None
+
+
+def _measure_gil_release_threshold(max_overhead: float) -> int:
+    """
+    Finds the smallest buffer size for which the time spent releasing and
+    re-acquiring the GIL is at most max_overhead of the time spent checksumming.
+    """
+    small = b" " * _SMALL_SIZE
+    release_overhead = max(0.0, _time_call(small, 1) - _time_call(small, 0))
+    large = b" " * _LARGE_SIZE
+    time_per_byte = (_time_call(large, 0) - _time_call(small, 0)) / (
+        _LARGE_SIZE - _SMALL_SIZE
+    )
+    if time_per_byte <= 0:
+        return get_gil_release_threshold()
+    threshold = release_overhead / (max_overhead * time_per_byte)
+    # Round up to the next KiB
+    return (int(threshold) + 1023) // 1024 * 1024
+
+
+def _cache_key() -> str:
+    return "|".join([platform.node(), platform.machine(), *available_backends()])
+
+
+def _load_cache(cache_file: str) -> typing.Dict[str, typing.Any]:
+    try:
+        with open(cache_file, "rt") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache_file: str, cache: typing.Dict[str, typing.Any]) -> None:
+    directory = os.path.dirname(os.path.abspath(cache_file))
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".crc32c-calibration")
+    try:
+        with os.fdopen(fd, "wt") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _apply(calibration: Calibration) -> None:
+    if calibration.backend is not None:
+        set_backend(calibration.backend)
+    set_gil_release_threshold(calibration.gil_release_threshold)
+
+
+def calibrate(
+    cache_file: str | None = None,
+    select_backend: bool = True,
+    max_overhead: float = DEFAULT_MAX_OVERHEAD,
+    recalibrate: bool = False,
+) -> Calibration:
+    """
+    Measures and applies the fastest backend and the GIL release threshold for this host.
+    If select_backend is False the backend in use is kept and only the threshold is measured.
+    The threshold is the smallest buffer size for which releasing the GIL costs
+    at most max_overhead (as a fraction) of the checksumming time.
+    If cache_file is given, previous results are loaded from it instead of measuring again
+    (unless recalibrate is True), and new results are stored in it.
+    """
+    key = _cache_key()
+    cache: typing.Dict[str, typing.Any] = {}
+    if cache_file is not None:
+        cache = _load_cache(cache_file)
+        if not recalibrate and key in cache:
+            try:
+                calibration = Calibration(**cache[key])
+                _apply(calibration)
+                return calibration
+            except (TypeError, ValueError):
+                pass
+
+    backend = _fastest_backend() if select_backend else get_backend()
+    if backend is not None:
+        set_backend(backend)
+    calibration = Calibration(backend, _measure_gil_release_threshold(max_overhead))
+    _apply(calibration)
+
+    if cache_file is not None:
+        cache[key] = calibration._asdict()
+        _save_cache(cache_file, cache)
+    return calibration
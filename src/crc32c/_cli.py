@@ -1,17 +1,27 @@
 """CLI utility to compute crc32c on an input file."""
 
 import argparse
+import collections
+import concurrent.futures
 import functools
-import mmap
 import os
 import sys
 import time
 import typing
 
-from ._crc32c import crc32c
+from ._args import parse_size
+from ._cache import ChecksumCache
+from ._crc32c import crc32c_file
+from ._manifest import (
+    FileManifest,
+    create_manifest,
+    read_manifests,
+    verify_manifest,
+    write_manifests,
+)
+from ._stream import DEFAULT_BLOCK_SIZE, crc32c_stream
 
-DEFAULT_BLOCK_SIZE_FREAD = 64 * 1024
-DEFAULT_BLOCK_SIZE_MMAP = 10 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
 
 
 class _ChecksumingResult(typing.NamedTuple):
@@ -26,36 +36,132 @@ class _FormattingOptions(typing.NamedTuple):
     show_speed: bool
 
 
-def _mmap_iterator(
-    fileno: int, file_size: int, block_size: int
-) -> typing.Generator[mmap.mmap, None, None]:
-    for offset in range(0, file_size, block_size):
-        length = min(block_size, file_size - offset)
-        with mmap.mmap(
-            fileno, length=length, offset=offset, access=mmap.ACCESS_READ
-        ) as mm:
-            yield mm
-
-
-def _get_checksum(filename: str, block_size: int, use_mmap: bool) -> _ChecksumingResult:
-    with open(filename, "rb") as input_file:
-        fileno = input_file.fileno()
-        file_size = os.stat(fileno).st_size
-        data_iterator: typing.Iterator[mmap.mmap | bytes]
-        if use_mmap:
-            data_iterator = _mmap_iterator(fileno, file_size, block_size)
-        else:
-            read = functools.partial(input_file.read, block_size)
-            data_iterator = iter(read, b"")
-
-        checksum = 0
-        start = time.monotonic()
-        for data in data_iterator:
-            checksum = crc32c(data, checksum)
-        end = time.monotonic()
+def _stream_file(filename: str, block_size: int) -> int:
+    with open(filename, "rb", buffering=0) as input_file:
+        return crc32c_stream(input_file, block_size)
+
+
+def _get_checksum(
+    filename: str,
+    block_size: int,
+    use_crc32c_file: bool,
+    cache: typing.Optional[ChecksumCache] = None,
+) -> _ChecksumingResult:
+    start = time.monotonic()
+    file_size = os.stat(filename).st_size
+    compute: typing.Callable[[str], int] = crc32c_file
+    if not use_crc32c_file:
+        compute = functools.partial(_stream_file, block_size=block_size)
+    if cache is not None:
+        checksum = cache.checksum(filename, compute)
+    else:
+        checksum = compute(filename)
+    end = time.monotonic()
     return _ChecksumingResult(filename, file_size, checksum, (end - start))
 
 
+def _get_manifest(
+    filename: str, chunk_size: int, jobs: int
+) -> typing.Tuple[_ChecksumingResult, FileManifest]:
+    start = time.monotonic()
+    manifest = create_manifest(filename, chunk_size, jobs)
+    end = time.monotonic()
+    result = _ChecksumingResult(filename, manifest.size, manifest.checksum, end - start)
+    return result, manifest
+
+
+def _verify_manifests(
+    manifests: typing.List[FileManifest],
+    filenames: typing.Optional[typing.Set[str]],
+    chunks: typing.Optional[typing.List[int]],
+    jobs: int,
+) -> bool:
+    """Verifies the given chunks of the given files in manifests,
+    reporting the outcome for each file. Returns whether all were correct."""
+    all_ok = True
+    for manifest in manifests:
+        if filenames is not None and manifest.filename not in filenames:
+            continue
+        file_chunks = chunks
+        if file_chunks is not None:
+            file_chunks = [
+                index for index in file_chunks if index < len(manifest.chunks)
+            ]
+        try:
+            failed = verify_manifest(manifest, file_chunks, jobs)
+        except OSError as e:
+            print(f"{manifest.filename}: FAILED ({e.strerror})")
+            all_ok = False
+            continue
+        if failed:
+            failed_chunks = ", ".join(map(str, failed))
+            print(f"{manifest.filename}: FAILED chunks {failed_chunks}")
+            all_ok = False
+        else:
+            print(f"{manifest.filename}: OK")
+    return all_ok
+
+
+def _parse_chunks(value: str) -> typing.List[int]:
+    """Parses chunk lists like 0,3,10-12"""
+    chunks: typing.List[int] = []
+    try:
+        for part in value.split(","):
+            first, _, last = part.partition("-")
+            chunks.extend(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid chunk list: {value!r}")
+    if any(chunk < 0 for chunk in chunks):
+        raise argparse.ArgumentTypeError("chunk indices must be non-negative")
+    return chunks
+
+
+def _read_filenames(stream: typing.TextIO) -> typing.Iterator[str]:
+    for line in stream:
+        filename = line.rstrip("\n")
+        if filename:
+            yield filename
+
+
+def _iter_filenames(
+    filenames: typing.List[str], files_from: typing.Optional[str]
+) -> typing.Iterator[str]:
+    """Yields filenames from the command line, replacing "-" by those in stdin,
+    followed by those in the files_from file"""
+    for filename in filenames:
+        if filename == "-":
+            yield from _read_filenames(sys.stdin)
+        else:
+            yield filename
+    if files_from == "-":
+        yield from _read_filenames(sys.stdin)
+    elif files_from is not None:
+        with open(files_from, "rt") as f:
+            yield from _read_filenames(f)
+
+
+_T = typing.TypeVar("_T")
+_R = typing.TypeVar("_R")
+
+
+def _ordered_map(
+    func: typing.Callable[[_T], _R], iterable: typing.Iterable[_T], jobs: int
+) -> typing.Iterator[_R]:
+    """Like map, but with up to jobs concurrent calls to func.
+    Unlike Executor.map, inputs are consumed lazily."""
+    if jobs == 1:
+        yield from map(func, iterable)
+        return
+    with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        pending: typing.Deque[concurrent.futures.Future[_R]] = collections.deque()
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def _format_result(
     result: _ChecksumingResult, formatting_opts: _FormattingOptions
 ) -> str:
@@ -63,7 +169,7 @@ def _format_result(
     if formatting_opts.show_filename:
         report += f" {result.filename}"
     if formatting_opts.show_speed:
-        speed = result.file_size / result.duration
+        speed = result.file_size / max(result.duration, 1e-9)
         report += f" ({speed / 1024 / 1024:.2f} MB/s)"
     return report
 
@@ -74,17 +180,60 @@ def main(name: str = sys.argv[0], args: typing.List[str] = sys.argv[1:]) -> None
     parser = argparse.ArgumentParser(
         sys.argv[0], description="Calculates and prints crc32c on input file(s)"
     )
-    parser.add_argument("filenames", nargs="+", help="input file(s)")
+    parser.add_argument(
+        "filenames", nargs="*", help='input file(s), "-" to read filenames from stdin'
+    )
+    parser.add_argument(
+        "--files-from",
+        help='Read input filenames from this file, one per line ("-" for stdin)',
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files (or chunks, with --manifest and --verify) to checksum concurrently, 0 for one per CPU. Defaults to 1",
+    )
 
     io_group = parser.add_argument_group("I/O options")
     io_group.add_argument(
-        "-M", "--disable-mmap", help="Avoid reading file with mmap", action="store_true"
+        "-M",
+        "--disable-mmap",
+        help="Read files with crc32c_stream instead of crc32c_file",
+        action="store_true",
+    )
+    io_group.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="Reuse checksums of unchanged files stored in this cache file, and update it",
     )
     io_group.add_argument(
         "-b",
         "--block-size",
         type=int,
-        help=f"Block size for iterative reading",
+        help=f"Block size for iterative reading with -M. Defaults to {DEFAULT_BLOCK_SIZE}",
+    )
+
+    manifest_group = parser.add_argument_group("Manifest options")
+    manifest_group.add_argument(
+        "--manifest",
+        help="Write per-chunk checksums of the input file(s) into this JSON file",
+    )
+    manifest_group.add_argument(
+        "--chunk-size",
+        type=parse_size,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Chunk size for --manifest, with an optional K, M, G or T suffix. Defaults to 64M",
+    )
+    manifest_group.add_argument(
+        "--verify",
+        metavar="MANIFEST",
+        help="Verify the files in this manifest (only the input file(s), if given) instead",
+    )
+    manifest_group.add_argument(
+        "--chunks",
+        type=_parse_chunks,
+        help="Chunks to verify with --verify, like 0,3,10-12. Defaults to all",
     )
 
     formatting_group = parser.add_argument_group("Formatting options")
@@ -102,15 +251,48 @@ def main(name: str = sys.argv[0], args: typing.List[str] = sys.argv[1:]) -> None
     )
 
     opts = parser.parse_args(args)
+    if opts.jobs < 0:
+        parser.error("--jobs must be non-negative")
+    jobs = opts.jobs or os.cpu_count() or 1
+    if opts.verify is not None:
+        if opts.manifest is not None:
+            parser.error("--manifest and --verify are mutually exclusive")
+        selected = None
+        if opts.filenames or opts.files_from is not None:
+            selected = set(_iter_filenames(opts.filenames, opts.files_from))
+        manifests = read_manifests(opts.verify)
+        if not _verify_manifests(manifests, selected, opts.chunks, jobs):
+            sys.exit(1)
+        return
+    if opts.chunks is not None:
+        parser.error("--chunks can only be used with --verify")
+    if not opts.filenames and opts.files_from is None:
+        parser.error("no input files given")
 
-    use_mmap = not opts.disable_mmap
-    block_size = DEFAULT_BLOCK_SIZE_MMAP if use_mmap else DEFAULT_BLOCK_SIZE_FREAD
+    cache = None if opts.cache is None else ChecksumCache(opts.cache)
     get_checksum = functools.partial(
-        _get_checksum, block_size=block_size, use_mmap=use_mmap
+        _get_checksum,
+        block_size=opts.block_size or DEFAULT_BLOCK_SIZE,
+        use_crc32c_file=not opts.disable_mmap,
+        cache=cache,
     )
     formatting_opts = _FormattingOptions(not opts.hide_filename, opts.show_speed)
-    for result in map(get_checksum, opts.filenames):
-        print(_format_result(result, formatting_opts))
+    filenames = _iter_filenames(opts.filenames, opts.files_from)
+    if opts.manifest is not None:
+        # Chunks of a single file are checksummed concurrently instead of files
+        manifests = []
+        for filename in filenames:
+            result, manifest = _get_manifest(filename, opts.chunk_size, jobs)
+            manifests.append(manifest)
+            print(_format_result(result, formatting_opts))
+        write_manifests(opts.manifest, manifests)
+        return
+    try:
+        for result in _ordered_map(get_checksum, filenames, jobs):
+            print(_format_result(result, formatting_opts))
+    finally:
+        if cache is not None:
+            cache.save()
 
 
 if __name__ == "__main__":
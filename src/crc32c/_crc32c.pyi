@@ -1,7 +1,118 @@
-from typing_extensions import Buffer
+from array import array
+from os import PathLike
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, Union, overload
 
+from typing_extensions import Buffer, Self
+
+_B = TypeVar("_B", bound=Buffer)
+
+backend: Optional[str]
 big_endian: int
 hardware_based: bool
 
-def crc32(data: Buffer, value: int = 0, gil_release_mode: int = -1) -> int: ...
-def crc32c(data: Buffer, value: int = 0, gil_release_mode: int = -1) -> int: ...
+def crc32(
+    data: Buffer,
+    value: int = 0,
+    gil_release_mode: int = -1,
+    backend: Optional[str] = None,
+) -> int: ...
+def crc32c(
+    data: Buffer,
+    value: int = 0,
+    gil_release_mode: int = -1,
+    backend: Optional[str] = None,
+) -> int: ...
+def available_backends() -> List[str]: ...
+def get_backend() -> Optional[str]: ...
+def set_backend(name: str) -> None: ...
+def get_gil_release_threshold() -> int: ...
+def set_gil_release_threshold(threshold: int) -> None: ...
+def crc32c_many(
+    buffers: Iterable[Buffer],
+    values: Optional[Iterable[int]] = None,
+    gil_release_mode: int = -1,
+) -> array[int]: ...
+def crc32c_parallel(
+    data: Buffer, value: int = 0, threads: int = 0, min_chunk_size: int = 1048576
+) -> int: ...
+@overload
+def crc32c_strided(
+    buffer: Buffer,
+    record_size: int,
+    stride: Optional[int] = None,
+    out: None = None,
+    gil_release_mode: int = -1,
+) -> array[int]: ...
+@overload
+def crc32c_strided(
+    buffer: Buffer,
+    record_size: int,
+    stride: Optional[int],
+    out: _B,
+    gil_release_mode: int = -1,
+) -> _B: ...
+@overload
+def crc32c_strided(
+    buffer: Buffer,
+    record_size: int,
+    stride: Optional[int] = None,
+    *,
+    out: _B,
+    gil_release_mode: int = -1,
+) -> _B: ...
+def copy_crc32c(
+    src: Buffer, dst: Buffer, value: int = 0, gil_release_mode: int = -1
+) -> int: ...
+def crc32c_file(
+    file: Union[int, str, bytes, PathLike[str], PathLike[bytes]],
+    offset: int = 0,
+    length: Optional[int] = None,
+    value: int = 0,
+) -> int: ...
+def crc32c_combine(crc_a: int, crc_b: int, len_b: int) -> int: ...
+def crc32c_combine_many(pairs: Iterable[Tuple[int, int]]) -> int: ...
+def scan_masked_records(
+    buffer: Buffer, gil_release_mode: int = -1
+) -> Tuple[array[int], array[int], bytes, int]: ...
+def frame_records(payloads: Iterable[Buffer], gil_release_mode: int = -1) -> bytes: ...
+def mask_crc32c(crc: int) -> int: ...
+def unmask_crc32c(masked: int) -> int: ...
+def stats() -> Dict[str, Any]: ...
+def reset_stats() -> None: ...
+def enable_stats(enabled: bool = True) -> None: ...
+
+class RollingCRC32C:
+    def __init__(self, window: int) -> None: ...
+    @property
+    def checksum(self) -> int: ...
+    @property
+    def window(self) -> int: ...
+    @property
+    def full(self) -> bool: ...
+    def update(self, data: Buffer) -> None: ...
+    def roll(self, data: Buffer) -> array[int]: ...
+    def reset(self) -> None: ...
+    def copy(self) -> RollingCRC32C: ...
+
+class CRC32CHash:
+    def __init__(self, data: Buffer = b"", gil_release_mode: int = -1) -> None: ...
+    @property
+    def digest_size(self) -> int: ...
+    @property
+    def block_size(self) -> int: ...
+    @property
+    def name(self) -> str: ...
+    @property
+    def checksum(self) -> int: ...
+    @property
+    def length(self) -> int: ...
+    def update(self, data: Buffer) -> None: ...
+    def update_many(self, buffers: Iterable[Buffer]) -> None: ...
+    def extend(self, other: CRC32CHash) -> None: ...
+    @classmethod
+    def concat(cls, hashes: Iterable[CRC32CHash]) -> Self: ...
+    def digest(self) -> bytes: ...
+    def hexdigest(self) -> str: ...
+    def copy(self) -> Self: ...
+
+new = CRC32CHash
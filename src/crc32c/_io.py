@@ -0,0 +1,154 @@
+"""File-object wrappers calculating the crc32c of the data flowing through them."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import io
+import typing
+
+from ._async import _get_executor
+from ._crc32c import CRC32CHash
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Buffer, Protocol
+
+    class _Readable(Protocol):
+        def read(self, __size: int) -> bytes | None: ...
+        def close(self) -> None: ...
+
+    class _Writable(Protocol):
+        def write(self, __data: Buffer) -> int | None: ...
+        def flush(self) -> None: ...
+        def close(self) -> None: ...
+
+
+class _ChecksumIO(io.RawIOBase):
+
+    def __init__(self) -> None:
+        self._hash = CRC32CHash()
+
+    @property
+    def checksum(self) -> int:
+        """
+        The checksum of the data read or written so far.
+        """
+        return self._hash.checksum
+
+    @property
+    def length(self) -> int:
+        """
+        The number of bytes read or written so far.
+        """
+        return self._hash.length
+
+    def verify(self, expected: int) -> bool:
+        """
+        Whether the checksum of the data read or written so far is the expected one.
+        """
+        return self._hash.checksum == expected
+
+
+class ChecksumReader(_ChecksumIO):
+    """
+    A raw binary stream reading from another one (raw) and updating a checksum
+    with the data read, directly from the caller's buffers.
+    raw is closed when this object is closed.
+    """
+
+    def __init__(self, raw: _Readable) -> None:
+        super().__init__()
+        self._raw = raw
+        self._readinto: typing.Callable[[memoryview], int | None] | None = getattr(
+            raw, "readinto", None
+        )
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Buffer) -> int | None:
+        with memoryview(buffer) as view, view.cast("B") as data:
+            if self._readinto is not None:
+                n = self._readinto(data)
+                if n is None:
+                    return None
+            else:
+                chunk = self._raw.read(len(data))
+                if chunk is None:
+                    return None
+                n = len(chunk)
+                data[:n] = chunk
+            with data[:n] as read:
+                self._hash.update(read)
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                super().close()
+            finally:
+                self._raw.close()
+
+
+class ChecksumWriter(_ChecksumIO):
+    """
+    A raw binary stream writing into another one (raw) and updating a checksum
+    with the data written, without copying it.
+    Blocks of at least background_threshold bytes (if given) are checksummed
+    in a background thread while they are being written.
+    raw is flushed and closed when this object is.
+    """
+
+    def __init__(
+        self,
+        raw: _Writable,
+        background_threshold: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        super().__init__()
+        # Checked before setting _raw, so it isn't closed
+        # when this half-initialised object is collected
+        if background_threshold is not None and background_threshold <= 0:
+            raise ValueError("background_threshold must be positive")
+        self._raw = raw
+        self._background_threshold = background_threshold
+        self._executor = executor
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: Buffer) -> int | None:
+        with memoryview(buffer) as view, view.cast("B") as data:
+            background: concurrent.futures.Future[CRC32CHash] | None = None
+            if (
+                self._background_threshold is not None
+                and len(data) >= self._background_threshold
+            ):
+                executor = self._executor or _get_executor()
+                background = executor.submit(CRC32CHash, data, 1)
+            try:
+                n = self._raw.write(data)
+            finally:
+                block_hash = background.result() if background else None
+            if n is None:
+                return None
+            if block_hash is not None and n == len(data):
+                self._hash.extend(block_hash)
+            else:
+                with data[:n] as written:
+                    self._hash.update(written)
+        return n
+
+    def flush(self) -> None:
+        super().flush()
+        raw = getattr(self, "_raw", None)
+        if raw is not None:
+            raw.flush()
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                super().close()
+            finally:
+                raw = getattr(self, "_raw", None)
+                if raw is not None:
+                    raw.close()
@@ -0,0 +1,125 @@
+"""Per-chunk checksum manifests of files, for partial verification."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import typing
+
+from ._crc32c import crc32c_combine_many, crc32c_file
+
+MANIFEST_VERSION = 1
+
+
+class FileManifest(typing.NamedTuple):
+    filename: str
+    size: int
+    chunk_size: int
+    checksum: int
+    chunks: typing.List[int]
+
+    def chunk_range(self, index: int) -> typing.Tuple[int, int]:
+        """The (offset, length) of the given chunk"""
+        offset = index * self.chunk_size
+        return offset, min(self.chunk_size, self.size - offset)
+
+
+def _checksum_chunks(
+    filename: str,
+    ranges: typing.Sequence[typing.Tuple[int, int]],
+    jobs: int,
+) -> typing.List[int]:
+    def checksum(chunk_range: typing.Tuple[int, int]) -> int:
+        return crc32c_file(filename, *chunk_range)
+
+    if jobs == 1 or len(ranges) <= 1:
+        return list(map(checksum, ranges))
+    with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        return list(executor.map(checksum, ranges))
+
+
+def create_manifest(filename: str, chunk_size: int, jobs: int = 1) -> FileManifest:
+    """
+    Checksums each chunk_size bytes of a file, using up to jobs threads.
+    The whole-file checksum is derived by combining those of the chunks.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    size = os.stat(filename).st_size
+    ranges = [
+        (offset, min(chunk_size, size - offset))
+        for offset in range(0, size, chunk_size)
+    ]
+    chunks = _checksum_chunks(filename, ranges, jobs)
+    checksum = crc32c_combine_many(
+        (crc, length) for crc, (_, length) in zip(chunks, ranges)
+    )
+    return FileManifest(filename, size, chunk_size, checksum, chunks)
+
+
+def verify_manifest(
+    manifest: FileManifest,
+    chunks: typing.Iterable[int] | None = None,
+    jobs: int = 1,
+) -> typing.List[int]:
+    """
+    Checksums again the given chunks of a file (all of them by default),
+    using up to jobs threads, and returns the indices of those that don't match.
+    A file whose size has changed fails the verification of all its chunks.
+    """
+    if chunks is None:
+        indices = list(range(len(manifest.chunks)))
+    else:
+        indices = sorted(set(chunks))
+        for index in indices:
+            if not 0 <= index < len(manifest.chunks):
+                raise IndexError(f"{manifest.filename} has no chunk {index}")
+    if os.stat(manifest.filename).st_size != manifest.size:
+        return indices
+    ranges = [manifest.chunk_range(index) for index in indices]
+    checksums = _checksum_chunks(manifest.filename, ranges, jobs)
+    return [
+        index
+        for index, checksum in zip(indices, checksums)
+        if checksum != manifest.chunks[index]
+    ]
+
+
+def write_manifests(
+    path: str | os.PathLike[str], manifests: typing.Iterable[FileManifest]
+) -> None:
+    """Writes the manifests of one or more files into a JSON file"""
+    contents = {
+        "version": MANIFEST_VERSION,
+        "files": [
+            {
+                "filename": manifest.filename,
+                "size": manifest.size,
+                "chunk_size": manifest.chunk_size,
+                "checksum": f"{manifest.checksum:08x}",
+                "chunks": [f"{crc:08x}" for crc in manifest.chunks],
+            }
+            for manifest in manifests
+        ],
+    }
+    with open(path, "wt") as f:
+        json.dump(contents, f, indent=1)
+
+
+def read_manifests(path: str | os.PathLike[str]) -> typing.List[FileManifest]:
+    """Reads the manifests written by write_manifests"""
+    with open(path, "rt") as f:
+        contents = json.load(f)
+    if contents.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version: {contents.get('version')}")
+    return [
+        FileManifest(
+            entry["filename"],
+            entry["size"],
+            entry["chunk_size"],
+            int(entry["checksum"], 16),
+            [int(crc, 16) for crc in entry["chunks"]],
+        )
+        for entry in contents["files"]
+    ]
@@ -0,0 +1,89 @@
+"""Checksumming of file-like objects, overlapping reading with checksumming."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import typing
+
+from ._crc32c import crc32c
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Buffer, Protocol
+
+    class _Readable(Protocol):
+        def read(self, __size: int) -> bytes: ...
+
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+
+class _Block(typing.NamedTuple):
+    buffer: bytearray
+    data: Buffer | None
+    error: BaseException | None = None
+
+
+def _reader(
+    fileobj: _Readable,
+    free: queue.SimpleQueue[bytearray | None],
+    filled: queue.SimpleQueue[_Block],
+) -> None:
+    """Reads blocks from fileobj into the buffers taken from free,
+    handing them over through filled until EOF is reached"""
+    readinto = getattr(fileobj, "readinto", None)
+    while True:
+        buffer = free.get()
+        if buffer is None:
+            return
+        try:
+            data: Buffer | None
+            if readinto is not None:
+                n = readinto(buffer)
+                if n is None:
+                    raise BlockingIOError("fileobj is in non-blocking mode")
+                data = memoryview(buffer)[:n] if n else None
+            else:
+                data = fileobj.read(len(buffer)) or None
+        except BaseException as e:
+            filled.put(_Block(buffer, None, e))
+            return
+        filled.put(_Block(buffer, data))
+        if data is None:
+            return
+
+
+def crc32c_stream(
+    fileobj: _Readable, block_size: int = DEFAULT_BLOCK_SIZE, value: int = 0
+) -> int:
+    """
+    Calculates the crc32c of the remaining contents of a binary file-like object.
+    A background thread reads the next block (with readinto if available, otherwise read)
+    while the current one is checksummed with the GIL released.
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    free: queue.SimpleQueue[bytearray | None] = queue.SimpleQueue()
+    filled: queue.SimpleQueue[_Block] = queue.SimpleQueue()
+    for _ in range(2):
+        free.put(bytearray(block_size))
+    reader = threading.Thread(
+        target=_reader, args=(fileobj, free, filled), name="crc32c_stream", daemon=True
+    )
+    reader.start()
+    try:
+        while True:
+            block = filled.get()
+            if block.error is not None:
+                raise block.error
+            if block.data is None:
+                break
+            value = crc32c(block.data, value, gil_release_mode=1)
+            if isinstance(block.data, memoryview):
+                block.data.release()
+            free.put(block.buffer)
+    finally:
+        # Make the reader stop if it's waiting for a buffer
+        free.put(None)
+    reader.join()
+    return value
@@ -1,11 +1,31 @@
+from __future__ import annotations
+
 import argparse
+import csv
+import ctypes
+import importlib.util
+import json
+import platform
+import sys
+import threading
 import time
 import typing
 
-from ._crc32c import crc32c
+from ._args import parse_size
+from ._crc32c import available_backends, crc32c, get_backend, hardware_based
 
 DEFAULT_SIZE = 100 * 1024 * 1024
 DEFAULT_ITERATIONS = 10
+DEFAULT_LATENCY_SIZE = 64
+DEFAULT_LATENCY_CALLS = 1000000
+DEFAULT_IMPORT_ITERATIONS = 1000
+# Powers of 8 from 1 B to 1 GiB
+DEFAULT_SUITE_SIZES = [8**i for i in range(11)]
+DEFAULT_SUITE_ALIGNMENTS = [0, 1]
+DEFAULT_SUITE_GIL_RELEASE_MODES = [0, 1]
+DEFAULT_SUITE_THREADS = [1]
+DEFAULT_SUITE_SAMPLES = 20
+DEFAULT_SUITE_SAMPLE_DURATION = 0.002
 
 
 def run(size: int, iterations: int) -> typing.Tuple[float, int]:
@@ -14,13 +34,249 @@ def run(size: int, iterations: int) -> typing.Tuple[float, int]:
     evaluations = 0
     while True:
         evaluations += iterations
-        [crc32c(data) for _ in range(iterations)]
+        for _ in range(iterations):
+            crc32c(data)
         duration = time.monotonic() - start
         if duration > 0:
             break
     return duration, evaluations
 
 
+def run_latency(size: int, calls: int) -> float:
+    """Returns the average time in seconds taken by a crc32c call on size bytes"""
+    data = b" " * size
+    start = time.perf_counter()
+    for _ in range(calls):
+        crc32c(data)
+    return (time.perf_counter() - start) / calls
+
+
+def run_import(iterations: int) -> float:
+    """
+    Returns the average time in seconds taken to initialise a fresh instance
+    of the C extension module, as a new process or sub-interpreter would
+    """
+    spec = importlib.util.find_spec("crc32c._crc32c")
+    assert spec is not None and spec.loader is not None
+    start = time.perf_counter()
+    for _ in range(iterations):
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return (time.perf_counter() - start) / iterations
+
+
+class SuiteResult(typing.NamedTuple):
+    size: int
+    alignment: int
+    backend: str
+    gil_release_mode: int
+    threads: int
+    calls: int
+    mean_latency_min_ns: float
+    mean_latency_p50_ns: float
+    mean_latency_p90_ns: float
+    mean_latency_p99_ns: float
+    gbps: float
+
+
+def _percentile(sorted_values: typing.Sequence[float], percentile: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty sequence"""
+    rank = max(1, -(-len(sorted_values) * percentile // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _calls_per_sample(data: memoryview, backend: str, sample_duration: float) -> int:
+    """Number of calls on data that take roughly sample_duration"""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            crc32c(data, backend=backend)
+        duration = time.perf_counter() - start
+        if duration >= sample_duration / 10 or calls >= 2**24:
+            break
+        calls *= 2
+    return max(1, int(calls * sample_duration / max(duration, 1e-9)))
+
+
+def _time_samples(
+    data: memoryview,
+    backend: str,
+    gil_release_mode: int,
+    threads: int,
+    calls: int,
+    samples: int,
+) -> typing.List[float]:
+    """
+    Times samples rounds of calls crc32c calls on data, made concurrently
+    by each of the given number of threads, returning the duration of each round
+    """
+
+    def run_calls() -> None:
+        for _ in range(calls):
+            crc32c(data, gil_release_mode=gil_release_mode, backend=backend)
+
+    if threads == 1:
+        durations = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            run_calls()
+            durations.append(time.perf_counter() - start)
+        return durations
+
+    # Workers start each round together, which lasts from the first
+    # of them starting its calls until the last of them finishes
+    barrier = threading.Barrier(threads)
+    starts = [[0.0] * threads for _ in range(samples)]
+    ends = [[0.0] * threads for _ in range(samples)]
+
+    def worker(index: int) -> None:
+        for sample in range(samples):
+            barrier.wait()
+            starts[sample][index] = time.perf_counter()
+            run_calls()
+            ends[sample][index] = time.perf_counter()
+
+    workers = [
+        threading.Thread(target=worker, args=(index,), daemon=True)
+        for index in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return [max(end) - min(start) for start, end in zip(starts, ends)]
+
+
+def _address(buffer: bytearray) -> int:
+    """The memory address of the contents of buffer"""
+    return ctypes.addressof(ctypes.c_char.from_buffer(buffer))
+
+
+def run_suite(
+    sizes: typing.Iterable[int] = DEFAULT_SUITE_SIZES,
+    alignments: typing.Iterable[int] = DEFAULT_SUITE_ALIGNMENTS,
+    backends: typing.Iterable[str] | None = None,
+    gil_release_modes: typing.Iterable[int] = DEFAULT_SUITE_GIL_RELEASE_MODES,
+    threads: typing.Iterable[int] = DEFAULT_SUITE_THREADS,
+    samples: int = DEFAULT_SUITE_SAMPLES,
+    sample_duration: float = DEFAULT_SUITE_SAMPLE_DURATION,
+) -> typing.Iterator[SuiteResult]:
+    """
+    Benchmarks every combination of the given buffer sizes, alignments
+    (offsets from a 64-byte aligned address), backends (all available by default),
+    GIL release modes and thread counts.
+    Each combination is timed over samples rounds of calls lasting roughly sample_duration.
+    Individual calls are too short to time reliably, so the reported latencies
+    are percentiles of the mean latency per call within each round,
+    together with the overall throughput.
+    """
+    sizes = list(sizes)
+    alignments = list(alignments)
+    backends = available_backends() if backends is None else list(backends)
+    gil_release_modes = list(gil_release_modes)
+    threads = list(threads)
+    for size in sizes:
+        buffer = bytearray(size + 64 + max(alignments, default=0))
+        view = memoryview(buffer)
+        base = (-_address(buffer)) % 64
+        for alignment in alignments:
+            data = view[base + alignment : base + alignment + size]
+            for backend in backends:
+                calls = _calls_per_sample(data, backend, sample_duration)
+                for gil_release_mode in gil_release_modes:
+                    for thread_count in threads:
+                        durations = sorted(
+                            _time_samples(
+                                data,
+                                backend,
+                                gil_release_mode,
+                                thread_count,
+                                calls,
+                                samples,
+                            )
+                        )
+                        mean_latencies = [
+                            duration / calls * 1e9 for duration in durations
+                        ]
+                        total_bytes = size * calls * thread_count * samples
+                        yield SuiteResult(
+                            size,
+                            alignment,
+                            backend,
+                            gil_release_mode,
+                            thread_count,
+                            calls * thread_count * samples,
+                            mean_latencies[0],
+                            _percentile(mean_latencies, 50),
+                            _percentile(mean_latencies, 90),
+                            _percentile(mean_latencies, 99),
+                            total_bytes / sum(durations) / 1e9,
+                        )
+            data.release()
+        view.release()
+
+
+def _metadata() -> typing.Dict[str, typing.Any]:
+    return {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "backend": get_backend(),
+        "hardware_based": hardware_based,
+        "available_backends": available_backends(),
+    }
+
+
+def _write_suite_results(
+    results: typing.Iterable[SuiteResult], output_format: str, output: typing.TextIO
+) -> None:
+    if output_format == "json":
+        contents = {
+            "metadata": _metadata(),
+            "results": [result._asdict() for result in results],
+        }
+        json.dump(contents, output, indent=1)
+        output.write("\n")
+        return
+    if output_format == "csv":
+        writer = csv.writer(output)
+        writer.writerow(SuiteResult._fields)
+        for result in results:
+            writer.writerow(result)
+            output.flush()
+        return
+    # Latencies are percentiles of the per-sample mean latency per call
+    print(
+        f"{'size':>12} {'align':>5} {'backend':>8} {'gil':>3} {'thr':>3} "
+        f"{'mean min [ns]':>13} {'mean p50 [ns]':>13} {'mean p90 [ns]':>13} "
+        f"{'mean p99 [ns]':>13} {'GB/s':>8}",
+        file=output,
+    )
+    for result in results:
+        print(
+            f"{result.size:>12} {result.alignment:>5} {result.backend:>8} "
+            f"{result.gil_release_mode:>3} {result.threads:>3} "
+            f"{result.mean_latency_min_ns:>13.1f} {result.mean_latency_p50_ns:>13.1f} "
+            f"{result.mean_latency_p90_ns:>13.1f} {result.mean_latency_p99_ns:>13.1f} "
+            f"{result.gbps:>8.3f}",
+            file=output,
+            flush=True,
+        )
+
+
+def _int_list(value: str) -> typing.List[int]:
+    try:
+        return [int(item) for item in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid list of integers: {value!r}")
+
+
+def _size_list(value: str) -> typing.List[int]:
+    return [parse_size(item) for item in value.split(",")]
+
+
 def main() -> None:
 
     parser = argparse.ArgumentParser()
@@ -28,20 +284,132 @@ def main() -> None:
         "-s",
         "--size",
         type=int,
-        help=f"Amount of bytes to checksum, defaults to {DEFAULT_SIZE}",
-        default=DEFAULT_SIZE,
+        help=f"Amount of bytes to checksum, defaults to {DEFAULT_SIZE} ({DEFAULT_LATENCY_SIZE} with -l)",
     )
     parser.add_argument(
         "-i",
         "--iterations",
         type=int,
-        help=f"Number of times the checksum should we run over the data, defaults to {DEFAULT_ITERATIONS}",
-        default=DEFAULT_ITERATIONS,
+        help=f"Number of times the checksum should we run over the data, defaults to {DEFAULT_ITERATIONS} ({DEFAULT_LATENCY_CALLS} with -l, {DEFAULT_IMPORT_ITERATIONS} with -I)",
+    )
+    parser.add_argument(
+        "-l",
+        "--latency",
+        action="store_true",
+        help="Measure the per-call latency on small inputs instead of throughput",
+    )
+    parser.add_argument(
+        "-I",
+        "--import-time",
+        action="store_true",
+        help="Measure the time taken to initialise the C extension module instead of throughput",
+    )
+    suite = parser.add_argument_group(
+        "suite", "Sweep over a combination of parameters instead of a single run"
+    )
+    suite.add_argument(
+        "--suite",
+        action="store_true",
+        help="Run the benchmark suite, reporting percentiles of the per-sample mean latency and throughput",
+    )
+    suite.add_argument(
+        "--sizes",
+        type=_size_list,
+        default=DEFAULT_SUITE_SIZES,
+        help="Comma-separated buffer sizes (e.g. 64,4K,1M), defaults to powers of 8 from 1 B to 1 GiB",
+    )
+    suite.add_argument(
+        "--max-size",
+        type=parse_size,
+        help="Skip buffer sizes larger than this",
+    )
+    suite.add_argument(
+        "--alignments",
+        type=_int_list,
+        default=DEFAULT_SUITE_ALIGNMENTS,
+        help="Comma-separated offsets from a 64-byte aligned address, defaults to 0,1",
+    )
+    suite.add_argument(
+        "--backends",
+        type=lambda value: value.split(","),
+        help="Comma-separated backends, defaults to all available",
+    )
+    suite.add_argument(
+        "--gil-release-modes",
+        type=_int_list,
+        default=DEFAULT_SUITE_GIL_RELEASE_MODES,
+        help="Comma-separated GIL release modes, defaults to 0,1",
+    )
+    suite.add_argument(
+        "--threads",
+        type=_int_list,
+        default=DEFAULT_SUITE_THREADS,
+        help="Comma-separated numbers of concurrent threads, defaults to 1",
+    )
+    suite.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_SUITE_SAMPLES,
+        help=f"Number of timed samples per combination, defaults to {DEFAULT_SUITE_SAMPLES}",
+    )
+    suite.add_argument(
+        "--format",
+        choices=("text", "json", "csv"),
+        default="text",
+        help="Output format, defaults to text",
+    )
+    suite.add_argument(
+        "-o",
+        "--output",
+        type=argparse.FileType("wt"),
+        default=sys.stdout,
+        help="File to write the results to, defaults to standard output",
     )
 
     options = parser.parse_args()
-    duration, evaluations = run(options.size, options.iterations)
-    size_mb = options.size / 1024 / 1024
+    if options.suite:
+        sizes = [
+            size
+            for size in options.sizes
+            if options.max_size is None or size <= options.max_size
+        ]
+        if options.backends is not None:
+            unavailable = set(options.backends) - set(available_backends())
+            if unavailable:
+                parser.error(f"unavailable backends: {', '.join(sorted(unavailable))}")
+        if options.samples <= 0 or min(options.threads) <= 0:
+            parser.error("--samples and --threads must be positive")
+        if min(options.alignments) < 0:
+            parser.error("--alignments must not be negative")
+        results = run_suite(
+            sizes,
+            options.alignments,
+            options.backends,
+            options.gil_release_modes,
+            options.threads,
+            options.samples,
+        )
+        _write_suite_results(results, options.format, options.output)
+        return
+    if options.import_time:
+        iterations = options.iterations or DEFAULT_IMPORT_ITERATIONS
+        import_us = run_import(iterations) * 1e6
+        print(
+            f"crc32c extension module took {import_us:.1f} [us] to initialise, averaged over {iterations} times"
+        )
+        return
+    if options.latency:
+        size = options.size or DEFAULT_LATENCY_SIZE
+        calls = options.iterations or DEFAULT_LATENCY_CALLS
+        latency_ns = run_latency(size, calls) * 1e9
+        print(
+            f"crc32c took {latency_ns:.1f} [ns] per call when checksuming {size} [B] {calls} times"
+        )
+        return
+
+    size = options.size or DEFAULT_SIZE
+    duration, evaluations = run(size, options.iterations or DEFAULT_ITERATIONS)
+    size_mb = size / 1024 / 1024
     avg_speed_gbs = size_mb / 1024 * evaluations / duration
     print(
         f"crc32c ran at {avg_speed_gbs:.3f} [GB/s] when checksuming {size_mb:.3f} [MB] {evaluations} times"
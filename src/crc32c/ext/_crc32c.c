@@ -25,6 +25,7 @@
  *
  */
 
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
 #include "checkarm.h"
@@ -32,42 +33,1610 @@
 #include "common.h"
 #include "crc32c.h"
 
-#define MIN_BUFSIZE_FOR_AUTOMATIC_RELEASE 32 * 1024  /* threshold for GIL release is 32KiB */
+#define MIN_BUFSIZE_FOR_AUTOMATIC_RELEASE 32 * 1024  /* default threshold for GIL release is 32KiB */
+#define DEFAULT_PARALLEL_MIN_CHUNK_SIZE 1024 * 1024  /* each thread in crc32c_parallel gets at least 1MiB */
 
 /* Used in other files so needs global visibility */
 int is_big_endian;
 
+/* The different crc32c implementations, ordered from slowest to fastest */
+typedef struct _CRC32CBackend {
+	const char *name;
+	crc_function crc_fn;
+	crc_records_function records_fn;  /* optional, interleaves records */
+	int features;                     /* hardware features required, 0 for software */
+} CRC32CBackend;
+
+static const CRC32CBackend backends[] = {
+	{"sw", _crc32c_sw_slicing_by_8, NULL, 0},
+	{"sw16", _crc32c_sw_slicing_by_16, NULL, 0},
+	{"sw_multi", _crc32c_sw_multi, NULL, 0},
+#if defined(IS_INTEL)
+	{"sse42", _crc32c_hw_adler, _crc32c_hw_adler_records, CRC32C_INTEL_SSE42},
+# if defined(CRC32C_IS_64_BITS)
+	{"pclmul", _crc32c_hw_pclmul, _crc32c_hw_adler_records, CRC32C_INTEL_SSE42 | CRC32C_INTEL_PCLMUL},
+# endif
+# if defined(CRC32C_HAVE_VPCLMUL)
+	{"vpclmul", _crc32c_hw_vpclmul, _crc32c_hw_adler_records, CRC32C_INTEL_SSE42 | CRC32C_INTEL_PCLMUL | CRC32C_INTEL_VPCLMUL},
+# endif
+#elif defined(IS_ARM) && (defined(__linux__) || defined(linux))
+	{"arm64", _crc32c_hw_arm64, NULL, CRC32C_ARM64_CRC},
+#endif
+};
+
+#define N_BACKENDS (sizeof(backends) / sizeof(backends[0]))
+
+/* Opt-in usage statistics. Counters are only updated with the GIL held,
+   or atomically on free-threaded builds */
+#define STATS_SIZE_BUCKETS 65  /* by bit length of the input size */
+/* Reading the clock costs tens of nanoseconds, so only calls on inputs
+   at least this large are timed, keeping the overhead negligible */
+#define STATS_MIN_TIMED_SIZE (64 * 1024)
+
+typedef struct _CRC32CStats {
+	uint64_t calls[N_BACKENDS];
+	uint64_t bytes[N_BACKENDS];
+	uint64_t timed_bytes[N_BACKENDS];
+	uint64_t time_ns[N_BACKENDS];
+	uint64_t sizes[STATS_SIZE_BUCKETS];
+	uint64_t gil_released;
+	uint64_t gil_held;
+} CRC32CStats;
+
+#ifdef Py_GIL_DISABLED
+# define STATS_ADD(counter, value) _Py_atomic_add_uint64(&(counter), (value))
+# define STATS_LOAD(counter) _Py_atomic_load_uint64_relaxed(&(counter))
+# define STATS_STORE(counter, value) _Py_atomic_store_uint64_relaxed(&(counter), (value))
+# define STATS_ENABLED(state) _Py_atomic_load_int_relaxed(&(state)->stats_enabled)
+# define STATS_SET_ENABLED(state, value) _Py_atomic_store_int_relaxed(&(state)->stats_enabled, (value))
+#else
+# define STATS_ADD(counter, value) ((counter) += (value))
+# define STATS_LOAD(counter) (counter)
+# define STATS_STORE(counter, value) ((counter) = (value))
+# define STATS_ENABLED(state) ((state)->stats_enabled)
+# define STATS_SET_ENABLED(state, value) ((state)->stats_enabled = (value))
+#endif
+
 typedef struct _CRC32CState {
+	int hw_features;  /* as probed at import time */
+	int sw_allowed;   /* whether CRC32C_SW_MODE allows using software */
+	const CRC32CBackend *backend;
 	crc_function crc_fn;
+	crc_records_function records_fn;  /* optional, interleaves records */
+	Py_ssize_t gil_release_threshold; /* for automatic GIL release */
+	PyObject *hash_type;              /* CRC32CHash */
+	int stats_enabled;
+	CRC32CStats stats;
 } CRC32CState;
 
-CRC32CState *get_state(PyObject *module)
+CRC32CState *get_state(PyObject *module)
+{
+	return (CRC32CState *)PyModule_GetState(module);
+}
+
+static inline int crc32c_inline(crc_function crc_fn, uint32_t crc, unsigned char *bin_data, Py_ssize_t len) {
+	int result;
+	crc ^= 0xffffffff;
+	result = crc_fn(crc, bin_data, len);
+	result ^= 0xffffffff;
+	return result;
+}
+
+static int is_backend_available(CRC32CState *state, const CRC32CBackend *backend)
+{
+	if (!backend->features) {
+		return state->sw_allowed;
+	}
+	return (backend->features & state->hw_features) == backend->features;
+}
+
+/* Looks up an available backend by name, raising ValueError if not found */
+static const CRC32CBackend *find_backend(CRC32CState *state, PyObject *name)
+{
+	size_t i;
+
+	if (!PyUnicode_Check(name)) {
+		PyErr_Format(PyExc_TypeError, "backend must be a str, not %.200s", Py_TYPE(name)->tp_name);
+		return NULL;
+	}
+	for (i = 0; i < N_BACKENDS; i++) {
+		if (PyUnicode_CompareWithASCIIString(name, backends[i].name) == 0 &&
+		    is_backend_available(state, &backends[i])) {
+			return &backends[i];
+		}
+	}
+	PyErr_Format(PyExc_ValueError, "crc32c backend %R is unknown or unavailable", name);
+	return NULL;
+}
+
+static void set_backend(CRC32CState *state, const CRC32CBackend *backend)
+{
+	state->backend = backend;
+	state->crc_fn = backend ? backend->crc_fn : NULL;
+	state->records_fn = backend ? backend->records_fn : NULL;
+}
+
+/* Whether the GIL should be released to process len bytes */
+static inline int should_release_gil(PyObject *module, int gil_release_mode, Py_ssize_t len)
+{
+	return (gil_release_mode < 0 && len >= get_state(module)->gil_release_threshold) || gil_release_mode >= 1;
+}
+
+static crc_function get_crc_fn(PyObject *module)
+{
+	crc_function crc_fn = get_state(module)->crc_fn;
+	if (!crc_fn) {
+		PyErr_SetString(
+		    PyExc_RuntimeError,
+		    "crc32c: software mode disabled and no hardware acceleration found, can't calculate checksum"
+		);
+	}
+	return crc_fn;
+}
+
+/*
+ * Match vectorcall-style positional and keyword arguments against kwlist,
+ * storing borrowed references in values (NULL for missing arguments).
+ * This is a minimal replacement for PyArg_ParseTupleAndKeywords, which is
+ * comparatively expensive for calls on small buffers.
+ */
+static int parse_fastcall_args(const char *fname, const char * const *kwlist, Py_ssize_t n_required,
+                               PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, PyObject **values)
+{
+	Py_ssize_t i, j, n_params, n_kwargs;
+	PyObject *kwname;
+
+	for (n_params = 0; kwlist[n_params]; n_params++) {
+		values[n_params] = NULL;
+	}
+	if (nargs > n_params) {
+		PyErr_Format(PyExc_TypeError, "%s() takes at most %zd arguments (%zd given)", fname, n_params, nargs);
+		return 0;
+	}
+	for (i = 0; i < nargs; i++) {
+		values[i] = args[i];
+	}
+
+	n_kwargs = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+	for (i = 0; i < n_kwargs; i++) {
+		kwname = PyTuple_GET_ITEM(kwnames, i);
+		for (j = 0; j < n_params; j++) {
+			if (PyUnicode_CompareWithASCIIString(kwname, kwlist[j]) == 0) {
+				break;
+			}
+		}
+		if (j == n_params) {
+			PyErr_Format(PyExc_TypeError, "'%U' is an invalid keyword argument for %s()", kwname, fname);
+			return 0;
+		}
+		if (values[j]) {
+			PyErr_Format(PyExc_TypeError, "argument for %s() given by name ('%s') and position (%zd)",
+			             fname, kwlist[j], j + 1);
+			return 0;
+		}
+		values[j] = args[nargs + i];
+	}
+
+	for (i = 0; i < n_required; i++) {
+		if (!values[i]) {
+			PyErr_Format(PyExc_TypeError, "%s() missing required argument '%s' (pos %zd)", fname, kwlist[i], i + 1);
+			return 0;
+		}
+	}
+	return 1;
+}
+
+/* Same semantics as the "I" format unit of PyArg_Parse* */
+static int parse_uint32(PyObject *obj, uint32_t *value)
+{
+	unsigned long result;
+	if (PyFloat_Check(obj)) {
+		PyErr_SetString(PyExc_TypeError, "integer argument expected, got float");
+		return 0;
+	}
+	result = PyLong_AsUnsignedLongMask(obj);
+	if (result == (unsigned long)-1 && PyErr_Occurred()) {
+		return 0;
+	}
+	*value = (uint32_t)result;
+	return 1;
+}
+
+/* Same semantics as the "i" format unit of PyArg_Parse* */
+static int parse_int(PyObject *obj, int *value)
+{
+	long result = PyLong_AsLong(obj);
+	if (result == -1 && PyErr_Occurred()) {
+		return 0;
+	}
+	if (result > INT_MAX || result < INT_MIN) {
+		PyErr_SetString(PyExc_OverflowError, "signed integer is greater than maximum");
+		return 0;
+	}
+	*value = (int)result;
+	return 1;
+}
+
+/* Records count calls on inputs of size bytes each */
+static void record_stats_calls(CRC32CState *state, crc_function crc_fn, uint64_t size, uint64_t count,
+                               int gil_released)
+{
+	size_t backend, bucket = 0;
+	uint64_t bits = size;
+
+	for (backend = 0; backend < N_BACKENDS - 1 && backends[backend].crc_fn != crc_fn; backend++);
+	while (bits) {
+		bucket++;
+		bits >>= 1;
+	}
+	STATS_ADD(state->stats.calls[backend], count);
+	STATS_ADD(state->stats.bytes[backend], count && size > UINT64_MAX / count ? UINT64_MAX : size * count);
+	STATS_ADD(state->stats.sizes[bucket], count);
+	if (gil_released) {
+		STATS_ADD(state->stats.gil_released, count);
+	}
+	else {
+		STATS_ADD(state->stats.gil_held, count);
+	}
+}
+
+/* Records the time taken to checksum bytes, if they are worth timing */
+static void record_stats_time(CRC32CState *state, crc_function crc_fn, uint64_t bytes, uint64_t elapsed_ns)
+{
+	size_t backend;
+
+	if (bytes < STATS_MIN_TIMED_SIZE) {
+		return;
+	}
+	for (backend = 0; backend < N_BACKENDS - 1 && backends[backend].crc_fn != crc_fn; backend++);
+	STATS_ADD(state->stats.timed_bytes[backend], bytes);
+	STATS_ADD(state->stats.time_ns[backend], elapsed_ns);
+}
+
+/* Runs the given statements, timing them into elapsed_ns if timed */
+#define RUN_TIMED(timed, elapsed_ns, ...) \
+	do { \
+		uint64_t timer_start_ = (timed) ? crc32c_monotonic_ns() : 0; \
+		__VA_ARGS__; \
+		if (timed) { \
+			(elapsed_ns) = crc32c_monotonic_ns() - timer_start_; \
+		} \
+	} while (0)
+
+/* Runs the given statements like RUN_TIMED, releasing the GIL if release_gil.
+   Free-threaded builds have no GIL to release, so release_gil is reset there
+   and the statistics show the calls as holding it */
+#ifndef Py_GIL_DISABLED
+# define HAVE_GIL 1
+# define RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns, ...) \
+	do { \
+		if (release_gil) { \
+			Py_BEGIN_ALLOW_THREADS \
+			RUN_TIMED(timed, elapsed_ns, __VA_ARGS__); \
+			Py_END_ALLOW_THREADS \
+		} \
+		else { \
+			RUN_TIMED(timed, elapsed_ns, __VA_ARGS__); \
+		} \
+	} while (0)
+#else
+# define HAVE_GIL 0
+# define RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns, ...) \
+	do { \
+		(release_gil) = 0; \
+		RUN_TIMED(timed, elapsed_ns, __VA_ARGS__); \
+	} while (0)
+#endif
+
+/* Calculates the crc32c of data, optionally releasing the GIL,
+   and records the call in the statistics if they are enabled */
+static inline uint32_t crc32c_compute(CRC32CState *state, crc_function crc_fn, uint32_t crc,
+                                      unsigned char *data, Py_ssize_t len, int release_gil)
+{
+	int stats_enabled = STATS_ENABLED(state);
+	int timed = stats_enabled && len >= STATS_MIN_TIMED_SIZE;
+	uint64_t elapsed_ns = 0;
+
+	RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns, crc = crc32c_inline(crc_fn, crc, data, len));
+	if (stats_enabled) {
+		record_stats_calls(state, crc_fn, (uint64_t)len, 1, release_gil);
+		record_stats_time(state, crc_fn, (uint64_t)len, elapsed_ns);
+	}
+	return crc;
+}
+
+static
+PyObject* crc32c_crc32c(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+	Py_buffer pbin;
+	unsigned char *bin_data = NULL;
+	Py_ssize_t len;
+	uint32_t crc = 0U, result;
+	int gil_release_mode = -1;
+	PyObject *values[4];
+	crc_function crc_fn;
+	const CRC32CBackend *backend;
+
+	static const char * const kwlist[] = {"data", "value", "gil_release_mode", "backend", NULL};
+
+	if (!parse_fastcall_args("crc32c", kwlist, 1, args, nargs, kwnames, values))
+		return NULL;
+	if (values[1] && !parse_uint32(values[1], &crc))
+		return NULL;
+	if (values[2] && !parse_int(values[2], &gil_release_mode))
+		return NULL;
+	if (values[3] && values[3] != Py_None) {
+		backend = find_backend(get_state(module), values[3]);
+		if (!backend) {
+			return NULL;
+		}
+		crc_fn = backend->crc_fn;
+	}
+	else {
+		crc_fn = get_crc_fn(module);
+		if (!crc_fn) {
+			return NULL;
+		}
+	}
+
+	/* bytes are immutable, so their contents can be used without acquiring a
+	   buffer; other objects need to export a contiguous buffer */
+	pbin.obj = NULL;
+	if (PyBytes_CheckExact(values[0])) {
+		bin_data = (unsigned char *)PyBytes_AS_STRING(values[0]);
+		len = PyBytes_GET_SIZE(values[0]);
+	}
+	else {
+		if (PyObject_GetBuffer(values[0], &pbin, PyBUF_SIMPLE) < 0)
+			return NULL;
+		bin_data = pbin.buf;
+		len = pbin.len;
+	}
+
+	result = crc32c_compute(get_state(module), crc_fn, crc, bin_data, len,
+	                        should_release_gil(module, gil_release_mode, len));
+
+	if (pbin.obj) {
+		PyBuffer_Release(&pbin);
+	}
+	return PyLong_FromUnsignedLong(result);
+}
+
+static
+PyObject *crc32c_crc32(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+	if (PyErr_WarnEx(PyExc_DeprecationWarning,
+	                 "crc32c.crc32 will be eventually removed, use crc32c.crc32c instead",
+	                 1) == -1) {
+		return NULL;
+	}
+	return crc32c_crc32c(self, args, nargs, kwnames);
+}
+
+/* Create an array.array('I') object holding the given values */
+static PyObject *new_uint32_array(const uint32_t *values, Py_ssize_t count)
+{
+	PyObject *array_module, *result;
+
+	array_module = PyImport_ImportModule("array");
+	if (array_module == NULL) {
+		return NULL;
+	}
+	result = PyObject_CallMethod(array_module, "array", "sy#", "I", (const char *)values, count * (Py_ssize_t)sizeof(uint32_t));
+	Py_DECREF(array_module);
+	return result;
+}
+
+/* Create an array.array('I') object holding count zeros, to be filled in */
+static PyObject *new_zeroed_uint32_array(Py_ssize_t count)
+{
+	uint32_t zero = 0;
+	PyObject *single, *result;
+
+	single = new_uint32_array(&zero, 1);
+	if (single == NULL) {
+		return NULL;
+	}
+	result = PySequence_Repeat(single, count);
+	Py_DECREF(single);
+	return result;
+}
+
+static
+PyObject *crc32c_crc32c_many(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	PyObject *buffers, *values = Py_None, *buffers_seq, *values_seq = NULL, *result = NULL;
+	Py_buffer *pbins = NULL;
+	uint32_t *crcs = NULL;
+	Py_ssize_t i, count, acquired = 0, total_length = 0;
+	int gil_release_mode = -1, release_gil, timed;
+	uint64_t elapsed_ns = 0;
+
+	static char *kwlist[] = {"buffers", "values", "gil_release_mode", NULL};
+
+	CRC32CState *state = get_state(module);
+	int stats_enabled = STATS_ENABLED(state);
+	crc_function crc_fn = get_crc_fn(module);
+	if (!crc_fn) {
+		return NULL;
+	}
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|Oi:crc32c_many", kwlist, &buffers, &values, &gil_release_mode))
+		return NULL;
+
+	buffers_seq = PySequence_Fast(buffers, "crc32c_many: buffers must be iterable");
+	if (buffers_seq == NULL) {
+		return NULL;
+	}
+	count = PySequence_Fast_GET_SIZE(buffers_seq);
+	if (values != Py_None) {
+		values_seq = PySequence_Fast(values, "crc32c_many: values must be iterable");
+		if (values_seq == NULL) {
+			goto out;
+		}
+		if (PySequence_Fast_GET_SIZE(values_seq) != count) {
+			PyErr_SetString(PyExc_ValueError, "crc32c_many: buffers and values must have the same length");
+			goto out;
+		}
+	}
+
+	pbins = PyMem_New(Py_buffer, count);
+	crcs = PyMem_New(uint32_t, count);
+	if (pbins == NULL || crcs == NULL) {
+		PyErr_NoMemory();
+		goto out;
+	}
+	for (i = 0; i < count; i++) {
+		if (values_seq == NULL) {
+			crcs[i] = 0U;
+		}
+		else {
+			crcs[i] = (uint32_t)PyLong_AsUnsignedLongMask(PySequence_Fast_GET_ITEM(values_seq, i));
+			if (crcs[i] == (uint32_t)-1 && PyErr_Occurred()) {
+				goto out;
+			}
+		}
+		if (PyObject_GetBuffer(PySequence_Fast_GET_ITEM(buffers_seq, i), &pbins[i], PyBUF_SIMPLE) < 0) {
+			goto out;
+		}
+		acquired++;
+		total_length += pbins[i].len;
+	}
+
+	release_gil = should_release_gil(module, gil_release_mode, total_length);
+	timed = stats_enabled && total_length >= STATS_MIN_TIMED_SIZE;
+	RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns,
+		for (i = 0; i < count; i++) {
+			crcs[i] = crc32c_inline(crc_fn, crcs[i], pbins[i].buf, pbins[i].len);
+		}
+	);
+	if (stats_enabled) {
+		for (i = 0; i < count; i++) {
+			record_stats_calls(state, crc_fn, (uint64_t)pbins[i].len, 1, release_gil);
+		}
+		record_stats_time(state, crc_fn, (uint64_t)total_length, elapsed_ns);
+	}
+
+	result = new_uint32_array(crcs, count);
+
+out:
+	for (i = 0; i < acquired; i++) {
+		PyBuffer_Release(&pbins[i]);
+	}
+	PyMem_Free(pbins);
+	PyMem_Free(crcs);
+	Py_XDECREF(values_seq);
+	Py_DECREF(buffers_seq);
+	return result;
+}
+
+static void crc32c_records(CRC32CState *state, const unsigned char *data, uint64_t record_size,
+                           uint64_t stride, uint64_t count, uint32_t *crcs)
+{
+	uint64_t i;
+
+	if (state->records_fn) {
+		state->records_fn(data, record_size, stride, count, crcs);
+		return;
+	}
+	for (i = 0; i < count; i++, data += stride) {
+		crcs[i] = crc32c_inline(state->crc_fn, 0U, (unsigned char *)data, (Py_ssize_t)record_size);
+	}
+}
+
+static int is_uint32_buffer(Py_buffer *view)
+{
+	const char *format = view->format ? view->format : "B";
+	size_t format_len = strlen(format);
+	char code = format_len ? format[format_len - 1] : 'B';
+	return view->itemsize == 4 && strchr("IiLl", code) != NULL;
+}
+
+static
+PyObject *crc32c_crc32c_strided(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	Py_buffer pbin, pout;
+	PyObject *stride_obj = Py_None, *out = Py_None, *result = NULL;
+	Py_ssize_t record_size, stride, count = 0, checksummed;
+	uint32_t *crcs = NULL;
+	int gil_release_mode = -1, release_gil, timed;
+	uint64_t elapsed_ns = 0;
+
+	static char *kwlist[] = {"buffer", "record_size", "stride", "out", "gil_release_mode", NULL};
+
+	CRC32CState *state = get_state(module);
+	int stats_enabled = STATS_ENABLED(state);
+	if (!get_crc_fn(module)) {
+		return NULL;
+	}
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*n|OOi:crc32c_strided", kwlist,
+	                                 &pbin, &record_size, &stride_obj, &out, &gil_release_mode))
+		return NULL;
+
+	pout.obj = NULL;
+	stride = record_size;
+	if (stride_obj != Py_None) {
+		stride = PyLong_AsSsize_t(stride_obj);
+		if (stride == -1 && PyErr_Occurred()) {
+			goto out;
+		}
+	}
+	if (record_size < 1 || stride < 1) {
+		PyErr_SetString(PyExc_ValueError, "record_size and stride must be positive");
+		goto out;
+	}
+	if (pbin.len >= record_size) {
+		count = (pbin.len - record_size) / stride + 1;
+	}
+
+	if (out == Py_None) {
+		crcs = PyMem_New(uint32_t, count > 0 ? count : 1);
+		if (crcs == NULL) {
+			PyErr_NoMemory();
+			goto out;
+		}
+	}
+	else {
+		if (PyObject_GetBuffer(out, &pout, PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+			goto out;
+		}
+		if (!is_uint32_buffer(&pout)) {
+			PyErr_SetString(PyExc_TypeError, "crc32c_strided: out must be a buffer of 32-bit unsigned integers");
+			goto out;
+		}
+		if (pout.len / 4 < count) {
+			PyErr_Format(PyExc_ValueError, "crc32c_strided: out has room for %zd values, but %zd are needed",
+			             pout.len / 4, count);
+			goto out;
+		}
+		crcs = pout.buf;
+	}
+
+	/* overlapping records make this larger than the buffer, so it saturates */
+	checksummed = count > PY_SSIZE_T_MAX / record_size ? PY_SSIZE_T_MAX : count * record_size;
+	release_gil = should_release_gil(module, gil_release_mode, checksummed);
+	timed = stats_enabled && checksummed >= STATS_MIN_TIMED_SIZE;
+	RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns,
+	                      crc32c_records(state, pbin.buf, record_size, stride, count, crcs));
+	if (stats_enabled && count) {
+		record_stats_calls(state, state->crc_fn, (uint64_t)record_size, (uint64_t)count, release_gil);
+		record_stats_time(state, state->crc_fn, (uint64_t)checksummed, elapsed_ns);
+	}
+
+	if (out == Py_None) {
+		result = new_uint32_array(crcs, count);
+	}
+	else {
+		Py_INCREF(out);
+		result = out;
+	}
+
+out:
+	if (out == Py_None) {
+		PyMem_Free(crcs);
+	}
+	if (pout.obj) {
+		PyBuffer_Release(&pout);
+	}
+	PyBuffer_Release(&pbin);
+	return result;
+}
+
+static
+PyObject *crc32c_crc32c_parallel(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	Py_buffer pbin;
+	uint32_t crc = 0U, result;
+	int threads = 0, release_gil, timed;
+	Py_ssize_t min_chunk_size = DEFAULT_PARALLEL_MIN_CHUNK_SIZE;
+	uint64_t elapsed_ns = 0;
+
+	static char *kwlist[] = {"data", "value", "threads", "min_chunk_size", NULL};
+
+	CRC32CState *state = get_state(module);
+	int stats_enabled = STATS_ENABLED(state);
+	crc_function crc_fn = get_crc_fn(module);
+	if (!crc_fn) {
+		return NULL;
+	}
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|Iin:crc32c_parallel", kwlist, &pbin, &crc, &threads, &min_chunk_size))
+		return NULL;
+
+	if (threads < 0 || min_chunk_size < 1) {
+		PyBuffer_Release(&pbin);
+		PyErr_SetString(PyExc_ValueError, "threads must be non-negative and min_chunk_size positive");
+		return NULL;
+	}
+	if (threads == 0) {
+		threads = crc32c_cpu_count();
+	}
+
+	release_gil = should_release_gil(module, -1, pbin.len);
+	timed = stats_enabled && pbin.len >= STATS_MIN_TIMED_SIZE;
+	RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns,
+	                      result = crc32c_parallel(crc_fn, crc, pbin.buf, pbin.len, threads, min_chunk_size));
+	if (stats_enabled) {
+		record_stats_calls(state, crc_fn, (uint64_t)pbin.len, 1, release_gil);
+		record_stats_time(state, crc_fn, (uint64_t)pbin.len, elapsed_ns);
+	}
+
+	PyBuffer_Release(&pbin);
+	return PyLong_FromUnsignedLong(result);
+}
+
+/* Data is copied and checksummed in chunks small enough for the second pass
+   over each of them to be served from the L1 cache, so the source is read
+   from memory only once. This was measured to be at least as fast as
+   interleaving copies into the hardware crc loops. */
+#define COPY_CHUNK_SIZE 4 * 1024
+
+static uint32_t crc32c_copy(crc_function crc_fn, uint32_t crc, unsigned char *dst,
+                            const unsigned char *src, Py_ssize_t len)
+{
+	Py_ssize_t chunk;
+
+	if (src < dst + len && dst < src + len) {
+		crc = crc32c_inline(crc_fn, crc, (unsigned char *)src, len);
+		memmove(dst, src, len);
+		return crc;
+	}
+	crc ^= 0xffffffff;
+	for (; len > 0; len -= chunk, src += chunk, dst += chunk) {
+		chunk = len < COPY_CHUNK_SIZE ? len : COPY_CHUNK_SIZE;
+		crc = crc_fn(crc, src, chunk);
+		memcpy(dst, src, chunk);
+	}
+	return crc ^ 0xffffffff;
+}
+
+static
+PyObject *crc32c_copy_crc32c(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	Py_buffer psrc, pdst;
+	uint32_t crc = 0U, result;
+	int gil_release_mode = -1, release_gil, timed;
+	uint64_t elapsed_ns = 0;
+
+	static char *kwlist[] = {"src", "dst", "value", "gil_release_mode", NULL};
+
+	CRC32CState *state = get_state(module);
+	int stats_enabled = STATS_ENABLED(state);
+	crc_function crc_fn = get_crc_fn(module);
+	if (!crc_fn) {
+		return NULL;
+	}
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*w*|Ii:copy_crc32c", kwlist,
+	                                 &psrc, &pdst, &crc, &gil_release_mode))
+		return NULL;
+
+	if (pdst.len < psrc.len) {
+		PyErr_Format(PyExc_ValueError, "copy_crc32c: dst has room for %zd bytes, but %zd are needed",
+		             pdst.len, psrc.len);
+		PyBuffer_Release(&pdst);
+		PyBuffer_Release(&psrc);
+		return NULL;
+	}
+
+	release_gil = should_release_gil(module, gil_release_mode, psrc.len);
+	timed = stats_enabled && psrc.len >= STATS_MIN_TIMED_SIZE;
+	RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns,
+	                      result = crc32c_copy(crc_fn, crc, pdst.buf, psrc.buf, psrc.len));
+	if (stats_enabled) {
+		record_stats_calls(state, crc_fn, (uint64_t)psrc.len, 1, release_gil);
+		record_stats_time(state, crc_fn, (uint64_t)psrc.len, elapsed_ns);
+	}
+
+	PyBuffer_Release(&pdst);
+	PyBuffer_Release(&psrc);
+	return PyLong_FromUnsignedLong(result);
+}
+
+static int parse_length(PyObject *obj, uint64_t *length)
+{
+	long long value = PyLong_AsLongLong(obj);
+	if (value == -1 && PyErr_Occurred()) {
+		return 0;
+	}
+	if (value < 0) {
+		PyErr_SetString(PyExc_ValueError, "lengths must be non-negative");
+		return 0;
+	}
+	*length = (uint64_t)value;
+	return 1;
+}
+
+static
+PyObject *crc32c_crc32c_combine(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	uint32_t crc_a, crc_b;
+	uint64_t len_b;
+
+	static char *kwlist[] = {"crc_a", "crc_b", "len_b", NULL};
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "IIO&:crc32c_combine", kwlist, &crc_a, &crc_b, parse_length, &len_b))
+		return NULL;
+
+	return PyLong_FromUnsignedLong(crc32c_combine(crc_a, crc_b, len_b));
+}
+
+static
+PyObject *crc32c_crc32c_combine_many(PyObject *module, PyObject *pairs)
+{
+	PyObject *iterator, *item, *pair;
+	uint32_t result = 0U, crc;
+	uint64_t length;
+
+	iterator = PyObject_GetIter(pairs);
+	if (iterator == NULL) {
+		return NULL;
+	}
+
+	while ((item = PyIter_Next(iterator)) != NULL) {
+		pair = PySequence_Fast(item, "crc32c_combine_many: items must be (crc, length) pairs");
+		Py_DECREF(item);
+		if (pair == NULL) {
+			Py_DECREF(iterator);
+			return NULL;
+		}
+		if (PySequence_Fast_GET_SIZE(pair) != 2) {
+			PyErr_SetString(PyExc_ValueError, "crc32c_combine_many: items must be (crc, length) pairs");
+			goto error;
+		}
+		crc = (uint32_t)PyLong_AsUnsignedLongMask(PySequence_Fast_GET_ITEM(pair, 0));
+		if (crc == (uint32_t)-1 && PyErr_Occurred()) {
+			goto error;
+		}
+		if (!parse_length(PySequence_Fast_GET_ITEM(pair, 1), &length)) {
+			goto error;
+		}
+		Py_DECREF(pair);
+		result = crc32c_combine(result, crc, length);
+	}
+	Py_DECREF(iterator);
+	if (PyErr_Occurred()) {
+		return NULL;
+	}
+	return PyLong_FromUnsignedLong(result);
+
+error:
+	Py_DECREF(pair);
+	Py_DECREF(iterator);
+	return NULL;
+}
+
+/*
+ * Masked records, as found in TFRecord files and similar framing formats.
+ * Each record consists of a little-endian 64-bit payload length,
+ * the masked crc32c of those 8 bytes, the payload,
+ * and the masked crc32c of the payload (also little-endian).
+ */
+#define MASKED_RECORD_HEADER_SIZE 12
+#define MASKED_RECORD_FOOTER_SIZE 4
+#define MASKED_CRC_DELTA 0xa282ead8U
+
+static inline uint32_t mask_crc(uint32_t crc)
+{
+	return ((crc >> 15) | (crc << 17)) + MASKED_CRC_DELTA;
+}
+
+static inline uint32_t unmask_crc(uint32_t masked)
+{
+	uint32_t rotated = masked - MASKED_CRC_DELTA;
+	return (rotated >> 17) | (rotated << 15);
+}
+
+static inline uint32_t load_le32(const unsigned char *p)
+{
+	return (uint32_t)p[0] | ((uint32_t)p[1] << 8) | ((uint32_t)p[2] << 16) | ((uint32_t)p[3] << 24);
+}
+
+static inline uint64_t load_le64(const unsigned char *p)
+{
+	return (uint64_t)load_le32(p) | ((uint64_t)load_le32(p + 4) << 32);
+}
+
+static inline void store_le32(unsigned char *p, uint32_t value)
+{
+	p[0] = (unsigned char)value;
+	p[1] = (unsigned char)(value >> 8);
+	p[2] = (unsigned char)(value >> 16);
+	p[3] = (unsigned char)(value >> 24);
+}
+
+static inline void store_le64(unsigned char *p, uint64_t value)
+{
+	store_le32(p, (uint32_t)value);
+	store_le32(p + 4, (uint32_t)(value >> 32));
+}
+
+typedef struct _masked_records_scan {
+	uint64_t *offsets;     /* of the payloads */
+	uint64_t *lengths;     /* of the payloads */
+	unsigned char *valid;  /* whether the payload crc matches */
+	Py_ssize_t count;
+	Py_ssize_t capacity;
+	uint64_t headers;      /* how many header crcs were calculated */
+	uint64_t end;          /* where scanning stopped */
+} masked_records_scan;
+
+static void masked_records_scan_free(masked_records_scan *scan)
+{
+	PyMem_RawFree(scan->offsets);
+	PyMem_RawFree(scan->lengths);
+	PyMem_RawFree(scan->valid);
+}
+
+/*
+ * Walks the records in data, stopping at the end of the data,
+ * at an incomplete record or at a record whose header crc doesn't match.
+ * Runs without the GIL, so only uses raw allocators.
+ * Returns 0 on success, -1 if memory couldn't be allocated.
+ */
+static int scan_masked_records(crc_function crc_fn, const unsigned char *data, uint64_t size,
+                               masked_records_scan *scan)
+{
+	uint64_t pos = 0, length;
+	Py_ssize_t capacity;
+	void *offsets, *lengths, *valid;
+
+	while (size - pos >= MASKED_RECORD_HEADER_SIZE + MASKED_RECORD_FOOTER_SIZE) {
+		length = load_le64(data + pos);
+		scan->headers++;
+		if (mask_crc(crc32c_inline(crc_fn, 0U, (unsigned char *)data + pos, 8)) != load_le32(data + pos + 8)) {
+			break;
+		}
+		if (length > size - pos - MASKED_RECORD_HEADER_SIZE - MASKED_RECORD_FOOTER_SIZE) {
+			break;
+		}
+		if (scan->count == scan->capacity) {
+			capacity = scan->capacity ? scan->capacity * 2 : 64;
+			offsets = PyMem_RawRealloc(scan->offsets, capacity * sizeof(uint64_t));
+			if (offsets != NULL) {
+				scan->offsets = offsets;
+			}
+			lengths = PyMem_RawRealloc(scan->lengths, capacity * sizeof(uint64_t));
+			if (lengths != NULL) {
+				scan->lengths = lengths;
+			}
+			valid = PyMem_RawRealloc(scan->valid, capacity);
+			if (valid != NULL) {
+				scan->valid = valid;
+			}
+			if (offsets == NULL || lengths == NULL || valid == NULL) {
+				return -1;
+			}
+			scan->capacity = capacity;
+		}
+		pos += MASKED_RECORD_HEADER_SIZE;
+		scan->offsets[scan->count] = pos;
+		scan->lengths[scan->count] = length;
+		scan->valid[scan->count] =
+		    mask_crc(crc32c_inline(crc_fn, 0U, (unsigned char *)data + pos, (Py_ssize_t)length)) == load_le32(data + pos + length);
+		scan->count++;
+		pos += length + MASKED_RECORD_FOOTER_SIZE;
+	}
+	scan->end = pos;
+	return 0;
+}
+
+/* Writes the framed version of the payloads into out */
+static void frame_masked_records(crc_function crc_fn, const Py_buffer *payloads, Py_ssize_t count,
+                                 unsigned char *out)
+{
+	Py_ssize_t i;
+	uint64_t length;
+
+	for (i = 0; i < count; i++) {
+		length = (uint64_t)payloads[i].len;
+		store_le64(out, length);
+		store_le32(out + 8, mask_crc(crc32c_inline(crc_fn, 0U, out, 8)));
+		out += MASKED_RECORD_HEADER_SIZE;
+		memcpy(out, payloads[i].buf, payloads[i].len);
+		store_le32(out + length, mask_crc(crc32c_inline(crc_fn, 0U, out, payloads[i].len)));
+		out += length + MASKED_RECORD_FOOTER_SIZE;
+	}
+}
+
+static PyObject *new_uint64_array(const uint64_t *values, Py_ssize_t count)
+{
+	PyObject *array_module, *result;
+
+	array_module = PyImport_ImportModule("array");
+	if (array_module == NULL) {
+		return NULL;
+	}
+	/* a NULL pointer would be converted into None */
+	result = PyObject_CallMethod(array_module, "array", "sy#", "Q", count ? (const char *)values : "",
+	                             count * (Py_ssize_t)sizeof(uint64_t));
+	Py_DECREF(array_module);
+	return result;
+}
+
+static
+PyObject *crc32c_scan_masked_records(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	Py_buffer pbin;
+	PyObject *offsets = NULL, *lengths = NULL, *valid = NULL, *result = NULL;
+	masked_records_scan scan = {NULL, NULL, NULL, 0, 0, 0, 0};
+	Py_ssize_t i;
+	int gil_release_mode = -1, release_gil, timed, err;
+	uint64_t elapsed_ns = 0, checksummed;
+
+	static char *kwlist[] = {"buffer", "gil_release_mode", NULL};
+
+	CRC32CState *state = get_state(module);
+	int stats_enabled = STATS_ENABLED(state);
+	crc_function crc_fn = get_crc_fn(module);
+	if (!crc_fn) {
+		return NULL;
+	}
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|i:scan_masked_records", kwlist, &pbin, &gil_release_mode))
+		return NULL;
+
+	release_gil = should_release_gil(module, gil_release_mode, pbin.len);
+	timed = stats_enabled && pbin.len >= STATS_MIN_TIMED_SIZE;
+	RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns,
+	                      err = scan_masked_records(crc_fn, pbin.buf, (uint64_t)pbin.len, &scan));
+	PyBuffer_Release(&pbin);
+	if (err) {
+		PyErr_NoMemory();
+		goto out;
+	}
+	if (stats_enabled) {
+		record_stats_calls(state, crc_fn, 8, scan.headers, release_gil);
+		checksummed = 8 * scan.headers;
+		for (i = 0; i < scan.count; i++) {
+			record_stats_calls(state, crc_fn, scan.lengths[i], 1, release_gil);
+			checksummed += scan.lengths[i];
+		}
+		record_stats_time(state, crc_fn, checksummed, elapsed_ns);
+	}
+
+	offsets = new_uint64_array(scan.offsets, scan.count);
+	lengths = new_uint64_array(scan.lengths, scan.count);
+	valid = PyBytes_FromStringAndSize((const char *)scan.valid, scan.count);
+	if (offsets != NULL && lengths != NULL && valid != NULL) {
+		result = Py_BuildValue("(OOOK)", offsets, lengths, valid, (unsigned long long)scan.end);
+	}
+
+out:
+	Py_XDECREF(offsets);
+	Py_XDECREF(lengths);
+	Py_XDECREF(valid);
+	masked_records_scan_free(&scan);
+	return result;
+}
+
+static
+PyObject *crc32c_frame_records(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	PyObject *payloads, *payloads_seq, *result = NULL;
+	Py_buffer *pbins = NULL;
+	Py_ssize_t i, count, acquired = 0, total_length = 0, record_overhead;
+	int gil_release_mode = -1, release_gil, timed;
+	uint64_t elapsed_ns = 0;
+
+	static char *kwlist[] = {"payloads", "gil_release_mode", NULL};
+
+	CRC32CState *state = get_state(module);
+	int stats_enabled = STATS_ENABLED(state);
+	crc_function crc_fn = get_crc_fn(module);
+	if (!crc_fn) {
+		return NULL;
+	}
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|i:frame_records", kwlist, &payloads, &gil_release_mode))
+		return NULL;
+
+	payloads_seq = PySequence_Fast(payloads, "frame_records: payloads must be iterable");
+	if (payloads_seq == NULL) {
+		return NULL;
+	}
+	count = PySequence_Fast_GET_SIZE(payloads_seq);
+	pbins = PyMem_New(Py_buffer, count);
+	if (pbins == NULL) {
+		PyErr_NoMemory();
+		goto out;
+	}
+	record_overhead = MASKED_RECORD_HEADER_SIZE + MASKED_RECORD_FOOTER_SIZE;
+	for (i = 0; i < count; i++) {
+		if (PyObject_GetBuffer(PySequence_Fast_GET_ITEM(payloads_seq, i), &pbins[i], PyBUF_SIMPLE) < 0) {
+			goto out;
+		}
+		acquired++;
+		if (pbins[i].len > PY_SSIZE_T_MAX - record_overhead - total_length) {
+			PyErr_SetString(PyExc_OverflowError, "frame_records: payloads are too large");
+			goto out;
+		}
+		total_length += pbins[i].len + record_overhead;
+	}
+
+	result = PyBytes_FromStringAndSize(NULL, total_length);
+	if (result == NULL) {
+		goto out;
+	}
+
+	release_gil = should_release_gil(module, gil_release_mode, total_length);
+	timed = stats_enabled && total_length >= STATS_MIN_TIMED_SIZE;
+	RUN_MAYBE_WITHOUT_GIL(release_gil, timed, elapsed_ns,
+	                      frame_masked_records(crc_fn, pbins, count, (unsigned char *)PyBytes_AS_STRING(result)));
+	if (stats_enabled) {
+		record_stats_calls(state, crc_fn, 8, (uint64_t)count, release_gil);
+		for (i = 0; i < count; i++) {
+			record_stats_calls(state, crc_fn, (uint64_t)pbins[i].len, 1, release_gil);
+		}
+		/* the footers are not checksummed */
+		record_stats_time(state, crc_fn, (uint64_t)(total_length - count * MASKED_RECORD_FOOTER_SIZE), elapsed_ns);
+	}
+
+out:
+	for (i = 0; i < acquired; i++) {
+		PyBuffer_Release(&pbins[i]);
+	}
+	PyMem_Free(pbins);
+	Py_DECREF(payloads_seq);
+	return result;
+}
+
+static
+PyObject *crc32c_mask_crc32c(PyObject *module, PyObject *crc_obj)
+{
+	uint32_t crc;
+	if (!parse_uint32(crc_obj, &crc)) {
+		return NULL;
+	}
+	return PyLong_FromUnsignedLong(mask_crc(crc));
+}
+
+static
+PyObject *crc32c_unmask_crc32c(PyObject *module, PyObject *masked_obj)
+{
+	uint32_t masked;
+	if (!parse_uint32(masked_obj, &masked)) {
+		return NULL;
+	}
+	return PyLong_FromUnsignedLong(unmask_crc(masked));
+}
+
+static int dict_set_uint64(PyObject *dict, const char *key, uint64_t value)
+{
+	int err;
+	PyObject *value_obj = PyLong_FromUnsignedLongLong(value);
+	if (value_obj == NULL) {
+		return -1;
+	}
+	err = PyDict_SetItemString(dict, key, value_obj);
+	Py_DECREF(value_obj);
+	return err;
+}
+
+static PyObject *stats_backends(CRC32CState *state)
+{
+	PyObject *result, *backend_stats;
+	uint64_t calls;
+	size_t i;
+
+	result = PyDict_New();
+	if (result == NULL) {
+		return NULL;
+	}
+	for (i = 0; i < N_BACKENDS; i++) {
+		calls = STATS_LOAD(state->stats.calls[i]);
+		if (!calls) {
+			continue;
+		}
+		backend_stats = PyDict_New();
+		if (backend_stats == NULL ||
+		    PyDict_SetItemString(result, backends[i].name, backend_stats) < 0 ||
+		    dict_set_uint64(backend_stats, "calls", calls) < 0 ||
+		    dict_set_uint64(backend_stats, "bytes", STATS_LOAD(state->stats.bytes[i])) < 0 ||
+		    dict_set_uint64(backend_stats, "timed_bytes", STATS_LOAD(state->stats.timed_bytes[i])) < 0 ||
+		    dict_set_uint64(backend_stats, "time_ns", STATS_LOAD(state->stats.time_ns[i])) < 0) {
+			Py_XDECREF(backend_stats);
+			Py_DECREF(result);
+			return NULL;
+		}
+		Py_DECREF(backend_stats);
+	}
+	return result;
+}
+
+/* Maps the smallest size of each non-empty bucket to its count */
+static PyObject *stats_sizes(CRC32CState *state)
+{
+	PyObject *result, *size, *count;
+	uint64_t value;
+	size_t bucket;
+	int err;
+
+	result = PyDict_New();
+	if (result == NULL) {
+		return NULL;
+	}
+	for (bucket = 0; bucket < STATS_SIZE_BUCKETS; bucket++) {
+		value = STATS_LOAD(state->stats.sizes[bucket]);
+		if (!value) {
+			continue;
+		}
+		size = PyLong_FromUnsignedLongLong(bucket ? (uint64_t)1 << (bucket - 1) : 0);
+		count = PyLong_FromUnsignedLongLong(value);
+		err = size == NULL || count == NULL || PyDict_SetItem(result, size, count) < 0;
+		Py_XDECREF(size);
+		Py_XDECREF(count);
+		if (err) {
+			Py_DECREF(result);
+			return NULL;
+		}
+	}
+	return result;
+}
+
+static
+PyObject *crc32c_stats(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+	CRC32CState *state = get_state(module);
+	PyObject *result, *backends_stats, *sizes;
+
+	result = PyDict_New();
+	if (result == NULL) {
+		return NULL;
+	}
+	backends_stats = stats_backends(state);
+	sizes = stats_sizes(state);
+	if (backends_stats == NULL || sizes == NULL ||
+	    PyDict_SetItemString(result, "enabled", STATS_ENABLED(state) ? Py_True : Py_False) < 0 ||
+	    PyDict_SetItemString(result, "backends", backends_stats) < 0 ||
+	    PyDict_SetItemString(result, "sizes", sizes) < 0 ||
+	    dict_set_uint64(result, "gil_released", STATS_LOAD(state->stats.gil_released)) < 0 ||
+	    dict_set_uint64(result, "gil_held", STATS_LOAD(state->stats.gil_held)) < 0) {
+		Py_CLEAR(result);
+	}
+	Py_XDECREF(backends_stats);
+	Py_XDECREF(sizes);
+	return result;
+}
+
+static
+PyObject *crc32c_reset_stats(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+	CRC32CState *state = get_state(module);
+	size_t i;
+
+	for (i = 0; i < N_BACKENDS; i++) {
+		STATS_STORE(state->stats.calls[i], 0);
+		STATS_STORE(state->stats.bytes[i], 0);
+		STATS_STORE(state->stats.timed_bytes[i], 0);
+		STATS_STORE(state->stats.time_ns[i], 0);
+	}
+	for (i = 0; i < STATS_SIZE_BUCKETS; i++) {
+		STATS_STORE(state->stats.sizes[i], 0);
+	}
+	STATS_STORE(state->stats.gil_released, 0);
+	STATS_STORE(state->stats.gil_held, 0);
+	Py_RETURN_NONE;
+}
+
+static
+PyObject *crc32c_enable_stats(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	int enabled = 1;
+
+	static char *kwlist[] = {"enabled", NULL};
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|p:enable_stats", kwlist, &enabled))
+		return NULL;
+
+	STATS_SET_ENABLED(get_state(module), enabled);
+	Py_RETURN_NONE;
+}
+
+static
+PyObject *crc32c_crc32c_file(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+	PyObject *file, *length_obj = Py_None, *path = NULL;
+	long long offset = 0;
+	uint64_t length = CRC32C_TO_EOF;
+	uint32_t crc = 0U;
+	int fd = -1, err;
+	uint64_t nbytes = 0, elapsed_ns = 0;
+	crc32c_path_char *native_path;
+
+	static char *kwlist[] = {"file", "offset", "length", "value", NULL};
+
+	CRC32CState *state = get_state(module);
+	int stats_enabled = STATS_ENABLED(state);
+	crc_function crc_fn = get_crc_fn(module);
+	if (!crc_fn) {
+		return NULL;
+	}
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|LOI:crc32c_file", kwlist, &file, &offset, &length_obj, &crc))
+		return NULL;
+	if (offset < 0) {
+		PyErr_SetString(PyExc_ValueError, "offset must be non-negative");
+		return NULL;
+	}
+	if (length_obj != Py_None && !parse_length(length_obj, &length)) {
+		return NULL;
+	}
+
+	if (PyLong_Check(file)) {
+		if (!parse_int(file, &fd)) {
+			return NULL;
+		}
+		if (fd < 0) {
+			PyErr_SetString(PyExc_ValueError, "file descriptor cannot be a negative integer");
+			return NULL;
+		}
+		/* the size of the file is unknown until it's read, so it's always timed */
+		Py_BEGIN_ALLOW_THREADS
+		RUN_TIMED(stats_enabled, elapsed_ns, err = crc32c_fd(crc_fn, fd, (uint64_t)offset, length, &crc, &nbytes));
+		Py_END_ALLOW_THREADS
+	}
+	else {
+#if defined(_WIN32)
+		if (!PyUnicode_FSDecoder(file, &path)) {
+			return NULL;
+		}
+		native_path = PyUnicode_AsWideCharString(path, NULL);
+		if (native_path == NULL) {
+			Py_DECREF(path);
+			return NULL;
+		}
+#else
+		if (!PyUnicode_FSConverter(file, &path)) {
+			return NULL;
+		}
+		native_path = PyBytes_AS_STRING(path);
+#endif
+		Py_BEGIN_ALLOW_THREADS
+		RUN_TIMED(stats_enabled, elapsed_ns,
+		          err = crc32c_path(crc_fn, native_path, (uint64_t)offset, length, &crc, &nbytes));
+		Py_END_ALLOW_THREADS
+#if defined(_WIN32)
+		PyMem_Free(native_path);
+#endif
+	}
+
+	if (stats_enabled && !err) {
+		record_stats_calls(state, crc_fn, nbytes, 1, HAVE_GIL);
+		record_stats_time(state, crc_fn, nbytes, elapsed_ns);
+	}
+	if (err) {
+		errno = err;
+		PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path ? file : NULL);
+		Py_XDECREF(path);
+		return NULL;
+	}
+	Py_XDECREF(path);
+	return PyLong_FromUnsignedLong(crc);
+}
+
+static
+PyObject *crc32c_available_backends(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+	CRC32CState *state = get_state(module);
+	PyObject *names, *name;
+	size_t i;
+
+	names = PyList_New(0);
+	if (names == NULL) {
+		return NULL;
+	}
+	for (i = 0; i < N_BACKENDS; i++) {
+		if (!is_backend_available(state, &backends[i])) {
+			continue;
+		}
+		name = PyUnicode_FromString(backends[i].name);
+		if (name == NULL || PyList_Append(names, name) < 0) {
+			Py_XDECREF(name);
+			Py_DECREF(names);
+			return NULL;
+		}
+		Py_DECREF(name);
+	}
+	return names;
+}
+
+static
+PyObject *crc32c_get_backend(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+	const CRC32CBackend *backend = get_state(module)->backend;
+	if (!backend) {
+		Py_RETURN_NONE;
+	}
+	return PyUnicode_FromString(backend->name);
+}
+
+static
+PyObject *crc32c_set_backend(PyObject *module, PyObject *name)
+{
+	CRC32CState *state = get_state(module);
+	const CRC32CBackend *backend = find_backend(state, name);
+	if (!backend) {
+		return NULL;
+	}
+	set_backend(state, backend);
+	Py_RETURN_NONE;
+}
+
+static
+PyObject *crc32c_get_gil_release_threshold(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+	return PyLong_FromSsize_t(get_state(module)->gil_release_threshold);
+}
+
+static
+PyObject *crc32c_set_gil_release_threshold(PyObject *module, PyObject *arg)
 {
-	return (CRC32CState *)PyModule_GetState(module);
+	Py_ssize_t threshold = PyLong_AsSsize_t(arg);
+	if (threshold == -1 && PyErr_Occurred()) {
+		return NULL;
+	}
+	if (threshold < 0) {
+		PyErr_SetString(PyExc_ValueError, "threshold must be non-negative");
+		return NULL;
+	}
+	get_state(module)->gil_release_threshold = threshold;
+	Py_RETURN_NONE;
 }
 
-static inline int crc32c_inline(crc_function crc_fn, uint32_t crc, unsigned char *bin_data, Py_ssize_t len) {
-	int result;
-	crc ^= 0xffffffff;
-	result = crc_fn(crc, bin_data, len);
-	result ^= 0xffffffff;
+/* Objects with mutable state need locking on free-threaded builds */
+#ifdef Py_GIL_DISABLED
+# define CRC32C_BEGIN_LOCKED(obj) Py_BEGIN_CRITICAL_SECTION(obj)
+# define CRC32C_END_LOCKED() Py_END_CRITICAL_SECTION()
+#else
+# define CRC32C_BEGIN_LOCKED(obj) {
+# define CRC32C_END_LOCKED() }
+#endif
+
+typedef struct {
+	PyObject_HEAD
+	struct crc32c_rolling rolling;
+} RollingCRC32CObject;
+
+static PyObject *rolling_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+	RollingCRC32CObject *self;
+	uint64_t window;
+	static char *kwlist[] = {"window", NULL};
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O&:RollingCRC32C", kwlist, parse_length, &window))
+		return NULL;
+	if (window == 0 || window > PY_SSIZE_T_MAX) {
+		PyErr_SetString(PyExc_ValueError, "window must be positive");
+		return NULL;
+	}
+
+	self = (RollingCRC32CObject *)type->tp_alloc(type, 0);
+	if (self == NULL) {
+		return NULL;
+	}
+	if (!crc32c_rolling_init(&self->rolling, window)) {
+		Py_DECREF(self);
+		return PyErr_NoMemory();
+	}
+	return (PyObject *)self;
+}
+
+static void rolling_dealloc(RollingCRC32CObject *self)
+{
+	PyTypeObject *type = Py_TYPE(self);
+	crc32c_rolling_free(&self->rolling);
+	type->tp_free((PyObject *)self);
+	Py_DECREF(type);
+}
+
+static PyObject *rolling_update(RollingCRC32CObject *self, PyObject *data)
+{
+	Py_buffer pbin;
+
+	if (PyObject_GetBuffer(data, &pbin, PyBUF_SIMPLE) < 0)
+		return NULL;
+	CRC32C_BEGIN_LOCKED(self)
+	crc32c_rolling_update(&self->rolling, pbin.buf, pbin.len, NULL);
+	CRC32C_END_LOCKED()
+	PyBuffer_Release(&pbin);
+	Py_RETURN_NONE;
+}
+
+static PyObject *rolling_roll(RollingCRC32CObject *self, PyObject *data)
+{
+	Py_buffer pbin, pout;
+	PyObject *result = NULL;
+
+	if (PyObject_GetBuffer(data, &pbin, PyBUF_SIMPLE) < 0)
+		return NULL;
+	CRC32C_BEGIN_LOCKED(self)
+	result = new_zeroed_uint32_array((Py_ssize_t)crc32c_rolling_count(&self->rolling, pbin.len));
+	if (result != NULL && PyObject_GetBuffer(result, &pout, PyBUF_WRITABLE) < 0) {
+		Py_CLEAR(result);
+	}
+	if (result != NULL) {
+		crc32c_rolling_update(&self->rolling, pbin.buf, pbin.len, pout.buf);
+		PyBuffer_Release(&pout);
+	}
+	CRC32C_END_LOCKED()
+	PyBuffer_Release(&pbin);
 	return result;
 }
 
-static
-PyObject* crc32c_crc32c(PyObject *module, PyObject *args, PyObject *kwargs) {
+static PyObject *rolling_reset(RollingCRC32CObject *self, PyObject *Py_UNUSED(ignored))
+{
+	CRC32C_BEGIN_LOCKED(self)
+	crc32c_rolling_reset(&self->rolling);
+	CRC32C_END_LOCKED()
+	Py_RETURN_NONE;
+}
+
+static PyObject *rolling_copy(RollingCRC32CObject *self, PyObject *Py_UNUSED(ignored))
+{
+	PyTypeObject *type = Py_TYPE(self);
+	RollingCRC32CObject *copy = (RollingCRC32CObject *)type->tp_alloc(type, 0);
+	int copied;
+	if (copy == NULL) {
+		return NULL;
+	}
+	CRC32C_BEGIN_LOCKED(self)
+	copied = crc32c_rolling_copy(&copy->rolling, &self->rolling);
+	CRC32C_END_LOCKED()
+	if (!copied) {
+		Py_DECREF(copy);
+		return PyErr_NoMemory();
+	}
+	return (PyObject *)copy;
+}
+
+static PyObject *rolling_get_checksum(RollingCRC32CObject *self, void *Py_UNUSED(closure))
+{
+	return PyLong_FromUnsignedLong(self->rolling.reg ^ 0xffffffff);
+}
+
+static PyObject *rolling_get_window(RollingCRC32CObject *self, void *Py_UNUSED(closure))
+{
+	return PyLong_FromUnsignedLongLong(self->rolling.window);
+}
+
+static PyObject *rolling_get_full(RollingCRC32CObject *self, void *Py_UNUSED(closure))
+{
+	return PyBool_FromLong(self->rolling.filled == self->rolling.window);
+}
+
+static PyMethodDef rolling_methods[] = {
+	{"update", (PyCFunction)rolling_update, METH_O, "Add data to the window, dropping the oldest bytes"},
+	{"roll", (PyCFunction)rolling_roll, METH_O, "Add data to the window, returning the checksum of every full window"},
+	{"reset", (PyCFunction)rolling_reset, METH_NOARGS, "Empty the window"},
+	{"copy", (PyCFunction)rolling_copy, METH_NOARGS, "Return a copy of this object"},
+	{NULL, NULL, 0, NULL}
+};
+
+static PyGetSetDef rolling_getset[] = {
+	{"checksum", (getter)rolling_get_checksum, NULL, "The checksum of the bytes in the window", NULL},
+	{"window", (getter)rolling_get_window, NULL, "The window size", NULL},
+	{"full", (getter)rolling_get_full, NULL, "Whether window bytes have been added yet", NULL},
+	{NULL, NULL, NULL, NULL, NULL}
+};
+
+static PyType_Slot rolling_slots[] = {
+	{Py_tp_doc, "Rolling crc32c over the last window bytes of a stream"},
+	{Py_tp_new, rolling_new},
+	{Py_tp_dealloc, rolling_dealloc},
+	{Py_tp_methods, rolling_methods},
+	{Py_tp_getset, rolling_getset},
+	{0, NULL}
+};
+
+static PyType_Spec rolling_spec = {
+	.name = "crc32c.RollingCRC32C",
+	.basicsize = sizeof(RollingCRC32CObject),
+	.flags = Py_TPFLAGS_DEFAULT,
+	.slots = rolling_slots,
+};
+
+typedef struct {
+	PyObject_HEAD
+	uint32_t checksum;
+	uint64_t length;     /* of the data hashed so far */
+	int gil_release_mode;
+	crc_function crc_fn;
+	CRC32CState *state;  /* kept alive by the type, which references the module */
+} CRC32CHashObject;
+
+static struct PyModuleDef crc32c_def;
+
+/* The state of the module that created the given type (or its base) */
+static CRC32CState *get_type_state(PyTypeObject *type)
+{
+	PyObject *module;
+#if PY_VERSION_HEX >= 0x030B0000
+	module = PyType_GetModuleByDef(type, &crc32c_def);
+#elif PY_VERSION_HEX >= 0x03090000
+	for (module = NULL; type && !module; type = type->tp_base) {
+		if (type->tp_flags & Py_TPFLAGS_HEAPTYPE) {
+			module = PyType_GetModule(type);
+			if (module == NULL || PyModule_GetDef(module) != &crc32c_def) {
+				PyErr_Clear();
+				module = NULL;
+			}
+		}
+	}
+	if (module == NULL) {
+		PyErr_SetString(PyExc_TypeError, "crc32c module not found");
+	}
+#else
+	/* Heap types can't be associated to their module before Python 3.9,
+	   so the module is stored as a type attribute instead */
+	module = PyObject_GetAttrString((PyObject *)type, "_crc32c_module");
+	Py_XDECREF(module);  /* still referenced by the type */
+#endif
+	return module ? get_state(module) : NULL;
+}
+
+static inline void hash_update(CRC32CHashObject *self, const unsigned char *data, Py_ssize_t len)
+{
+	int mode = self->gil_release_mode;
+	int release_gil = (mode < 0 && len >= self->state->gil_release_threshold) || mode >= 1;
+	self->checksum = crc32c_compute(self->state, self->crc_fn, self->checksum, (unsigned char *)data, len, release_gil);
+	self->length += (uint64_t)len;
+}
+
+/* Updates the hash with a bytes-like object */
+static int hash_update_object(CRC32CHashObject *self, PyObject *data)
+{
 	Py_buffer pbin;
-	unsigned char *bin_data = NULL;
-	uint32_t crc = 0U, result;
-	int gil_release_mode = -1;
 
-	static char *kwlist[] = {"data", "value", "gil_release_mode", NULL};
+	/* see crc32c_crc32c */
+	if (PyBytes_CheckExact(data)) {
+		hash_update(self, (const unsigned char *)PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data));
+		return 1;
+	}
+	if (PyObject_GetBuffer(data, &pbin, PyBUF_SIMPLE) < 0) {
+		return 0;
+	}
+	hash_update(self, pbin.buf, pbin.len);
+	PyBuffer_Release(&pbin);
+	return 1;
+}
 
-	/* In python 3 we accept only bytes-like objects */
-	const char *format ="y*|Ii:crc32";
+static PyObject *hash_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+	CRC32CHashObject *self;
+	CRC32CState *state;
+	PyObject *data = NULL;
+	int gil_release_mode = -1;
+	int ok;
+	static char *kwlist[] = {"data", "gil_release_mode", NULL};
 
-	crc_function crc_fn = get_state(module)->crc_fn;
-	if (!crc_fn) {
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Oi:CRC32CHash", kwlist, &data, &gil_release_mode))
+		return NULL;
+	state = get_type_state(type);
+	if (state == NULL) {
+		return NULL;
+	}
+	if (!state->crc_fn) {
 		PyErr_SetString(
 		    PyExc_RuntimeError,
 		    "crc32c: software mode disabled and no hardware acceleration found, can't calculate checksum"
@@ -75,38 +1644,243 @@ PyObject* crc32c_crc32c(PyObject *module, PyObject *args, PyObject *kwargs) {
 		return NULL;
 	}
 
-	if (!PyArg_ParseTupleAndKeywords(args, kwargs, format, kwlist, &pbin, &crc, &gil_release_mode) )
+	self = (CRC32CHashObject *)type->tp_alloc(type, 0);
+	if (self == NULL) {
 		return NULL;
+	}
+	self->checksum = 0;
+	self->length = 0;
+	self->gil_release_mode = gil_release_mode;
+	self->crc_fn = state->crc_fn;
+	self->state = state;
+	if (data) {
+		CRC32C_BEGIN_LOCKED(self)
+		ok = hash_update_object(self, data);
+		CRC32C_END_LOCKED()
+		if (!ok) {
+			Py_DECREF(self);
+			return NULL;
+		}
+	}
+	return (PyObject *)self;
+}
 
-	bin_data = pbin.buf;
-#ifndef Py_GIL_DISABLED
-	if ((gil_release_mode < 0 && pbin.len >= MIN_BUFSIZE_FOR_AUTOMATIC_RELEASE) || gil_release_mode >= 1)
-	{
-		Py_BEGIN_ALLOW_THREADS
-		result = crc32c_inline(crc_fn, crc, bin_data, pbin.len);
-		Py_END_ALLOW_THREADS
+static void hash_dealloc(CRC32CHashObject *self)
+{
+	PyTypeObject *type = Py_TYPE(self);
+	type->tp_free((PyObject *)self);
+	Py_DECREF(type);
+}
+
+static PyObject *hash_update_method(CRC32CHashObject *self, PyObject *data)
+{
+	int ok;
+	CRC32C_BEGIN_LOCKED(self)
+	ok = hash_update_object(self, data);
+	CRC32C_END_LOCKED()
+	if (!ok) {
+		return NULL;
 	}
-	else
-#endif
-	{
-		result = crc32c_inline(crc_fn, crc, bin_data, pbin.len);
+	Py_RETURN_NONE;
+}
+
+static PyObject *hash_update_many(CRC32CHashObject *self, PyObject *buffers)
+{
+	PyObject *iterator, *item;
+	int ok = 1;
+
+	iterator = PyObject_GetIter(buffers);
+	if (iterator == NULL) {
+		return NULL;
+	}
+	while (ok && (item = PyIter_Next(iterator)) != NULL) {
+		CRC32C_BEGIN_LOCKED(self)
+		ok = hash_update_object(self, item);
+		CRC32C_END_LOCKED()
+		Py_DECREF(item);
+	}
+	Py_DECREF(iterator);
+	if (!ok || PyErr_Occurred()) {
+		return NULL;
 	}
+	Py_RETURN_NONE;
+}
 
-	PyBuffer_Release(&pbin);
-	return PyLong_FromUnsignedLong(result);
+/* Appends the data hashed by other to that hashed by self */
+static int hash_extend_object(CRC32CHashObject *self, PyObject *other)
+{
+	uint32_t checksum;
+	uint64_t length;
+
+	if (!PyObject_TypeCheck(other, (PyTypeObject *)self->state->hash_type)) {
+		PyErr_Format(PyExc_TypeError, "expected a CRC32CHash, not %.200s", Py_TYPE(other)->tp_name);
+		return 0;
+	}
+	CRC32C_BEGIN_LOCKED(other)
+	checksum = ((CRC32CHashObject *)other)->checksum;
+	length = ((CRC32CHashObject *)other)->length;
+	CRC32C_END_LOCKED()
+	CRC32C_BEGIN_LOCKED(self)
+	self->checksum = crc32c_combine(self->checksum, checksum, length);
+	self->length += length;
+	CRC32C_END_LOCKED()
+	return 1;
 }
 
-static
-PyObject *crc32c_crc32(PyObject *self, PyObject *args, PyObject *kwargs)
+static PyObject *hash_extend(CRC32CHashObject *self, PyObject *other)
 {
-	if (PyErr_WarnEx(PyExc_DeprecationWarning,
-	                 "crc32c.crc32 will be eventually removed, use crc32c.crc32c instead",
-	                 1) == -1) {
+	if (!hash_extend_object(self, other)) {
+		return NULL;
+	}
+	Py_RETURN_NONE;
+}
+
+static PyObject *hash_concat(PyObject *cls, PyObject *hashes)
+{
+	PyObject *iterator, *item, *result;
+	int ok = 1;
+
+	iterator = PyObject_GetIter(hashes);
+	if (iterator == NULL) {
+		return NULL;
+	}
+	result = PyObject_CallObject(cls, NULL);
+	if (result == NULL) {
+		Py_DECREF(iterator);
+		return NULL;
+	}
+	while (ok && (item = PyIter_Next(iterator)) != NULL) {
+		ok = hash_extend_object((CRC32CHashObject *)result, item);
+		Py_DECREF(item);
+	}
+	Py_DECREF(iterator);
+	if (!ok || PyErr_Occurred()) {
+		Py_DECREF(result);
+		return NULL;
+	}
+	return result;
+}
+
+static PyObject *hash_digest(CRC32CHashObject *self, PyObject *Py_UNUSED(ignored))
+{
+	uint32_t checksum = self->checksum;
+	unsigned char digest[4];
+
+	digest[0] = (unsigned char)(checksum >> 24);
+	digest[1] = (unsigned char)(checksum >> 16);
+	digest[2] = (unsigned char)(checksum >> 8);
+	digest[3] = (unsigned char)checksum;
+	return PyBytes_FromStringAndSize((const char *)digest, 4);
+}
+
+static PyObject *hash_hexdigest(CRC32CHashObject *self, PyObject *Py_UNUSED(ignored))
+{
+	static const char hex_digits[] = "0123456789abcdef";
+	uint32_t checksum = self->checksum;
+	char hexdigest[8];
+	int i;
+
+	for (i = 7; i >= 0; i--, checksum >>= 4) {
+		hexdigest[i] = hex_digits[checksum & 0xf];
+	}
+	return PyUnicode_FromStringAndSize(hexdigest, 8);
+}
+
+static PyObject *hash_copy(CRC32CHashObject *self, PyObject *Py_UNUSED(ignored))
+{
+	PyTypeObject *type = Py_TYPE(self);
+	CRC32CHashObject *copy = (CRC32CHashObject *)type->tp_alloc(type, 0);
+	if (copy == NULL) {
 		return NULL;
 	}
-	return crc32c_crc32c(self, args, kwargs);
+	/* checksum and length must come from the same update */
+	CRC32C_BEGIN_LOCKED(self)
+	copy->checksum = self->checksum;
+	copy->length = self->length;
+	CRC32C_END_LOCKED()
+	copy->gil_release_mode = self->gil_release_mode;
+	copy->crc_fn = self->crc_fn;
+	copy->state = self->state;
+	return (PyObject *)copy;
+}
+
+static PyObject *hash_get_checksum(CRC32CHashObject *self, void *Py_UNUSED(closure))
+{
+	return PyLong_FromUnsignedLong(self->checksum);
+}
+
+static PyObject *hash_get_length(CRC32CHashObject *self, void *Py_UNUSED(closure))
+{
+	return PyLong_FromUnsignedLongLong(self->length);
+}
+
+static PyObject *hash_get_digest_size(PyObject *self, void *Py_UNUSED(closure))
+{
+	return PyLong_FromLong(4);
+}
+
+static PyObject *hash_get_block_size(PyObject *self, void *Py_UNUSED(closure))
+{
+	return PyLong_FromLong(1);
+}
+
+static PyObject *hash_get_name(PyObject *self, void *Py_UNUSED(closure))
+{
+	return PyUnicode_FromString("crc32c");
 }
 
+static PyMethodDef hash_methods[] = {
+	{"update", (PyCFunction)hash_update_method, METH_O,
+	 "Update the hash object with the bytes-like object.\n"
+	 "Repeated calls are equivalent to a single call with the concatenation of all the arguments:\n"
+	 "m.update(a); m.update(b) is equivalent to m.update(a+b)."},
+	{"update_many", (PyCFunction)hash_update_many, METH_O,
+	 "Update the hash object with each of the bytes-like objects in an iterable, in order."},
+	{"extend", (PyCFunction)hash_extend, METH_O,
+	 "Update the hash object as if with the data hashed by another CRC32CHash,\n"
+	 "without having to read it again."},
+	{"concat", (PyCFunction)hash_concat, METH_O | METH_CLASS,
+	 "Create a hash object of the concatenation of the data hashed by each CRC32CHash in an iterable."},
+	{"digest", (PyCFunction)hash_digest, METH_NOARGS,
+	 "Return the digest of the data passed to the update() method so far.\n"
+	 "This is a bytes object of size digest_size which may contain bytes in the whole range from 0 to 255."},
+	{"hexdigest", (PyCFunction)hash_hexdigest, METH_NOARGS,
+	 "Like digest() except the digest is returned as a string object of double length,\n"
+	 "containing only hexadecimal digits."},
+	{"copy", (PyCFunction)hash_copy, METH_NOARGS,
+	 "Return a copy (\"clone\") of the hash object. This can be used to efficiently compute\n"
+	 "the digests of data sharing a common initial substring."},
+	{NULL, NULL, 0, NULL}
+};
+
+static PyGetSetDef hash_getset[] = {
+	{"checksum", (getter)hash_get_checksum, NULL, "The checksum calculated so far. Not part of the hashlib interface.", NULL},
+	{"length", (getter)hash_get_length, NULL, "The number of bytes hashed so far. Not part of the hashlib interface.", NULL},
+	{"digest_size", hash_get_digest_size, NULL, "The size of the resulting hash in bytes.", NULL},
+	{"block_size", hash_get_block_size, NULL, "The internal block size of the hash algorithm in bytes.", NULL},
+	{"name", hash_get_name, NULL, "The canonical name of this hash.", NULL},
+	{NULL, NULL, NULL, NULL, NULL}
+};
+
+static PyType_Slot hash_slots[] = {
+	{Py_tp_doc,
+	 "CRC32CHash(data=b\"\", gil_release_mode=-1)\n--\n\n"
+	 "crc32c hash object, following the interface of hashlib hash objects.\n"
+	 "Uses the given GIL release mode on each checksum calculation."},
+	{Py_tp_new, hash_new},
+	{Py_tp_dealloc, hash_dealloc},
+	{Py_tp_methods, hash_methods},
+	{Py_tp_getset, hash_getset},
+	{0, NULL}
+};
+
+static PyType_Spec hash_spec = {
+	.name = "crc32c.CRC32CHash",
+	.basicsize = sizeof(CRC32CHashObject),
+	.flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+	.slots = hash_slots,
+};
+
 /* The different values the SW mode preference can take */
 enum crc32c_sw_mode {
 	UNSPECIFIED,
@@ -133,6 +1907,15 @@ static enum crc32c_sw_mode get_sw_mode(void)
 	return UNSPECIFIED;
 }
 
+static int get_stats_enabled(void)
+{
+	char *stats = getenv("CRC32C_STATS");
+	if (stats == NULL) {
+		return 0;
+	}
+	return !strcmp(stats, "1");
+}
+
 #ifdef CRC32C_CAN_PROBE_HW
 static int get_skip_hw_probe(void)
 {
@@ -145,8 +1928,27 @@ static int get_skip_hw_probe(void)
 #endif
 
 static PyMethodDef CRC32CMethods[] = {
-	{"crc32",   (PyCFunction)crc32c_crc32,   METH_VARARGS | METH_KEYWORDS, "Calculate crc32c incrementally (deprecated)"},
-	{"crc32c",  (PyCFunction)crc32c_crc32c,  METH_VARARGS | METH_KEYWORDS, "Calculate crc32c incrementally"},
+	{"crc32",   (PyCFunction)(void(*)(void))crc32c_crc32,   METH_FASTCALL | METH_KEYWORDS, "Calculate crc32c incrementally (deprecated)"},
+	{"crc32c",  (PyCFunction)(void(*)(void))crc32c_crc32c,  METH_FASTCALL | METH_KEYWORDS, "Calculate crc32c incrementally"},
+	{"available_backends",  crc32c_available_backends,  METH_NOARGS, "List the names of the available backends, slowest first"},
+	{"get_backend",  crc32c_get_backend,  METH_NOARGS, "Get the name of the backend in use"},
+	{"set_backend",  crc32c_set_backend,  METH_O, "Set the backend to use by name"},
+	{"get_gil_release_threshold",  crc32c_get_gil_release_threshold,  METH_NOARGS, "Get the minimum buffer size for which the GIL is automatically released"},
+	{"set_gil_release_threshold",  crc32c_set_gil_release_threshold,  METH_O, "Set the minimum buffer size for which the GIL is automatically released"},
+	{"crc32c_many",  (PyCFunction)crc32c_crc32c_many,  METH_VARARGS | METH_KEYWORDS, "Calculate the crc32c of many buffers"},
+	{"crc32c_strided",  (PyCFunction)crc32c_crc32c_strided,  METH_VARARGS | METH_KEYWORDS, "Calculate the crc32c of fixed-size records"},
+	{"crc32c_parallel",  (PyCFunction)crc32c_crc32c_parallel,  METH_VARARGS | METH_KEYWORDS, "Calculate crc32c using multiple threads"},
+	{"copy_crc32c",  (PyCFunction)crc32c_copy_crc32c,  METH_VARARGS | METH_KEYWORDS, "Copy a buffer while calculating its crc32c"},
+	{"crc32c_file",  (PyCFunction)crc32c_crc32c_file,  METH_VARARGS | METH_KEYWORDS, "Calculate the crc32c of a file's contents"},
+	{"crc32c_combine",  (PyCFunction)crc32c_crc32c_combine,  METH_VARARGS | METH_KEYWORDS, "Combine the crc32c of two consecutive blocks"},
+	{"crc32c_combine_many",  (PyCFunction)crc32c_crc32c_combine_many,  METH_O, "Combine the crc32c of many consecutive blocks"},
+	{"scan_masked_records",  (PyCFunction)crc32c_scan_masked_records,  METH_VARARGS | METH_KEYWORDS, "Find and verify the masked-crc32c records in a buffer"},
+	{"frame_records",  (PyCFunction)crc32c_frame_records,  METH_VARARGS | METH_KEYWORDS, "Frame payloads as masked-crc32c records"},
+	{"mask_crc32c",  crc32c_mask_crc32c,  METH_O, "Mask a crc32c value as done in TFRecord files"},
+	{"unmask_crc32c",  crc32c_unmask_crc32c,  METH_O, "Unmask a masked crc32c value"},
+	{"stats",  crc32c_stats,  METH_NOARGS, "Get the usage statistics collected so far"},
+	{"reset_stats",  crc32c_reset_stats,  METH_NOARGS, "Reset the usage statistics"},
+	{"enable_stats",  (PyCFunction)crc32c_enable_stats,  METH_VARARGS | METH_KEYWORDS, "Enable or disable the collection of usage statistics"},
 	{NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -174,6 +1976,29 @@ static const char *no_hw_or_sw_error_msg = "\n\n"
 " * 'force': use software implementation regardless of hardware support.\n"
 " * 'none': fail if no hardware support is found.\n";
 
+static int crc32c_mod_traverse(PyObject *module, visitproc visit, void *arg)
+{
+	CRC32CState *state = get_state(module);
+	if (state) {
+		Py_VISIT(state->hash_type);
+	}
+	return 0;
+}
+
+static int crc32c_mod_clear(PyObject *module)
+{
+	CRC32CState *state = get_state(module);
+	if (state) {
+		Py_CLEAR(state->hash_type);
+	}
+	return 0;
+}
+
+static void crc32c_mod_free(void *module)
+{
+	crc32c_mod_clear((PyObject *)module);
+}
+
 static struct PyModuleDef crc32c_def = {
 	.m_base = PyModuleDef_HEAD_INIT,
 	.m_name = "_crc32c",
@@ -181,9 +2006,9 @@ static struct PyModuleDef crc32c_def = {
 	.m_size = sizeof(CRC32CState),
 	.m_methods = CRC32CMethods,
 	.m_slots = CRC32CSlots,
-	.m_traverse = NULL,
-	.m_clear = NULL,
-	.m_free = NULL,
+	.m_traverse = crc32c_mod_traverse,
+	.m_clear = crc32c_mod_clear,
+	.m_free = crc32c_mod_free,
 };
 
 PyMODINIT_FUNC PyInit__crc32c(void)
@@ -191,38 +2016,93 @@ PyMODINIT_FUNC PyInit__crc32c(void)
 	return PyModuleDef_Init(&crc32c_def);
 }
 
+/* The fastest backend supported by the given hardware features, if any */
+static const CRC32CBackend *get_hw_backend(int hw_features)
+{
+	const CRC32CBackend *backend = NULL;
+	size_t i;
+
+	for (i = 0; i < N_BACKENDS; i++) {
+		if (backends[i].features && (backends[i].features & hw_features) == backends[i].features) {
+			backend = &backends[i];
+		}
+	}
+	return backend;
+}
+
+/* The fastest software backend */
+static const CRC32CBackend *get_sw_backend(void)
+{
+	const CRC32CBackend *backend = NULL;
+	size_t i;
+
+	for (i = 0; i < N_BACKENDS; i++) {
+		if (!backends[i].features) {
+			backend = &backends[i];
+		}
+	}
+	return backend;
+}
+
+static int probe_hw_features(void)
+{
+#if defined(IS_INTEL)
+	return _crc32c_intel_probe();
+#elif defined(IS_ARM) && (defined(__linux__) || defined(linux))
+	return _crc32c_arm64_probe() ? CRC32C_ARM64_CRC : 0;
+#else
+	return 0;
+#endif
+}
+
+/* The CPU doesn't change during the lifetime of the process,
+   so the probe result is shared by all interpreters.
+   Concurrent first calls might probe more than once,
+   but they all store the same value */
+#if defined(__GNUC__) || defined(__clang__)
+# define HW_FEATURES_LOAD(var) __atomic_load_n(&(var), __ATOMIC_RELAXED)
+# define HW_FEATURES_STORE(var, value) __atomic_store_n(&(var), (value), __ATOMIC_RELAXED)
+#else
+# define HW_FEATURES_LOAD(var) (var)
+# define HW_FEATURES_STORE(var, value) ((var) = (value))
+#endif
+static volatile int cached_hw_features = -1;
+
+static int get_hw_features(void)
+{
+	int features = HW_FEATURES_LOAD(cached_hw_features);
+	if (features < 0) {
+		features = probe_hw_features();
+		HW_FEATURES_STORE(cached_hw_features, features);
+	}
+	return features;
+}
+
 static int crc32c_mod_exec(PyObject *module) {
-	PyObject *hardware_based;
+	PyObject *hardware_based, *backend_name, *rolling_type, *hash_type;
 	enum crc32c_sw_mode sw_mode;
 	const uint32_t n = 1;
-#ifdef CRC32C_CAN_PROBE_HW
-	int skip_hw_probe;
-#endif
+	const CRC32CBackend *backend = NULL, *hw_backend = NULL;
+	CRC32CState *state = get_state(module);
 
 	sw_mode = get_sw_mode();
+	state->hw_features = 0;
+	state->sw_allowed = sw_mode != NONE;
+	state->stats_enabled = get_stats_enabled();
 #ifdef CRC32C_CAN_PROBE_HW
-	skip_hw_probe = get_skip_hw_probe();
+	if (!get_skip_hw_probe()) {
+		state->hw_features = get_hw_features();
+		hw_backend = get_hw_backend(state->hw_features);
+	}
 #endif
-	crc_function crc_fn = NULL;
 	if (sw_mode == FORCE) {
-		crc_fn = _crc32c_sw_slicing_by_8;
-		hardware_based = Py_False;
+		backend = get_sw_backend();
 	}
-#if defined(IS_INTEL)
-	else if (!skip_hw_probe && _crc32c_intel_probe()) {
-		crc_fn = _crc32c_hw_adler;
-		crc32c_init_hw_adler();
-		hardware_based = Py_True;
-	}
-#elif defined(IS_ARM) && (defined(__linux__) || defined(linux))
-	else if (!skip_hw_probe && _crc32c_arm64_probe()) {
-		crc_fn = _crc32c_hw_arm64;
-		hardware_based = Py_True;
+	else if (hw_backend) {
+		backend = hw_backend;
 	}
-#endif
 	else if (sw_mode == UNSPECIFIED || sw_mode == AUTO) {
-		crc_fn = _crc32c_sw_slicing_by_8;
-		hardware_based = Py_False;
+		backend = get_sw_backend();
 	}
 	else if (sw_mode == NONE) {
 		if (PyErr_WarnEx(PyExc_RuntimeWarning,
@@ -230,18 +2110,73 @@ static int crc32c_mod_exec(PyObject *module) {
 		                 1) == -1) {
 			return -1;
 		}
-		hardware_based = Py_False;
 	}
 
 	is_big_endian = (*(const char *)(&n) == 0);
 
+	set_backend(state, backend);
+	state->gil_release_threshold = MIN_BUFSIZE_FOR_AUTOMATIC_RELEASE;
+
+	hardware_based = backend && backend->features ? Py_True : Py_False;
 	Py_INCREF(hardware_based);
-	get_state(module)->crc_fn = crc_fn;
 	if (PyModule_AddObject(module, "hardware_based", hardware_based) < 0) {
+		Py_DECREF(hardware_based);
+		return -1;
+	}
+	if (backend) {
+		backend_name = PyUnicode_FromString(backend->name);
+		if (backend_name == NULL) {
+			return -1;
+		}
+	}
+	else {
+		backend_name = Py_None;
+		Py_INCREF(backend_name);
+	}
+	if (PyModule_AddObject(module, "backend", backend_name) < 0) {
+		Py_DECREF(backend_name);
 		return -1;
 	}
 	if (PyModule_AddIntConstant(module, "big_endian", is_big_endian) < 0) {
 		return -1;
 	}
+
+	rolling_type = PyType_FromSpec(&rolling_spec);
+	if (rolling_type == NULL) {
+		return -1;
+	}
+	if (PyModule_AddObject(module, "RollingCRC32C", rolling_type) < 0) {
+		Py_DECREF(rolling_type);
+		return -1;
+	}
+
+#if PY_VERSION_HEX >= 0x03090000
+	hash_type = PyType_FromModuleAndSpec(module, &hash_spec, NULL);
+	if (hash_type == NULL) {
+		return -1;
+	}
+#else
+	hash_type = PyType_FromSpec(&hash_spec);
+	if (hash_type == NULL) {
+		return -1;
+	}
+	if (PyObject_SetAttrString(hash_type, "_crc32c_module", module) < 0) {
+		Py_DECREF(hash_type);
+		return -1;
+	}
+#endif
+	/* hashlib-style constructor, also making this module usable as hmac's digestmod */
+	Py_INCREF(hash_type);
+	if (PyModule_AddObject(module, "new", hash_type) < 0) {
+		Py_DECREF(hash_type);
+		Py_DECREF(hash_type);
+		return -1;
+	}
+	Py_INCREF(hash_type);
+	state->hash_type = hash_type;
+	if (PyModule_AddObject(module, "CRC32CHash", hash_type) < 0) {
+		Py_DECREF(hash_type);
+		return -1;
+	}
 	return 0;
 }
@@ -25,6 +25,9 @@
 #ifndef _CHECKARM_H_
 #define _CHECKARM_H_
 
+/* CPU features reported by get_hw_features on ARM */
+#define CRC32C_ARM64_CRC 0x1  /* crc32c instructions */
+
 int _crc32c_arm64_probe(void);
 
 #endif
\ No newline at end of file
@@ -27,14 +27,48 @@
 
 #if defined(IS_INTEL)
 
+#include "checksse42.h"
+
+/* Translates the relevant CPUID/XGETBV bits into CRC32C_INTEL_* flags */
+static int _crc32c_intel_features(unsigned int max_leaf, unsigned int ecx1, unsigned int ebx7,
+                                  unsigned int ecx7, unsigned long long xcr0)
+{
+	int features = 0;
+	if (!(ecx1 & (1 << 20))) {
+		return 0;
+	}
+	features |= CRC32C_INTEL_SSE42;
+	/* PCLMULQDQ + SSE4.1 */
+	if ((ecx1 & (1 << 1)) && (ecx1 & (1 << 19))) {
+		features |= CRC32C_INTEL_PCLMUL;
+	}
+	/* AVX2 + AVX512F + VPCLMULQDQ, and the OS saving the ZMM state */
+	if ((features & CRC32C_INTEL_PCLMUL) && max_leaf >= 7 && (ecx1 & (1 << 27)) &&
+	    (ebx7 & (1 << 5)) && (ebx7 & (1 << 16)) && (ecx7 & (1 << 10)) &&
+	    (xcr0 & 0xe6) == 0xe6) {
+		features |= CRC32C_INTEL_VPCLMUL;
+	}
+	return features;
+}
+
 #if defined(_MSC_VER)
 #include <intrin.h>
 
 int _crc32c_intel_probe(void)
 {
-	int info[4];
+	int info[4], info7[4] = {0, 0, 0, 0};
+	unsigned int max_leaf;
+	unsigned long long xcr0 = 0;
+	__cpuid(info, 0);
+	max_leaf = (unsigned int)info[0];
 	__cpuid(info, 1);
-	return (info[2] & (1 << 20)) != 0;
+	if (max_leaf >= 7) {
+		__cpuidex(info7, 7, 0);
+	}
+	if (info[2] & (1 << 27)) {
+		xcr0 = _xgetbv(0);
+	}
+	return _crc32c_intel_features(max_leaf, info[2], info7[1], info7[2], xcr0);
 }
 
 #elif defined(__GNUC__)
@@ -43,8 +77,18 @@ int _crc32c_intel_probe(void)
 int _crc32c_intel_probe(void)
 {
 	unsigned int eax, ebx, ecx = 0, edx;
+	unsigned int max_leaf, ecx1, ebx7 = 0, ecx7 = 0, xcr0_lo = 0, xcr0_hi = 0;
+	max_leaf = __get_cpuid_max(0, NULL);
 	__get_cpuid(1, &eax, &ebx, &ecx, &edx);
-	return (ecx & (1 << 20)) != 0;
+	ecx1 = ecx;
+	if (max_leaf >= 7) {
+		__cpuid_count(7, 0, eax, ebx7, ecx7, edx);
+	}
+	if (ecx1 & (1 << 27)) {
+		__asm__ ("xgetbv" : "=a"(xcr0_lo), "=d"(xcr0_hi) : "c"(0));
+	}
+	return _crc32c_intel_features(max_leaf, ecx1, ebx7, ecx7,
+	                              ((unsigned long long)xcr0_hi << 32) | xcr0_lo);
 }
 
 #else
@@ -59,7 +103,7 @@ int _crc32c_intel_probe(void) {
 		: // inputs
 		: "eax", "ebx", "ecx", "edx"); // clobber
 
-	return (ecx & (1 << 20)) != 0;
+	return _crc32c_intel_features(0, ecx, 0, 0, 0);
 }
 #endif // defined(_MSC_VER)
 
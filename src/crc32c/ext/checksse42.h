@@ -25,6 +25,11 @@
 #ifndef _CHECKSSE42_H_
 #define _CHECKSSE42_H_
 
+/* CPU features reported by _crc32c_intel_probe */
+#define CRC32C_INTEL_SSE42   0x1  /* crc32 instruction */
+#define CRC32C_INTEL_PCLMUL  0x2  /* 128-bit carry-less multiplication */
+#define CRC32C_INTEL_VPCLMUL 0x4  /* AVX-512 carry-less multiplication */
+
 int _crc32c_intel_probe(void);
 
 #endif
@@ -66,6 +66,14 @@
 # undef CRC32C_IS_64_BITS
 #endif
 
+/* Whether the compiler can target AVX-512 VPCLMULQDQ instructions */
+#if defined(IS_INTEL) && defined(CRC32C_IS_64_BITS) && \
+    ((defined(__clang__) && __clang_major__ >= 6) || \
+     (defined(__GNUC__) && !defined(__clang__) && __GNUC__ >= 8) || \
+     (defined(_MSC_VER) && _MSC_VER >= 1920))
+# define CRC32C_HAVE_VPCLMUL
+#endif
+
 /* uint64_t / uint32_t / uint16_t definitions */
 #if !defined(_MSC_VER) || (MSC_VER >= 1800)
 # include <stdint.h>
@@ -97,6 +105,10 @@
 /* crc32c function signature */
 typedef uint32_t (* crc_function)(uint32_t crc, unsigned const char *data, unsigned long length);
 
+/* crc32c over fixed-size records function signature */
+typedef void (* crc_records_function)(const unsigned char *data, uint64_t record_size, uint64_t stride,
+                                      uint64_t count, uint32_t *crcs);
+
 /* Are we big endian? */
 extern int is_big_endian;
 
@@ -28,9 +28,67 @@
 
 #include "common.h"
 
-void crc32c_init_hw_adler(void);
 uint32_t _crc32c_hw_arm64(uint32_t crc, const unsigned char* data, unsigned long length);
 uint32_t _crc32c_hw_adler(uint32_t crc, const unsigned char* data, unsigned long length);
+uint32_t _crc32c_hw_pclmul(uint32_t crc, const unsigned char* data, unsigned long length);
+uint32_t _crc32c_hw_vpclmul(uint32_t crc, const unsigned char* data, unsigned long length);
 uint32_t _crc32c_sw_slicing_by_8(uint32_t crc, const unsigned char *data, unsigned long length);
+uint32_t _crc32c_sw_slicing_by_16(uint32_t crc, const unsigned char *data, unsigned long length);
+uint32_t _crc32c_sw_multi(uint32_t crc, const unsigned char *data, unsigned long length);
+void _crc32c_hw_adler_records(const unsigned char *data, uint64_t record_size, uint64_t stride,
+                              uint64_t count, uint32_t *crcs);
+
+/* slicing-by-8 tables, see crc32c_sw.c */
+extern const uint32_t crc_tableil8_o32[256];
+extern const uint32_t crc_tableil8_o40[256];
+extern const uint32_t crc_tableil8_o48[256];
+extern const uint32_t crc_tableil8_o56[256];
+extern const uint32_t crc_tableil8_o64[256];
+extern const uint32_t crc_tableil8_o72[256];
+extern const uint32_t crc_tableil8_o80[256];
+extern const uint32_t crc_tableil8_o88[256];
+
+/* crc combination, see crc32c_combine.c */
+uint32_t crc32c_multmodp(uint32_t a, uint32_t b);
+uint32_t crc32c_x8nmodp(uint64_t n);
+uint32_t crc32c_combine_op(uint32_t crc1, uint32_t crc2, uint32_t op);
+uint32_t crc32c_combine(uint32_t crc1, uint32_t crc2, uint64_t len2);
+
+/* multi-threaded calculation and platform utilities, see crc32c_parallel.c */
+int crc32c_cpu_count(void);
+uint64_t crc32c_monotonic_ns(void);
+uint32_t crc32c_parallel(crc_function crc_fn, uint32_t crc, const unsigned char *data, uint64_t length,
+                         unsigned int threads, uint64_t min_chunk_size);
+
+/* checksumming of files, see crc32c_file.c */
+#if defined(_WIN32)
+# include <wchar.h>
+typedef wchar_t crc32c_path_char;
+#else
+typedef char crc32c_path_char;
+#endif
+#define CRC32C_TO_EOF UINT64_MAX
+/* these return 0 on success, or an errno value on failure,
+   and set nbytes to the number of bytes checksummed */
+int crc32c_fd(crc_function crc_fn, int fd, uint64_t offset, uint64_t length, uint32_t *crc, uint64_t *nbytes);
+int crc32c_path(crc_function crc_fn, const crc32c_path_char *path, uint64_t offset, uint64_t length, uint32_t *crc,
+                uint64_t *nbytes);
+
+/* rolling crc over a fixed-size window, see crc32c_rolling.c */
+struct crc32c_rolling {
+	uint64_t window;
+	unsigned char *ring;  /* the last window bytes, oldest at pos */
+	uint64_t pos;
+	uint64_t filled;      /* bytes in ring, up to window */
+	uint32_t reg;         /* crc register of the bytes in ring */
+	uint32_t k;
+	uint32_t out_table[256];
+};
+int crc32c_rolling_init(struct crc32c_rolling *rolling, uint64_t window);
+int crc32c_rolling_copy(struct crc32c_rolling *dst, const struct crc32c_rolling *src);
+void crc32c_rolling_free(struct crc32c_rolling *rolling);
+void crc32c_rolling_reset(struct crc32c_rolling *rolling);
+uint64_t crc32c_rolling_count(const struct crc32c_rolling *rolling, uint64_t length);
+void crc32c_rolling_update(struct crc32c_rolling *rolling, const unsigned char *data, uint64_t length, uint32_t *crcs);
 
 #endif
@@ -68,6 +68,10 @@
 /* CRC-32C (iSCSI) polynomial in reversed bit order. */
 #define POLY 0x82f63b78
 
+/* The following code generated the crc32c_long and crc32c_short tables below,
+   calling crc32c_zeros ( crc32c_long, LONG ) and crc32c_zeros ( crc32c_short, SHORT ).
+   It is kept for reference, but not compiled. */
+#if 0
 /* Multiply a matrix times a vector over the Galois field of two elements,
    GF(2).  Each element is a bit in an unsigned integer.  mat must have at
    least as many entries as the power of two for most significant one bit in
@@ -153,10 +157,10 @@ static void crc32c_zeros ( uint32_t zeros[][256], size_t len )
                 zeros[3][n] = gf2_matrix_times ( op, n << 24 );
         }
 }
-
+#endif
 
 /* Apply the zeros operator table to crc. */
-static CRC32C_INLINE uint32_t crc32c_shift ( uint32_t zeros[][256], uint32_t crc )
+static CRC32C_INLINE uint32_t crc32c_shift ( const uint32_t zeros[][256], uint32_t crc )
 {
         return zeros[0][crc & 0xff] ^ zeros[1][ ( crc >> 8 ) & 0xff] ^
                zeros[2][ ( crc >> 16 ) & 0xff] ^ zeros[3][crc >> 24];
@@ -173,15 +177,285 @@ static CRC32C_INLINE uint32_t crc32c_shift ( uint32_t zeros[][256], uint32_t crc
 #define SHORTx2 "512"
 
 /* Tables for hardware crc that shift a crc by LONG and SHORT zeros. */
-static uint32_t crc32c_long[4][256];
-static uint32_t crc32c_short[4][256];
-
-/* Initialize tables for shifting crcs. */
-void crc32c_init_hw_adler( void )
+static const uint32_t crc32c_long[4][256] =
 {
-        crc32c_zeros ( crc32c_long, LONG );
-        crc32c_zeros ( crc32c_short, SHORT );
-}
+ {
+  0x00000000, 0xE040E0AC, 0xC56DB7A9, 0x252D5705, 0x8F3719A3, 0x6F77F90F, 0x4A5AAE0A, 0xAA1A4EA6,
+  0x1B8245B7, 0xFBC2A51B, 0xDEEFF21E, 0x3EAF12B2, 0x94B55C14, 0x74F5BCB8, 0x51D8EBBD, 0xB1980B11,
+  0x37048B6E, 0xD7446BC2, 0xF2693CC7, 0x1229DC6B, 0xB83392CD, 0x58737261, 0x7D5E2564, 0x9D1EC5C8,
+  0x2C86CED9, 0xCCC62E75, 0xE9EB7970, 0x09AB99DC, 0xA3B1D77A, 0x43F137D6, 0x66DC60D3, 0x869C807F,
+  0x6E0916DC, 0x8E49F670, 0xAB64A175, 0x4B2441D9, 0xE13E0F7F, 0x017EEFD3, 0x2453B8D6, 0xC413587A,
+  0x758B536B, 0x95CBB3C7, 0xB0E6E4C2, 0x50A6046E, 0xFABC4AC8, 0x1AFCAA64, 0x3FD1FD61, 0xDF911DCD,
+  0x590D9DB2, 0xB94D7D1E, 0x9C602A1B, 0x7C20CAB7, 0xD63A8411, 0x367A64BD, 0x135733B8, 0xF317D314,
+  0x428FD805, 0xA2CF38A9, 0x87E26FAC, 0x67A28F00, 0xCDB8C1A6, 0x2DF8210A, 0x08D5760F, 0xE89596A3,
+  0xDC122DB8, 0x3C52CD14, 0x197F9A11, 0xF93F7ABD, 0x5325341B, 0xB365D4B7, 0x964883B2, 0x7608631E,
+  0xC790680F, 0x27D088A3, 0x02FDDFA6, 0xE2BD3F0A, 0x48A771AC, 0xA8E79100, 0x8DCAC605, 0x6D8A26A9,
+  0xEB16A6D6, 0x0B56467A, 0x2E7B117F, 0xCE3BF1D3, 0x6421BF75, 0x84615FD9, 0xA14C08DC, 0x410CE870,
+  0xF094E361, 0x10D403CD, 0x35F954C8, 0xD5B9B464, 0x7FA3FAC2, 0x9FE31A6E, 0xBACE4D6B, 0x5A8EADC7,
+  0xB21B3B64, 0x525BDBC8, 0x77768CCD, 0x97366C61, 0x3D2C22C7, 0xDD6CC26B, 0xF841956E, 0x180175C2,
+  0xA9997ED3, 0x49D99E7F, 0x6CF4C97A, 0x8CB429D6, 0x26AE6770, 0xC6EE87DC, 0xE3C3D0D9, 0x03833075,
+  0x851FB00A, 0x655F50A6, 0x407207A3, 0xA032E70F, 0x0A28A9A9, 0xEA684905, 0xCF451E00, 0x2F05FEAC,
+  0x9E9DF5BD, 0x7EDD1511, 0x5BF04214, 0xBBB0A2B8, 0x11AAEC1E, 0xF1EA0CB2, 0xD4C75BB7, 0x3487BB1B,
+  0xBDC82D81, 0x5D88CD2D, 0x78A59A28, 0x98E57A84, 0x32FF3422, 0xD2BFD48E, 0xF792838B, 0x17D26327,
+  0xA64A6836, 0x460A889A, 0x6327DF9F, 0x83673F33, 0x297D7195, 0xC93D9139, 0xEC10C63C, 0x0C502690,
+  0x8ACCA6EF, 0x6A8C4643, 0x4FA11146, 0xAFE1F1EA, 0x05FBBF4C, 0xE5BB5FE0, 0xC09608E5, 0x20D6E849,
+  0x914EE358, 0x710E03F4, 0x542354F1, 0xB463B45D, 0x1E79FAFB, 0xFE391A57, 0xDB144D52, 0x3B54ADFE,
+  0xD3C13B5D, 0x3381DBF1, 0x16AC8CF4, 0xF6EC6C58, 0x5CF622FE, 0xBCB6C252, 0x999B9557, 0x79DB75FB,
+  0xC8437EEA, 0x28039E46, 0x0D2EC943, 0xED6E29EF, 0x47746749, 0xA73487E5, 0x8219D0E0, 0x6259304C,
+  0xE4C5B033, 0x0485509F, 0x21A8079A, 0xC1E8E736, 0x6BF2A990, 0x8BB2493C, 0xAE9F1E39, 0x4EDFFE95,
+  0xFF47F584, 0x1F071528, 0x3A2A422D, 0xDA6AA281, 0x7070EC27, 0x90300C8B, 0xB51D5B8E, 0x555DBB22,
+  0x61DA0039, 0x819AE095, 0xA4B7B790, 0x44F7573C, 0xEEED199A, 0x0EADF936, 0x2B80AE33, 0xCBC04E9F,
+  0x7A58458E, 0x9A18A522, 0xBF35F227, 0x5F75128B, 0xF56F5C2D, 0x152FBC81, 0x3002EB84, 0xD0420B28,
+  0x56DE8B57, 0xB69E6BFB, 0x93B33CFE, 0x73F3DC52, 0xD9E992F4, 0x39A97258, 0x1C84255D, 0xFCC4C5F1,
+  0x4D5CCEE0, 0xAD1C2E4C, 0x88317949, 0x687199E5, 0xC26BD743, 0x222B37EF, 0x070660EA, 0xE7468046,
+  0x0FD316E5, 0xEF93F649, 0xCABEA14C, 0x2AFE41E0, 0x80E40F46, 0x60A4EFEA, 0x4589B8EF, 0xA5C95843,
+  0x14515352, 0xF411B3FE, 0xD13CE4FB, 0x317C0457, 0x9B664AF1, 0x7B26AA5D, 0x5E0BFD58, 0xBE4B1DF4,
+  0x38D79D8B, 0xD8977D27, 0xFDBA2A22, 0x1DFACA8E, 0xB7E08428, 0x57A06484, 0x728D3381, 0x92CDD32D,
+  0x2355D83C, 0xC3153890, 0xE6386F95, 0x06788F39, 0xAC62C19F, 0x4C222133, 0x690F7636, 0x894F969A
+ },
+ {
+  0x00000000, 0x7E7C2DF3, 0xFCF85BE6, 0x82847615, 0xFC1CC13D, 0x8260ECCE, 0x00E49ADB, 0x7E98B728,
+  0xFDD5F48B, 0x83A9D978, 0x012DAF6D, 0x7F51829E, 0x01C935B6, 0x7FB51845, 0xFD316E50, 0x834D43A3,
+  0xFE479FE7, 0x803BB214, 0x02BFC401, 0x7CC3E9F2, 0x025B5EDA, 0x7C277329, 0xFEA3053C, 0x80DF28CF,
+  0x03926B6C, 0x7DEE469F, 0xFF6A308A, 0x81161D79, 0xFF8EAA51, 0x81F287A2, 0x0376F1B7, 0x7D0ADC44,
+  0xF963493F, 0x871F64CC, 0x059B12D9, 0x7BE73F2A, 0x057F8802, 0x7B03A5F1, 0xF987D3E4, 0x87FBFE17,
+  0x04B6BDB4, 0x7ACA9047, 0xF84EE652, 0x8632CBA1, 0xF8AA7C89, 0x86D6517A, 0x0452276F, 0x7A2E0A9C,
+  0x0724D6D8, 0x7958FB2B, 0xFBDC8D3E, 0x85A0A0CD, 0xFB3817E5, 0x85443A16, 0x07C04C03, 0x79BC61F0,
+  0xFAF12253, 0x848D0FA0, 0x060979B5, 0x78755446, 0x06EDE36E, 0x7891CE9D, 0xFA15B888, 0x8469957B,
+  0xF72AE48F, 0x8956C97C, 0x0BD2BF69, 0x75AE929A, 0x0B3625B2, 0x754A0841, 0xF7CE7E54, 0x89B253A7,
+  0x0AFF1004, 0x74833DF7, 0xF6074BE2, 0x887B6611, 0xF6E3D139, 0x889FFCCA, 0x0A1B8ADF, 0x7467A72C,
+  0x096D7B68, 0x7711569B, 0xF595208E, 0x8BE90D7D, 0xF571BA55, 0x8B0D97A6, 0x0989E1B3, 0x77F5CC40,
+  0xF4B88FE3, 0x8AC4A210, 0x0840D405, 0x763CF9F6, 0x08A44EDE, 0x76D8632D, 0xF45C1538, 0x8A2038CB,
+  0x0E49ADB0, 0x70358043, 0xF2B1F656, 0x8CCDDBA5, 0xF2556C8D, 0x8C29417E, 0x0EAD376B, 0x70D11A98,
+  0xF39C593B, 0x8DE074C8, 0x0F6402DD, 0x71182F2E, 0x0F809806, 0x71FCB5F5, 0xF378C3E0, 0x8D04EE13,
+  0xF00E3257, 0x8E721FA4, 0x0CF669B1, 0x728A4442, 0x0C12F36A, 0x726EDE99, 0xF0EAA88C, 0x8E96857F,
+  0x0DDBC6DC, 0x73A7EB2F, 0xF1239D3A, 0x8F5FB0C9, 0xF1C707E1, 0x8FBB2A12, 0x0D3F5C07, 0x734371F4,
+  0xEBB9BFEF, 0x95C5921C, 0x1741E409, 0x693DC9FA, 0x17A57ED2, 0x69D95321, 0xEB5D2534, 0x952108C7,
+  0x166C4B64, 0x68106697, 0xEA941082, 0x94E83D71, 0xEA708A59, 0x940CA7AA, 0x1688D1BF, 0x68F4FC4C,
+  0x15FE2008, 0x6B820DFB, 0xE9067BEE, 0x977A561D, 0xE9E2E135, 0x979ECCC6, 0x151ABAD3, 0x6B669720,
+  0xE82BD483, 0x9657F970, 0x14D38F65, 0x6AAFA296, 0x143715BE, 0x6A4B384D, 0xE8CF4E58, 0x96B363AB,
+  0x12DAF6D0, 0x6CA6DB23, 0xEE22AD36, 0x905E80C5, 0xEEC637ED, 0x90BA1A1E, 0x123E6C0B, 0x6C4241F8,
+  0xEF0F025B, 0x91732FA8, 0x13F759BD, 0x6D8B744E, 0x1313C366, 0x6D6FEE95, 0xEFEB9880, 0x9197B573,
+  0xEC9D6937, 0x92E144C4, 0x106532D1, 0x6E191F22, 0x1081A80A, 0x6EFD85F9, 0xEC79F3EC, 0x9205DE1F,
+  0x11489DBC, 0x6F34B04F, 0xEDB0C65A, 0x93CCEBA9, 0xED545C81, 0x93287172, 0x11AC0767, 0x6FD02A94,
+  0x1C935B60, 0x62EF7693, 0xE06B0086, 0x9E172D75, 0xE08F9A5D, 0x9EF3B7AE, 0x1C77C1BB, 0x620BEC48,
+  0xE146AFEB, 0x9F3A8218, 0x1DBEF40D, 0x63C2D9FE, 0x1D5A6ED6, 0x63264325, 0xE1A23530, 0x9FDE18C3,
+  0xE2D4C487, 0x9CA8E974, 0x1E2C9F61, 0x6050B292, 0x1EC805BA, 0x60B42849, 0xE2305E5C, 0x9C4C73AF,
+  0x1F01300C, 0x617D1DFF, 0xE3F96BEA, 0x9D854619, 0xE31DF131, 0x9D61DCC2, 0x1FE5AAD7, 0x61998724,
+  0xE5F0125F, 0x9B8C3FAC, 0x190849B9, 0x6774644A, 0x19ECD362, 0x6790FE91, 0xE5148884, 0x9B68A577,
+  0x1825E6D4, 0x6659CB27, 0xE4DDBD32, 0x9AA190C1, 0xE43927E9, 0x9A450A1A, 0x18C17C0F, 0x66BD51FC,
+  0x1BB78DB8, 0x65CBA04B, 0xE74FD65E, 0x9933FBAD, 0xE7AB4C85, 0x99D76176, 0x1B531763, 0x652F3A90,
+  0xE6627933, 0x981E54C0, 0x1A9A22D5, 0x64E60F26, 0x1A7EB80E, 0x640295FD, 0xE686E3E8, 0x98FACE1B
+ },
+ {
+  0x00000000, 0xD29F092F, 0xA0D264AF, 0x724D6D80, 0x4448BFAF, 0x96D7B680, 0xE49ADB00, 0x3605D22F,
+  0x88917F5E, 0x5A0E7671, 0x28431BF1, 0xFADC12DE, 0xCCD9C0F1, 0x1E46C9DE, 0x6C0BA45E, 0xBE94AD71,
+  0x14CE884D, 0xC6518162, 0xB41CECE2, 0x6683E5CD, 0x508637E2, 0x82193ECD, 0xF054534D, 0x22CB5A62,
+  0x9C5FF713, 0x4EC0FE3C, 0x3C8D93BC, 0xEE129A93, 0xD81748BC, 0x0A884193, 0x78C52C13, 0xAA5A253C,
+  0x299D109A, 0xFB0219B5, 0x894F7435, 0x5BD07D1A, 0x6DD5AF35, 0xBF4AA61A, 0xCD07CB9A, 0x1F98C2B5,
+  0xA10C6FC4, 0x739366EB, 0x01DE0B6B, 0xD3410244, 0xE544D06B, 0x37DBD944, 0x4596B4C4, 0x9709BDEB,
+  0x3D5398D7, 0xEFCC91F8, 0x9D81FC78, 0x4F1EF557, 0x791B2778, 0xAB842E57, 0xD9C943D7, 0x0B564AF8,
+  0xB5C2E789, 0x675DEEA6, 0x15108326, 0xC78F8A09, 0xF18A5826, 0x23155109, 0x51583C89, 0x83C735A6,
+  0x533A2134, 0x81A5281B, 0xF3E8459B, 0x21774CB4, 0x17729E9B, 0xC5ED97B4, 0xB7A0FA34, 0x653FF31B,
+  0xDBAB5E6A, 0x09345745, 0x7B793AC5, 0xA9E633EA, 0x9FE3E1C5, 0x4D7CE8EA, 0x3F31856A, 0xEDAE8C45,
+  0x47F4A979, 0x956BA056, 0xE726CDD6, 0x35B9C4F9, 0x03BC16D6, 0xD1231FF9, 0xA36E7279, 0x71F17B56,
+  0xCF65D627, 0x1DFADF08, 0x6FB7B288, 0xBD28BBA7, 0x8B2D6988, 0x59B260A7, 0x2BFF0D27, 0xF9600408,
+  0x7AA731AE, 0xA8383881, 0xDA755501, 0x08EA5C2E, 0x3EEF8E01, 0xEC70872E, 0x9E3DEAAE, 0x4CA2E381,
+  0xF2364EF0, 0x20A947DF, 0x52E42A5F, 0x807B2370, 0xB67EF15F, 0x64E1F870, 0x16AC95F0, 0xC4339CDF,
+  0x6E69B9E3, 0xBCF6B0CC, 0xCEBBDD4C, 0x1C24D463, 0x2A21064C, 0xF8BE0F63, 0x8AF362E3, 0x586C6BCC,
+  0xE6F8C6BD, 0x3467CF92, 0x462AA212, 0x94B5AB3D, 0xA2B07912, 0x702F703D, 0x02621DBD, 0xD0FD1492,
+  0xA6744268, 0x74EB4B47, 0x06A626C7, 0xD4392FE8, 0xE23CFDC7, 0x30A3F4E8, 0x42EE9968, 0x90719047,
+  0x2EE53D36, 0xFC7A3419, 0x8E375999, 0x5CA850B6, 0x6AAD8299, 0xB8328BB6, 0xCA7FE636, 0x18E0EF19,
+  0xB2BACA25, 0x6025C30A, 0x1268AE8A, 0xC0F7A7A5, 0xF6F2758A, 0x246D7CA5, 0x56201125, 0x84BF180A,
+  0x3A2BB57B, 0xE8B4BC54, 0x9AF9D1D4, 0x4866D8FB, 0x7E630AD4, 0xACFC03FB, 0xDEB16E7B, 0x0C2E6754,
+  0x8FE952F2, 0x5D765BDD, 0x2F3B365D, 0xFDA43F72, 0xCBA1ED5D, 0x193EE472, 0x6B7389F2, 0xB9EC80DD,
+  0x07782DAC, 0xD5E72483, 0xA7AA4903, 0x7535402C, 0x43309203, 0x91AF9B2C, 0xE3E2F6AC, 0x317DFF83,
+  0x9B27DABF, 0x49B8D390, 0x3BF5BE10, 0xE96AB73F, 0xDF6F6510, 0x0DF06C3F, 0x7FBD01BF, 0xAD220890,
+  0x13B6A5E1, 0xC129ACCE, 0xB364C14E, 0x61FBC861, 0x57FE1A4E, 0x85611361, 0xF72C7EE1, 0x25B377CE,
+  0xF54E635C, 0x27D16A73, 0x559C07F3, 0x87030EDC, 0xB106DCF3, 0x6399D5DC, 0x11D4B85C, 0xC34BB173,
+  0x7DDF1C02, 0xAF40152D, 0xDD0D78AD, 0x0F927182, 0x3997A3AD, 0xEB08AA82, 0x9945C702, 0x4BDACE2D,
+  0xE180EB11, 0x331FE23E, 0x41528FBE, 0x93CD8691, 0xA5C854BE, 0x77575D91, 0x051A3011, 0xD785393E,
+  0x6911944F, 0xBB8E9D60, 0xC9C3F0E0, 0x1B5CF9CF, 0x2D592BE0, 0xFFC622CF, 0x8D8B4F4F, 0x5F144660,
+  0xDCD373C6, 0x0E4C7AE9, 0x7C011769, 0xAE9E1E46, 0x989BCC69, 0x4A04C546, 0x3849A8C6, 0xEAD6A1E9,
+  0x54420C98, 0x86DD05B7, 0xF4906837, 0x260F6118, 0x100AB337, 0xC295BA18, 0xB0D8D798, 0x6247DEB7,
+  0xC81DFB8B, 0x1A82F2A4, 0x68CF9F24, 0xBA50960B, 0x8C554424, 0x5ECA4D0B, 0x2C87208B, 0xFE1829A4,
+  0x408C84D5, 0x92138DFA, 0xE05EE07A, 0x32C1E955, 0x04C43B7A, 0xD65B3255, 0xA4165FD5, 0x768956FA
+ },
+ {
+  0x00000000, 0x4904F221, 0x9209E442, 0xDB0D1663, 0x21FFBE75, 0x68FB4C54, 0xB3F65A37, 0xFAF2A816,
+  0x43FF7CEA, 0x0AFB8ECB, 0xD1F698A8, 0x98F26A89, 0x6200C29F, 0x2B0430BE, 0xF00926DD, 0xB90DD4FC,
+  0x87FEF9D4, 0xCEFA0BF5, 0x15F71D96, 0x5CF3EFB7, 0xA60147A1, 0xEF05B580, 0x3408A3E3, 0x7D0C51C2,
+  0xC401853E, 0x8D05771F, 0x5608617C, 0x1F0C935D, 0xE5FE3B4B, 0xACFAC96A, 0x77F7DF09, 0x3EF32D28,
+  0x0A118559, 0x43157778, 0x9818611B, 0xD11C933A, 0x2BEE3B2C, 0x62EAC90D, 0xB9E7DF6E, 0xF0E32D4F,
+  0x49EEF9B3, 0x00EA0B92, 0xDBE71DF1, 0x92E3EFD0, 0x681147C6, 0x2115B5E7, 0xFA18A384, 0xB31C51A5,
+  0x8DEF7C8D, 0xC4EB8EAC, 0x1FE698CF, 0x56E26AEE, 0xAC10C2F8, 0xE51430D9, 0x3E1926BA, 0x771DD49B,
+  0xCE100067, 0x8714F246, 0x5C19E425, 0x151D1604, 0xEFEFBE12, 0xA6EB4C33, 0x7DE65A50, 0x34E2A871,
+  0x14230AB2, 0x5D27F893, 0x862AEEF0, 0xCF2E1CD1, 0x35DCB4C7, 0x7CD846E6, 0xA7D55085, 0xEED1A2A4,
+  0x57DC7658, 0x1ED88479, 0xC5D5921A, 0x8CD1603B, 0x7623C82D, 0x3F273A0C, 0xE42A2C6F, 0xAD2EDE4E,
+  0x93DDF366, 0xDAD90147, 0x01D41724, 0x48D0E505, 0xB2224D13, 0xFB26BF32, 0x202BA951, 0x692F5B70,
+  0xD0228F8C, 0x99267DAD, 0x422B6BCE, 0x0B2F99EF, 0xF1DD31F9, 0xB8D9C3D8, 0x63D4D5BB, 0x2AD0279A,
+  0x1E328FEB, 0x57367DCA, 0x8C3B6BA9, 0xC53F9988, 0x3FCD319E, 0x76C9C3BF, 0xADC4D5DC, 0xE4C027FD,
+  0x5DCDF301, 0x14C90120, 0xCFC41743, 0x86C0E562, 0x7C324D74, 0x3536BF55, 0xEE3BA936, 0xA73F5B17,
+  0x99CC763F, 0xD0C8841E, 0x0BC5927D, 0x42C1605C, 0xB833C84A, 0xF1373A6B, 0x2A3A2C08, 0x633EDE29,
+  0xDA330AD5, 0x9337F8F4, 0x483AEE97, 0x013E1CB6, 0xFBCCB4A0, 0xB2C84681, 0x69C550E2, 0x20C1A2C3,
+  0x28461564, 0x6142E745, 0xBA4FF126, 0xF34B0307, 0x09B9AB11, 0x40BD5930, 0x9BB04F53, 0xD2B4BD72,
+  0x6BB9698E, 0x22BD9BAF, 0xF9B08DCC, 0xB0B47FED, 0x4A46D7FB, 0x034225DA, 0xD84F33B9, 0x914BC198,
+  0xAFB8ECB0, 0xE6BC1E91, 0x3DB108F2, 0x74B5FAD3, 0x8E4752C5, 0xC743A0E4, 0x1C4EB687, 0x554A44A6,
+  0xEC47905A, 0xA543627B, 0x7E4E7418, 0x374A8639, 0xCDB82E2F, 0x84BCDC0E, 0x5FB1CA6D, 0x16B5384C,
+  0x2257903D, 0x6B53621C, 0xB05E747F, 0xF95A865E, 0x03A82E48, 0x4AACDC69, 0x91A1CA0A, 0xD8A5382B,
+  0x61A8ECD7, 0x28AC1EF6, 0xF3A10895, 0xBAA5FAB4, 0x405752A2, 0x0953A083, 0xD25EB6E0, 0x9B5A44C1,
+  0xA5A969E9, 0xECAD9BC8, 0x37A08DAB, 0x7EA47F8A, 0x8456D79C, 0xCD5225BD, 0x165F33DE, 0x5F5BC1FF,
+  0xE6561503, 0xAF52E722, 0x745FF141, 0x3D5B0360, 0xC7A9AB76, 0x8EAD5957, 0x55A04F34, 0x1CA4BD15,
+  0x3C651FD6, 0x7561EDF7, 0xAE6CFB94, 0xE76809B5, 0x1D9AA1A3, 0x549E5382, 0x8F9345E1, 0xC697B7C0,
+  0x7F9A633C, 0x369E911D, 0xED93877E, 0xA497755F, 0x5E65DD49, 0x17612F68, 0xCC6C390B, 0x8568CB2A,
+  0xBB9BE602, 0xF29F1423, 0x29920240, 0x6096F061, 0x9A645877, 0xD360AA56, 0x086DBC35, 0x41694E14,
+  0xF8649AE8, 0xB16068C9, 0x6A6D7EAA, 0x23698C8B, 0xD99B249D, 0x909FD6BC, 0x4B92C0DF, 0x029632FE,
+  0x36749A8F, 0x7F7068AE, 0xA47D7ECD, 0xED798CEC, 0x178B24FA, 0x5E8FD6DB, 0x8582C0B8, 0xCC863299,
+  0x758BE665, 0x3C8F1444, 0xE7820227, 0xAE86F006, 0x54745810, 0x1D70AA31, 0xC67DBC52, 0x8F794E73,
+  0xB18A635B, 0xF88E917A, 0x23838719, 0x6A877538, 0x9075DD2E, 0xD9712F0F, 0x027C396C, 0x4B78CB4D,
+  0xF2751FB1, 0xBB71ED90, 0x607CFBF3, 0x297809D2, 0xD38AA1C4, 0x9A8E53E5, 0x41834586, 0x0887B7A7
+ }
+};
+
+static const uint32_t crc32c_short[4][256] =
+{
+ {
+  0x00000000, 0xDCB17AA4, 0xBC8E83B9, 0x603FF91D, 0x7CF17183, 0xA0400B27, 0xC07FF23A, 0x1CCE889E,
+  0xF9E2E306, 0x255399A2, 0x456C60BF, 0x99DD1A1B, 0x85139285, 0x59A2E821, 0x399D113C, 0xE52C6B98,
+  0xF629B0FD, 0x2A98CA59, 0x4AA73344, 0x961649E0, 0x8AD8C17E, 0x5669BBDA, 0x365642C7, 0xEAE73863,
+  0x0FCB53FB, 0xD37A295F, 0xB345D042, 0x6FF4AAE6, 0x733A2278, 0xAF8B58DC, 0xCFB4A1C1, 0x1305DB65,
+  0xE9BF170B, 0x350E6DAF, 0x553194B2, 0x8980EE16, 0x954E6688, 0x49FF1C2C, 0x29C0E531, 0xF5719F95,
+  0x105DF40D, 0xCCEC8EA9, 0xACD377B4, 0x70620D10, 0x6CAC858E, 0xB01DFF2A, 0xD0220637, 0x0C937C93,
+  0x1F96A7F6, 0xC327DD52, 0xA318244F, 0x7FA95EEB, 0x6367D675, 0xBFD6ACD1, 0xDFE955CC, 0x03582F68,
+  0xE67444F0, 0x3AC53E54, 0x5AFAC749, 0x864BBDED, 0x9A853573, 0x46344FD7, 0x260BB6CA, 0xFABACC6E,
+  0xD69258E7, 0x0A232243, 0x6A1CDB5E, 0xB6ADA1FA, 0xAA632964, 0x76D253C0, 0x16EDAADD, 0xCA5CD079,
+  0x2F70BBE1, 0xF3C1C145, 0x93FE3858, 0x4F4F42FC, 0x5381CA62, 0x8F30B0C6, 0xEF0F49DB, 0x33BE337F,
+  0x20BBE81A, 0xFC0A92BE, 0x9C356BA3, 0x40841107, 0x5C4A9999, 0x80FBE33D, 0xE0C41A20, 0x3C756084,
+  0xD9590B1C, 0x05E871B8, 0x65D788A5, 0xB966F201, 0xA5A87A9F, 0x7919003B, 0x1926F926, 0xC5978382,
+  0x3F2D4FEC, 0xE39C3548, 0x83A3CC55, 0x5F12B6F1, 0x43DC3E6F, 0x9F6D44CB, 0xFF52BDD6, 0x23E3C772,
+  0xC6CFACEA, 0x1A7ED64E, 0x7A412F53, 0xA6F055F7, 0xBA3EDD69, 0x668FA7CD, 0x06B05ED0, 0xDA012474,
+  0xC904FF11, 0x15B585B5, 0x758A7CA8, 0xA93B060C, 0xB5F58E92, 0x6944F436, 0x097B0D2B, 0xD5CA778F,
+  0x30E61C17, 0xEC5766B3, 0x8C689FAE, 0x50D9E50A, 0x4C176D94, 0x90A61730, 0xF099EE2D, 0x2C289489,
+  0xA8C8C73F, 0x7479BD9B, 0x14464486, 0xC8F73E22, 0xD439B6BC, 0x0888CC18, 0x68B73505, 0xB4064FA1,
+  0x512A2439, 0x8D9B5E9D, 0xEDA4A780, 0x3115DD24, 0x2DDB55BA, 0xF16A2F1E, 0x9155D603, 0x4DE4ACA7,
+  0x5EE177C2, 0x82500D66, 0xE26FF47B, 0x3EDE8EDF, 0x22100641, 0xFEA17CE5, 0x9E9E85F8, 0x422FFF5C,
+  0xA70394C4, 0x7BB2EE60, 0x1B8D177D, 0xC73C6DD9, 0xDBF2E547, 0x07439FE3, 0x677C66FE, 0xBBCD1C5A,
+  0x4177D034, 0x9DC6AA90, 0xFDF9538D, 0x21482929, 0x3D86A1B7, 0xE137DB13, 0x8108220E, 0x5DB958AA,
+  0xB8953332, 0x64244996, 0x041BB08B, 0xD8AACA2F, 0xC46442B1, 0x18D53815, 0x78EAC108, 0xA45BBBAC,
+  0xB75E60C9, 0x6BEF1A6D, 0x0BD0E370, 0xD76199D4, 0xCBAF114A, 0x171E6BEE, 0x772192F3, 0xAB90E857,
+  0x4EBC83CF, 0x920DF96B, 0xF2320076, 0x2E837AD2, 0x324DF24C, 0xEEFC88E8, 0x8EC371F5, 0x52720B51,
+  0x7E5A9FD8, 0xA2EBE57C, 0xC2D41C61, 0x1E6566C5, 0x02ABEE5B, 0xDE1A94FF, 0xBE256DE2, 0x62941746,
+  0x87B87CDE, 0x5B09067A, 0x3B36FF67, 0xE78785C3, 0xFB490D5D, 0x27F877F9, 0x47C78EE4, 0x9B76F440,
+  0x88732F25, 0x54C25581, 0x34FDAC9C, 0xE84CD638, 0xF4825EA6, 0x28332402, 0x480CDD1F, 0x94BDA7BB,
+  0x7191CC23, 0xAD20B687, 0xCD1F4F9A, 0x11AE353E, 0x0D60BDA0, 0xD1D1C704, 0xB1EE3E19, 0x6D5F44BD,
+  0x97E588D3, 0x4B54F277, 0x2B6B0B6A, 0xF7DA71CE, 0xEB14F950, 0x37A583F4, 0x579A7AE9, 0x8B2B004D,
+  0x6E076BD5, 0xB2B61171, 0xD289E86C, 0x0E3892C8, 0x12F61A56, 0xCE4760F2, 0xAE7899EF, 0x72C9E34B,
+  0x61CC382E, 0xBD7D428A, 0xDD42BB97, 0x01F3C133, 0x1D3D49AD, 0xC18C3309, 0xA1B3CA14, 0x7D02B0B0,
+  0x982EDB28, 0x449FA18C, 0x24A05891, 0xF8112235, 0xE4DFAAAB, 0x386ED00F, 0x58512912, 0x84E053B6
+ },
+ {
+  0x00000000, 0x547DF88F, 0xA8FBF11E, 0xFC860991, 0x541B94CD, 0x00666C42, 0xFCE065D3, 0xA89D9D5C,
+  0xA837299A, 0xFC4AD115, 0x00CCD884, 0x54B1200B, 0xFC2CBD57, 0xA85145D8, 0x54D74C49, 0x00AAB4C6,
+  0x558225C5, 0x01FFDD4A, 0xFD79D4DB, 0xA9042C54, 0x0199B108, 0x55E44987, 0xA9624016, 0xFD1FB899,
+  0xFDB50C5F, 0xA9C8F4D0, 0x554EFD41, 0x013305CE, 0xA9AE9892, 0xFDD3601D, 0x0155698C, 0x55289103,
+  0xAB044B8A, 0xFF79B305, 0x03FFBA94, 0x5782421B, 0xFF1FDF47, 0xAB6227C8, 0x57E42E59, 0x0399D6D6,
+  0x03336210, 0x574E9A9F, 0xABC8930E, 0xFFB56B81, 0x5728F6DD, 0x03550E52, 0xFFD307C3, 0xABAEFF4C,
+  0xFE866E4F, 0xAAFB96C0, 0x567D9F51, 0x020067DE, 0xAA9DFA82, 0xFEE0020D, 0x02660B9C, 0x561BF313,
+  0x56B147D5, 0x02CCBF5A, 0xFE4AB6CB, 0xAA374E44, 0x02AAD318, 0x56D72B97, 0xAA512206, 0xFE2CDA89,
+  0x53E4E1E5, 0x0799196A, 0xFB1F10FB, 0xAF62E874, 0x07FF7528, 0x53828DA7, 0xAF048436, 0xFB797CB9,
+  0xFBD3C87F, 0xAFAE30F0, 0x53283961, 0x0755C1EE, 0xAFC85CB2, 0xFBB5A43D, 0x0733ADAC, 0x534E5523,
+  0x0666C420, 0x521B3CAF, 0xAE9D353E, 0xFAE0CDB1, 0x527D50ED, 0x0600A862, 0xFA86A1F3, 0xAEFB597C,
+  0xAE51EDBA, 0xFA2C1535, 0x06AA1CA4, 0x52D7E42B, 0xFA4A7977, 0xAE3781F8, 0x52B18869, 0x06CC70E6,
+  0xF8E0AA6F, 0xAC9D52E0, 0x501B5B71, 0x0466A3FE, 0xACFB3EA2, 0xF886C62D, 0x0400CFBC, 0x507D3733,
+  0x50D783F5, 0x04AA7B7A, 0xF82C72EB, 0xAC518A64, 0x04CC1738, 0x50B1EFB7, 0xAC37E626, 0xF84A1EA9,
+  0xAD628FAA, 0xF91F7725, 0x05997EB4, 0x51E4863B, 0xF9791B67, 0xAD04E3E8, 0x5182EA79, 0x05FF12F6,
+  0x0555A630, 0x51285EBF, 0xADAE572E, 0xF9D3AFA1, 0x514E32FD, 0x0533CA72, 0xF9B5C3E3, 0xADC83B6C,
+  0xA7C9C3CA, 0xF3B43B45, 0x0F3232D4, 0x5B4FCA5B, 0xF3D25707, 0xA7AFAF88, 0x5B29A619, 0x0F545E96,
+  0x0FFEEA50, 0x5B8312DF, 0xA7051B4E, 0xF378E3C1, 0x5BE57E9D, 0x0F988612, 0xF31E8F83, 0xA763770C,
+  0xF24BE60F, 0xA6361E80, 0x5AB01711, 0x0ECDEF9E, 0xA65072C2, 0xF22D8A4D, 0x0EAB83DC, 0x5AD67B53,
+  0x5A7CCF95, 0x0E01371A, 0xF2873E8B, 0xA6FAC604, 0x0E675B58, 0x5A1AA3D7, 0xA69CAA46, 0xF2E152C9,
+  0x0CCD8840, 0x58B070CF, 0xA436795E, 0xF04B81D1, 0x58D61C8D, 0x0CABE402, 0xF02DED93, 0xA450151C,
+  0xA4FAA1DA, 0xF0875955, 0x0C0150C4, 0x587CA84B, 0xF0E13517, 0xA49CCD98, 0x581AC409, 0x0C673C86,
+  0x594FAD85, 0x0D32550A, 0xF1B45C9B, 0xA5C9A414, 0x0D543948, 0x5929C1C7, 0xA5AFC856, 0xF1D230D9,
+  0xF178841F, 0xA5057C90, 0x59837501, 0x0DFE8D8E, 0xA56310D2, 0xF11EE85D, 0x0D98E1CC, 0x59E51943,
+  0xF42D222F, 0xA050DAA0, 0x5CD6D331, 0x08AB2BBE, 0xA036B6E2, 0xF44B4E6D, 0x08CD47FC, 0x5CB0BF73,
+  0x5C1A0BB5, 0x0867F33A, 0xF4E1FAAB, 0xA09C0224, 0x08019F78, 0x5C7C67F7, 0xA0FA6E66, 0xF48796E9,
+  0xA1AF07EA, 0xF5D2FF65, 0x0954F6F4, 0x5D290E7B, 0xF5B49327, 0xA1C96BA8, 0x5D4F6239, 0x09329AB6,
+  0x09982E70, 0x5DE5D6FF, 0xA163DF6E, 0xF51E27E1, 0x5D83BABD, 0x09FE4232, 0xF5784BA3, 0xA105B32C,
+  0x5F2969A5, 0x0B54912A, 0xF7D298BB, 0xA3AF6034, 0x0B32FD68, 0x5F4F05E7, 0xA3C90C76, 0xF7B4F4F9,
+  0xF71E403F, 0xA363B8B0, 0x5FE5B121, 0x0B9849AE, 0xA305D4F2, 0xF7782C7D, 0x0BFE25EC, 0x5F83DD63,
+  0x0AAB4C60, 0x5ED6B4EF, 0xA250BD7E, 0xF62D45F1, 0x5EB0D8AD, 0x0ACD2022, 0xF64B29B3, 0xA236D13C,
+  0xA29C65FA, 0xF6E19D75, 0x0A6794E4, 0x5E1A6C6B, 0xF687F137, 0xA2FA09B8, 0x5E7C0029, 0x0A01F8A6
+ },
+ {
+  0x00000000, 0x4A7FF165, 0x94FFE2CA, 0xDE8013AF, 0x2C13B365, 0x666C4200, 0xB8EC51AF, 0xF293A0CA,
+  0x582766CA, 0x125897AF, 0xCCD88400, 0x86A77565, 0x7434D5AF, 0x3E4B24CA, 0xE0CB3765, 0xAAB4C600,
+  0xB04ECD94, 0xFA313CF1, 0x24B12F5E, 0x6ECEDE3B, 0x9C5D7EF1, 0xD6228F94, 0x08A29C3B, 0x42DD6D5E,
+  0xE869AB5E, 0xA2165A3B, 0x7C964994, 0x36E9B8F1, 0xC47A183B, 0x8E05E95E, 0x5085FAF1, 0x1AFA0B94,
+  0x6571EDD9, 0x2F0E1CBC, 0xF18E0F13, 0xBBF1FE76, 0x49625EBC, 0x031DAFD9, 0xDD9DBC76, 0x97E24D13,
+  0x3D568B13, 0x77297A76, 0xA9A969D9, 0xE3D698BC, 0x11453876, 0x5B3AC913, 0x85BADABC, 0xCFC52BD9,
+  0xD53F204D, 0x9F40D128, 0x41C0C287, 0x0BBF33E2, 0xF92C9328, 0xB353624D, 0x6DD371E2, 0x27AC8087,
+  0x8D184687, 0xC767B7E2, 0x19E7A44D, 0x53985528, 0xA10BF5E2, 0xEB740487, 0x35F41728, 0x7F8BE64D,
+  0xCAE3DBB2, 0x809C2AD7, 0x5E1C3978, 0x1463C81D, 0xE6F068D7, 0xAC8F99B2, 0x720F8A1D, 0x38707B78,
+  0x92C4BD78, 0xD8BB4C1D, 0x063B5FB2, 0x4C44AED7, 0xBED70E1D, 0xF4A8FF78, 0x2A28ECD7, 0x60571DB2,
+  0x7AAD1626, 0x30D2E743, 0xEE52F4EC, 0xA42D0589, 0x56BEA543, 0x1CC15426, 0xC2414789, 0x883EB6EC,
+  0x228A70EC, 0x68F58189, 0xB6759226, 0xFC0A6343, 0x0E99C389, 0x44E632EC, 0x9A662143, 0xD019D026,
+  0xAF92366B, 0xE5EDC70E, 0x3B6DD4A1, 0x711225C4, 0x8381850E, 0xC9FE746B, 0x177E67C4, 0x5D0196A1,
+  0xF7B550A1, 0xBDCAA1C4, 0x634AB26B, 0x2935430E, 0xDBA6E3C4, 0x91D912A1, 0x4F59010E, 0x0526F06B,
+  0x1FDCFBFF, 0x55A30A9A, 0x8B231935, 0xC15CE850, 0x33CF489A, 0x79B0B9FF, 0xA730AA50, 0xED4F5B35,
+  0x47FB9D35, 0x0D846C50, 0xD3047FFF, 0x997B8E9A, 0x6BE82E50, 0x2197DF35, 0xFF17CC9A, 0xB5683DFF,
+  0x902BC195, 0xDA5430F0, 0x04D4235F, 0x4EABD23A, 0xBC3872F0, 0xF6478395, 0x28C7903A, 0x62B8615F,
+  0xC80CA75F, 0x8273563A, 0x5CF34595, 0x168CB4F0, 0xE41F143A, 0xAE60E55F, 0x70E0F6F0, 0x3A9F0795,
+  0x20650C01, 0x6A1AFD64, 0xB49AEECB, 0xFEE51FAE, 0x0C76BF64, 0x46094E01, 0x98895DAE, 0xD2F6ACCB,
+  0x78426ACB, 0x323D9BAE, 0xECBD8801, 0xA6C27964, 0x5451D9AE, 0x1E2E28CB, 0xC0AE3B64, 0x8AD1CA01,
+  0xF55A2C4C, 0xBF25DD29, 0x61A5CE86, 0x2BDA3FE3, 0xD9499F29, 0x93366E4C, 0x4DB67DE3, 0x07C98C86,
+  0xAD7D4A86, 0xE702BBE3, 0x3982A84C, 0x73FD5929, 0x816EF9E3, 0xCB110886, 0x15911B29, 0x5FEEEA4C,
+  0x4514E1D8, 0x0F6B10BD, 0xD1EB0312, 0x9B94F277, 0x690752BD, 0x2378A3D8, 0xFDF8B077, 0xB7874112,
+  0x1D338712, 0x574C7677, 0x89CC65D8, 0xC3B394BD, 0x31203477, 0x7B5FC512, 0xA5DFD6BD, 0xEFA027D8,
+  0x5AC81A27, 0x10B7EB42, 0xCE37F8ED, 0x84480988, 0x76DBA942, 0x3CA45827, 0xE2244B88, 0xA85BBAED,
+  0x02EF7CED, 0x48908D88, 0x96109E27, 0xDC6F6F42, 0x2EFCCF88, 0x64833EED, 0xBA032D42, 0xF07CDC27,
+  0xEA86D7B3, 0xA0F926D6, 0x7E793579, 0x3406C41C, 0xC69564D6, 0x8CEA95B3, 0x526A861C, 0x18157779,
+  0xB2A1B179, 0xF8DE401C, 0x265E53B3, 0x6C21A2D6, 0x9EB2021C, 0xD4CDF379, 0x0A4DE0D6, 0x403211B3,
+  0x3FB9F7FE, 0x75C6069B, 0xAB461534, 0xE139E451, 0x13AA449B, 0x59D5B5FE, 0x8755A651, 0xCD2A5734,
+  0x679E9134, 0x2DE16051, 0xF36173FE, 0xB91E829B, 0x4B8D2251, 0x01F2D334, 0xDF72C09B, 0x950D31FE,
+  0x8FF73A6A, 0xC588CB0F, 0x1B08D8A0, 0x517729C5, 0xA3E4890F, 0xE99B786A, 0x371B6BC5, 0x7D649AA0,
+  0xD7D05CA0, 0x9DAFADC5, 0x432FBE6A, 0x09504F0F, 0xFBC3EFC5, 0xB1BC1EA0, 0x6F3C0D0F, 0x2543FC6A
+ },
+ {
+  0x00000000, 0x25BBF5DB, 0x4B77EBB6, 0x6ECC1E6D, 0x96EFD76C, 0xB35422B7, 0xDD983CDA, 0xF823C901,
+  0x2833D829, 0x0D882DF2, 0x6344339F, 0x46FFC644, 0xBEDC0F45, 0x9B67FA9E, 0xF5ABE4F3, 0xD0101128,
+  0x5067B052, 0x75DC4589, 0x1B105BE4, 0x3EABAE3F, 0xC688673E, 0xE33392E5, 0x8DFF8C88, 0xA8447953,
+  0x7854687B, 0x5DEF9DA0, 0x332383CD, 0x16987616, 0xEEBBBF17, 0xCB004ACC, 0xA5CC54A1, 0x8077A17A,
+  0xA0CF60A4, 0x8574957F, 0xEBB88B12, 0xCE037EC9, 0x3620B7C8, 0x139B4213, 0x7D575C7E, 0x58ECA9A5,
+  0x88FCB88D, 0xAD474D56, 0xC38B533B, 0xE630A6E0, 0x1E136FE1, 0x3BA89A3A, 0x55648457, 0x70DF718C,
+  0xF0A8D0F6, 0xD513252D, 0xBBDF3B40, 0x9E64CE9B, 0x6647079A, 0x43FCF241, 0x2D30EC2C, 0x088B19F7,
+  0xD89B08DF, 0xFD20FD04, 0x93ECE369, 0xB65716B2, 0x4E74DFB3, 0x6BCF2A68, 0x05033405, 0x20B8C1DE,
+  0x4472B7B9, 0x61C94262, 0x0F055C0F, 0x2ABEA9D4, 0xD29D60D5, 0xF726950E, 0x99EA8B63, 0xBC517EB8,
+  0x6C416F90, 0x49FA9A4B, 0x27368426, 0x028D71FD, 0xFAAEB8FC, 0xDF154D27, 0xB1D9534A, 0x9462A691,
+  0x141507EB, 0x31AEF230, 0x5F62EC5D, 0x7AD91986, 0x82FAD087, 0xA741255C, 0xC98D3B31, 0xEC36CEEA,
+  0x3C26DFC2, 0x199D2A19, 0x77513474, 0x52EAC1AF, 0xAAC908AE, 0x8F72FD75, 0xE1BEE318, 0xC40516C3,
+  0xE4BDD71D, 0xC10622C6, 0xAFCA3CAB, 0x8A71C970, 0x72520071, 0x57E9F5AA, 0x3925EBC7, 0x1C9E1E1C,
+  0xCC8E0F34, 0xE935FAEF, 0x87F9E482, 0xA2421159, 0x5A61D858, 0x7FDA2D83, 0x111633EE, 0x34ADC635,
+  0xB4DA674F, 0x91619294, 0xFFAD8CF9, 0xDA167922, 0x2235B023, 0x078E45F8, 0x69425B95, 0x4CF9AE4E,
+  0x9CE9BF66, 0xB9524ABD, 0xD79E54D0, 0xF225A10B, 0x0A06680A, 0x2FBD9DD1, 0x417183BC, 0x64CA7667,
+  0x88E56F72, 0xAD5E9AA9, 0xC39284C4, 0xE629711F, 0x1E0AB81E, 0x3BB14DC5, 0x557D53A8, 0x70C6A673,
+  0xA0D6B75B, 0x856D4280, 0xEBA15CED, 0xCE1AA936, 0x36396037, 0x138295EC, 0x7D4E8B81, 0x58F57E5A,
+  0xD882DF20, 0xFD392AFB, 0x93F53496, 0xB64EC14D, 0x4E6D084C, 0x6BD6FD97, 0x051AE3FA, 0x20A11621,
+  0xF0B10709, 0xD50AF2D2, 0xBBC6ECBF, 0x9E7D1964, 0x665ED065, 0x43E525BE, 0x2D293BD3, 0x0892CE08,
+  0x282A0FD6, 0x0D91FA0D, 0x635DE460, 0x46E611BB, 0xBEC5D8BA, 0x9B7E2D61, 0xF5B2330C, 0xD009C6D7,
+  0x0019D7FF, 0x25A22224, 0x4B6E3C49, 0x6ED5C992, 0x96F60093, 0xB34DF548, 0xDD81EB25, 0xF83A1EFE,
+  0x784DBF84, 0x5DF64A5F, 0x333A5432, 0x1681A1E9, 0xEEA268E8, 0xCB199D33, 0xA5D5835E, 0x806E7685,
+  0x507E67AD, 0x75C59276, 0x1B098C1B, 0x3EB279C0, 0xC691B0C1, 0xE32A451A, 0x8DE65B77, 0xA85DAEAC,
+  0xCC97D8CB, 0xE92C2D10, 0x87E0337D, 0xA25BC6A6, 0x5A780FA7, 0x7FC3FA7C, 0x110FE411, 0x34B411CA,
+  0xE4A400E2, 0xC11FF539, 0xAFD3EB54, 0x8A681E8F, 0x724BD78E, 0x57F02255, 0x393C3C38, 0x1C87C9E3,
+  0x9CF06899, 0xB94B9D42, 0xD787832F, 0xF23C76F4, 0x0A1FBFF5, 0x2FA44A2E, 0x41685443, 0x64D3A198,
+  0xB4C3B0B0, 0x9178456B, 0xFFB45B06, 0xDA0FAEDD, 0x222C67DC, 0x07979207, 0x695B8C6A, 0x4CE079B1,
+  0x6C58B86F, 0x49E34DB4, 0x272F53D9, 0x0294A602, 0xFAB76F03, 0xDF0C9AD8, 0xB1C084B5, 0x947B716E,
+  0x446B6046, 0x61D0959D, 0x0F1C8BF0, 0x2AA77E2B, 0xD284B72A, 0xF73F42F1, 0x99F35C9C, 0xBC48A947,
+  0x3C3F083D, 0x1984FDE6, 0x7748E38B, 0x52F31650, 0xAAD0DF51, 0x8F6B2A8A, 0xE1A734E7, 0xC41CC13C,
+  0x140CD014, 0x31B725CF, 0x5F7B3BA2, 0x7AC0CE79, 0x82E30778, 0xA758F2A3, 0xC994ECCE, 0xEC2F1915
+ }
+};
 
 #ifndef CRC32C_IS_64_BITS
 #define CRCtriplet(crc, buf, size, i) \
@@ -223,8 +497,9 @@ ATTR_CRC32 uint32_t _crc32c_hw_adler(uint32_t crc, const unsigned char *buf, uns
         uint32_t crc32bit;
 
         crc32bit = crc;
-        // in len > 256 compute the crc for up to seven leading bytes to bring the data pointer to an eight-byte boundary
-        if ( len > 128 ) {
+        // compute the crc for up to seven leading bytes to bring the data pointer to an eight-byte boundary,
+        // so all the eight-byte loads below are aligned
+        if ( len >= 8 ) {
                 unsigned char align = ( 8 - ( uintptr_t ) next ) % 8;            // byte to boundary
                 len -= align;
                 if ( ( align % 2 ) != 0 ) crc32bit = __builtin_ia32_crc32qi ( crc32bit, *next );
@@ -368,4 +643,40 @@ ATTR_CRC32 uint32_t _crc32c_hw_adler(uint32_t crc, const unsigned char *buf, uns
         return ( uint32_t ) crc32bit;
 }
 
+/* Compute the CRC-32C of count records of record_size bytes each, located
+   every stride bytes, using the Intel hardware instruction. Instead of
+   interleaving three parts of the same buffer, three different records are
+   processed in parallel, so no shifting of crcs is required afterwards. */
+ATTR_CRC32 void _crc32c_hw_adler_records(const unsigned char *buf, uint64_t record_size, uint64_t stride,
+                                         uint64_t count, uint32_t *crcs)
+{
+        const unsigned char *next;
+        uint64_t i;
+
+#ifndef CRC32C_IS_64_BITS
+        uint32_t crc0, crc1, crc2;
+#else
+        uint64_t crc0, crc1, crc2;      /* need to be 64 bits for crc32q */
+#endif
+
+        for ( ; count >= 3; count -= 3, buf += 3 * stride, crcs += 3 ) {
+                crc0 = crc1 = crc2 = 0xffffffff;
+                for ( i = 0; i + 8 <= record_size; i += 8 ) {
+                        CRCtriplet ( crc, buf, stride, i );
+                }
+                for ( ; i < record_size; i++ ) {
+                        next = buf + i;
+                        crc0 = __builtin_ia32_crc32qi ( (uint32_t)crc0, *next );
+                        crc1 = __builtin_ia32_crc32qi ( (uint32_t)crc1, *(next + stride) );
+                        crc2 = __builtin_ia32_crc32qi ( (uint32_t)crc2, *(next + 2 * stride) );
+                }
+                crcs[0] = (uint32_t)crc0 ^ 0xffffffff;
+                crcs[1] = (uint32_t)crc1 ^ 0xffffffff;
+                crcs[2] = (uint32_t)crc2 ^ 0xffffffff;
+        }
+        for ( ; count > 0; count--, buf += stride, crcs++ ) {
+                crcs[0] = _crc32c_hw_adler ( 0xffffffff, buf, (unsigned long)record_size ) ^ 0xffffffff;
+        }
+}
+
 #endif // defined(IS_INTEL)
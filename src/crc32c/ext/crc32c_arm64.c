@@ -75,6 +75,26 @@ uint32_t _crc32c_hw_arm64(uint32_t crc, const uint8_t *data, size_t size) {
   // k2=CRC(x^(SEGMENTBYTES*8))
   const poly64_t k0 = 0x8d96551c, k1 = 0xbd6f81f8, k2 = 0xdcb17aa4;
 
+  // Process up to seven leading bytes to bring data to an 8-byte boundary,
+  // so all the 8-byte loads below are aligned
+  if (length >= 8) {
+    if ((uintptr_t)data & 1) {
+      crc = __crc32cb(crc, *data);
+      data += 1;
+      length -= 1;
+    }
+    if ((uintptr_t)data & 2) {
+      crc = __crc32ch(crc, *(uint16_t *)data);
+      data += 2;
+      length -= 2;
+    }
+    if ((uintptr_t)data & 4) {
+      crc = __crc32cw(crc, *(uint32_t *)data);
+      data += 4;
+      length -= 4;
+    }
+  }
+
   while (length >= KBYTES) {
     crc0 = crc;
     crc1 = 0;
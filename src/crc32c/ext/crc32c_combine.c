@@ -0,0 +1,109 @@
+/*
+ * Combination of crc32c checksums of independently computed blocks
+ *
+ * ICRAR - International Centre for Radio Astronomy Research
+ * (c) UWA - The University of Western Australia, 2026
+ * Copyright by UWA (in the framework of the ICRAR)
+ * All rights reserved
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+ * MA 02111-1307  USA
+ *
+ */
+
+/*
+ * The approach follows the one taken by zlib's crc32_combine (Mark Adler):
+ * instead of squaring GF(2) 32x32 matrices for every combination, appending
+ * n zero bytes to a crc is expressed as a multiplication by x^(8n) modulo the
+ * CRC-32C polynomial, and x^(8n) is built from a table of x^(2^k) values.
+ * This makes combining two crcs O(log(n)) on the length of the second block,
+ * and independent of the backend used to calculate the crcs themselves.
+ */
+
+#include "crc32c.h"
+
+/* CRC-32C (iSCSI) polynomial in reversed bit order. */
+#define POLY 0x82f63b78
+
+/*
+ * x^(2^k) modulo the CRC-32C polynomial, for k = 0..30, in reversed bit order.
+ * x^(2^31) is x again, so the values repeat with a period of 31.
+ * Generated with code like the following:
+
+	uint32_t p = (uint32_t)1 << 30;  // x^1
+	x2n_table[0] = p;
+	for (int n = 1; n < 31; n++)
+		x2n_table[n] = p = crc32c_multmodp(p, p);
+ */
+#define X2N_PERIOD 31
+static const uint32_t x2n_table[X2N_PERIOD] = {
+	0x40000000, 0x20000000, 0x08000000, 0x00800000,
+	0x00008000, 0x82f63b78, 0x6ea2d55c, 0x18b8ea18,
+	0x510ac59a, 0xb82be955, 0xb8fdb1e7, 0x88e56f72,
+	0x74c360a4, 0xe4172b16, 0x0d65762a, 0x35d73a62,
+	0x28461564, 0xbf455269, 0xe2ea32dc, 0xfe7740e6,
+	0xf946610b, 0x3c204f8f, 0x538586e3, 0x59726915,
+	0x734d5309, 0xbc1ac763, 0x7d0722cc, 0xd289cabe,
+	0xe94ca9bc, 0x05b74f3f, 0xa51e1f42
+};
+
+/* Multiply a(x) by b(x) modulo the CRC-32C polynomial, both in reversed bit
+   order. */
+uint32_t crc32c_multmodp(uint32_t a, uint32_t b)
+{
+	uint32_t m = (uint32_t)1 << 31;
+	uint32_t p = 0;
+
+	for (;;) {
+		if (a & m) {
+			p ^= b;
+			if ((a & (m - 1)) == 0) {
+				break;
+			}
+		}
+		m >>= 1;
+		b = b & 1 ? (b >> 1) ^ POLY : b >> 1;
+	}
+	return p;
+}
+
+/* x^(8 * n) modulo the CRC-32C polynomial, i.e., the operator that appends n
+   zero bytes to a crc. */
+uint32_t crc32c_x8nmodp(uint64_t n)
+{
+	uint32_t p = (uint32_t)1 << 31;  /* x^0 == 1 */
+	unsigned int k = 3;
+
+	while (n) {
+		if (n & 1) {
+			p = crc32c_multmodp(x2n_table[k], p);
+		}
+		n >>= 1;
+		if (++k == X2N_PERIOD) {
+			k = 0;
+		}
+	}
+	return p;
+}
+
+uint32_t crc32c_combine_op(uint32_t crc1, uint32_t crc2, uint32_t op)
+{
+	return crc32c_multmodp(op, crc1) ^ crc2;
+}
+
+uint32_t crc32c_combine(uint32_t crc1, uint32_t crc2, uint64_t len2)
+{
+	return crc32c_combine_op(crc1, crc2, crc32c_x8nmodp(len2));
+}
@@ -0,0 +1,212 @@
+/*
+ * crc32c calculation over the contents of a file
+ *
+ * ICRAR - International Centre for Radio Astronomy Research
+ * (c) UWA - The University of Western Australia, 2026
+ * Copyright by UWA (in the framework of the ICRAR)
+ * All rights reserved
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+ * MA 02111-1307  USA
+ *
+ */
+
+/*
+ * Regular files are memory-mapped in large windows, avoiding copying their
+ * contents. Other files (or if mapping fails) are read sequentially into a
+ * single buffer that is reused for the whole file. Either way the kernel is
+ * told about the sequential access pattern so it reads ahead aggressively
+ * (only through the mapping for file descriptors given by callers).
+ * No Python API is used here, so callers can (and should) release the GIL
+ * around these calls.
+ */
+
+#include <errno.h>
+#include <fcntl.h>
+#include <stdlib.h>
+
+#include "crc32c.h"
+
+#if defined(_WIN32)
+# include <io.h>
+#else
+# include <sys/mman.h>
+# include <sys/stat.h>
+# include <unistd.h>
+# define CRC32C_HAVE_MMAP
+#endif
+
+#if !defined(O_BINARY)
+# define O_BINARY 0
+#endif
+#if !defined(O_CLOEXEC)
+# define O_CLOEXEC 0
+#endif
+
+#define CRC32C_FILE_BUFSIZE (256 * 1024)
+#define CRC32C_FILE_MMAP_WINDOW (64 * 1024 * 1024)
+
+#if defined(CRC32C_HAVE_MMAP)
+/* Checksums a regular file through mmap, advancing offset and length as it
+   goes. Returns 0 on success, or -1 if the remaining data should be read. */
+static int crc32c_fd_mmap(crc_function crc_fn, int fd, uint64_t *offset, uint64_t *length, uint32_t *crc)
+{
+	struct stat st;
+	uint64_t end, map_offset, window;
+	size_t page_offset;
+	long page_size = sysconf(_SC_PAGESIZE);
+	unsigned char *map;
+
+	/* procfs, sysfs and the like have regular files reporting a size of 0,
+	   which can only be read; empty files are just as cheap to read */
+	if (fstat(fd, &st) || !S_ISREG(st.st_mode) || st.st_size == 0 || page_size <= 0) {
+		return -1;
+	}
+	end = (uint64_t)st.st_size;
+	if (*offset >= end) {
+		*length = 0;
+		return 0;
+	}
+	if (*length < end - *offset) {
+		end = *offset + *length;
+	}
+
+	while (*offset < end) {
+		map_offset = *offset & ~((uint64_t)page_size - 1);
+		page_offset = (size_t)(*offset - map_offset);
+		window = end - map_offset;
+		if (window > CRC32C_FILE_MMAP_WINDOW) {
+			window = CRC32C_FILE_MMAP_WINDOW;
+		}
+		map = mmap(NULL, (size_t)window, PROT_READ, MAP_SHARED, fd, (off_t)map_offset);
+		if (map == MAP_FAILED) {
+			return -1;
+		}
+# if defined(MADV_SEQUENTIAL)
+		(void)madvise(map, (size_t)window, MADV_SEQUENTIAL);
+# endif
+		*crc = crc_fn(*crc, map + page_offset, (unsigned long)(window - page_offset));
+		munmap(map, (size_t)window);
+		*offset = map_offset + window;
+		if (*length != CRC32C_TO_EOF) {
+			*length -= window - page_offset;
+		}
+	}
+	/* don't read anything appended after the file was inspected */
+	*length = 0;
+	return 0;
+}
+#endif
+
+int crc32c_fd(crc_function crc_fn, int fd, uint64_t offset, uint64_t length, uint32_t *crc, uint64_t *nbytes)
+{
+	unsigned char *buf;
+	uint32_t result = *crc ^ 0xffffffff;
+	uint64_t start = offset;
+	size_t to_read;
+	long long n;
+	int err = 0, seekable = 1;
+
+#if defined(CRC32C_HAVE_MMAP)
+	if (crc32c_fd_mmap(crc_fn, fd, &offset, &length, &result) == 0) {
+		*crc = result ^ 0xffffffff;
+		*nbytes = offset - start;
+		return 0;
+	}
+#endif
+
+#if !defined(_WIN32)
+	/* pipes and the like can only be read from their current position */
+	if (lseek(fd, 0, SEEK_CUR) < 0 && errno == ESPIPE) {
+		if (offset) {
+			return ESPIPE;
+		}
+		seekable = 0;
+	}
+#endif
+
+	buf = malloc(CRC32C_FILE_BUFSIZE);
+	if (buf == NULL) {
+		return ENOMEM;
+	}
+#if defined(_WIN32)
+	/* There's no pread, so seek and read instead; pipes and the like can
+	   only be read from their current position */
+	(void)seekable;
+	if (_lseeki64(fd, (__int64)offset, SEEK_SET) < 0 && offset) {
+		err = errno;
+		free(buf);
+		return err;
+	}
+#endif
+
+	while (length) {
+		to_read = length < CRC32C_FILE_BUFSIZE ? (size_t)length : CRC32C_FILE_BUFSIZE;
+#if defined(_WIN32)
+		n = _read(fd, buf, (unsigned int)to_read);
+#else
+		n = seekable ? pread(fd, buf, to_read, (off_t)offset) : read(fd, buf, to_read);
+#endif
+		if (n < 0) {
+			if (errno == EINTR) {
+				continue;
+			}
+			err = errno;
+			break;
+		}
+		if (n == 0) {
+			break;
+		}
+		result = crc_fn(result, buf, (unsigned long)n);
+		offset += (uint64_t)n;
+		if (length != CRC32C_TO_EOF) {
+			length -= (uint64_t)n;
+		}
+	}
+
+	free(buf);
+	*crc = result ^ 0xffffffff;
+	*nbytes = offset - start;
+	return err;
+}
+
+int crc32c_path(crc_function crc_fn, const crc32c_path_char *path, uint64_t offset, uint64_t length, uint32_t *crc,
+                uint64_t *nbytes)
+{
+	int fd, err;
+
+#if defined(_WIN32)
+	fd = _wopen(path, O_RDONLY | O_BINARY);
+#else
+	do {
+		fd = open(path, O_RDONLY | O_BINARY | O_CLOEXEC);
+	} while (fd < 0 && errno == EINTR);
+#endif
+	if (fd < 0) {
+		return errno;
+	}
+#if defined(POSIX_FADV_SEQUENTIAL)
+	/* Only a hint, errors don't matter. Not done in crc32c_fd,
+	   as it would change the state of the caller's file */
+	(void)posix_fadvise(fd, (off_t)offset, length == CRC32C_TO_EOF ? 0 : (off_t)length, POSIX_FADV_SEQUENTIAL);
+#endif
+	err = crc32c_fd(crc_fn, fd, offset, length, crc, nbytes);
+#if defined(_WIN32)
+	_close(fd);
+#else
+	close(fd);
+#endif
+	return err;
+}
@@ -0,0 +1,175 @@
+/*
+ * Multi-threaded crc32c calculation over a single buffer
+ *
+ * ICRAR - International Centre for Radio Astronomy Research
+ * (c) UWA - The University of Western Australia, 2026
+ * Copyright by UWA (in the framework of the ICRAR)
+ * All rights reserved
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+ * MA 02111-1307  USA
+ *
+ */
+
+/*
+ * The buffer is split in consecutive chunks, each of which is checksummed by
+ * a different native thread (the calling thread takes the first chunk). The
+ * resulting partial crcs are then merged with crc32c_combine. No Python API
+ * is used here, so callers can (and should) release the GIL around these
+ * calls.
+ */
+
+#include "crc32c.h"
+
+#if defined(_WIN32)
+# include <windows.h>
+# include <process.h>
+#else
+# include <pthread.h>
+# include <time.h>
+# include <unistd.h>
+#endif
+
+struct crc32c_chunk {
+	crc_function crc_fn;
+	const unsigned char *data;
+	uint64_t length;
+	uint32_t crc;
+	int started;
+#if defined(_WIN32)
+	HANDLE thread;
+#else
+	pthread_t thread;
+#endif
+};
+
+static void crc32c_chunk_run(struct crc32c_chunk *chunk)
+{
+	chunk->crc = chunk->crc_fn(chunk->crc ^ 0xffffffff, chunk->data, (unsigned long)chunk->length) ^ 0xffffffff;
+}
+
+#if defined(_WIN32)
+static unsigned __stdcall crc32c_chunk_thread(void *arg)
+{
+	crc32c_chunk_run((struct crc32c_chunk *)arg);
+	return 0;
+}
+
+static int crc32c_chunk_start(struct crc32c_chunk *chunk)
+{
+	chunk->thread = (HANDLE)_beginthreadex(NULL, 0, crc32c_chunk_thread, chunk, 0, NULL);
+	return chunk->thread != 0;
+}
+
+static void crc32c_chunk_join(struct crc32c_chunk *chunk)
+{
+	WaitForSingleObject(chunk->thread, INFINITE);
+	CloseHandle(chunk->thread);
+}
+
+int crc32c_cpu_count(void)
+{
+	SYSTEM_INFO info;
+	GetSystemInfo(&info);
+	return (int)info.dwNumberOfProcessors;
+}
+
+uint64_t crc32c_monotonic_ns(void)
+{
+	LARGE_INTEGER counter, frequency;
+	QueryPerformanceCounter(&counter);
+	QueryPerformanceFrequency(&frequency);
+	return (uint64_t)(counter.QuadPart / frequency.QuadPart) * 1000000000U +
+	       (uint64_t)(counter.QuadPart % frequency.QuadPart) * 1000000000U / (uint64_t)frequency.QuadPart;
+}
+#else
+static void *crc32c_chunk_thread(void *arg)
+{
+	crc32c_chunk_run((struct crc32c_chunk *)arg);
+	return NULL;
+}
+
+static int crc32c_chunk_start(struct crc32c_chunk *chunk)
+{
+	return pthread_create(&chunk->thread, NULL, crc32c_chunk_thread, chunk) == 0;
+}
+
+static void crc32c_chunk_join(struct crc32c_chunk *chunk)
+{
+	pthread_join(chunk->thread, NULL);
+}
+
+int crc32c_cpu_count(void)
+{
+	long count = sysconf(_SC_NPROCESSORS_ONLN);
+	return count > 0 ? (int)count : 1;
+}
+
+uint64_t crc32c_monotonic_ns(void)
+{
+	struct timespec now;
+	clock_gettime(CLOCK_MONOTONIC, &now);
+	return (uint64_t)now.tv_sec * 1000000000U + (uint64_t)now.tv_nsec;
+}
+#endif
+
+uint32_t crc32c_parallel(crc_function crc_fn, uint32_t crc, const unsigned char *data, uint64_t length,
+                         unsigned int threads, uint64_t min_chunk_size)
+{
+	struct crc32c_chunk *chunks;
+	uint64_t n_chunks, chunk_size, offset;
+	unsigned int i;
+
+	if (min_chunk_size == 0) {
+		min_chunk_size = 1;
+	}
+	n_chunks = length / min_chunk_size;
+	if (n_chunks > threads) {
+		n_chunks = threads;
+	}
+	if (n_chunks <= 1 || (chunks = calloc((size_t)n_chunks, sizeof(struct crc32c_chunk))) == NULL) {
+		return crc_fn(crc ^ 0xffffffff, data, (unsigned long)length) ^ 0xffffffff;
+	}
+
+	/* Keep chunk boundaries 8-byte aligned relative to the start of the data;
+	   the last chunk takes any remaining bytes */
+	chunk_size = (length / n_chunks) & ~(uint64_t)7;
+	for (i = 0, offset = 0; i < n_chunks; i++, offset += chunk_size) {
+		chunks[i].crc_fn = crc_fn;
+		chunks[i].data = data + offset;
+		chunks[i].length = i == n_chunks - 1 ? length - offset : chunk_size;
+		chunks[i].crc = i == 0 ? crc : 0;
+	}
+
+	/* If a thread cannot be started its chunk is calculated by the calling
+	   thread once it's done with the first one */
+	for (i = 1; i < n_chunks; i++) {
+		chunks[i].started = crc32c_chunk_start(&chunks[i]);
+	}
+	crc32c_chunk_run(&chunks[0]);
+	crc = chunks[0].crc;
+	for (i = 1; i < n_chunks; i++) {
+		if (chunks[i].started) {
+			crc32c_chunk_join(&chunks[i]);
+		}
+		else {
+			crc32c_chunk_run(&chunks[i]);
+		}
+		crc = crc32c_combine(crc, chunks[i].crc, chunks[i].length);
+	}
+
+	free(chunks);
+	return crc;
+}
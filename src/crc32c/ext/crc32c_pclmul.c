@@ -0,0 +1,216 @@
+/*
+ * crc32c calculation using carry-less multiplication folding on x86-64
+ *
+ * ICRAR - International Centre for Radio Astronomy Research
+ * (c) UWA - The University of Western Australia, 2026
+ * Copyright by UWA (in the framework of the ICRAR)
+ * All rights reserved
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+ * MA 02111-1307  USA
+ *
+ */
+
+/*
+ * The data is folded into several 128-bit (PCLMULQDQ) or 512-bit (AVX-512
+ * VPCLMULQDQ) accumulators, following Intel's "Fast CRC Computation for
+ * Generic Polynomials Using PCLMULQDQ Instruction" white paper. Folding an
+ * accumulator forward by N bits multiplies its low and high 64-bit halves by
+ * x^(N+31) and x^(N-33) modulo the CRC-32C polynomial respectively (bit
+ * reflected). Once everything has been folded into a single 128-bit value,
+ * its crc is calculated with the crc32 instruction, which performs the final
+ * reduction modulo the polynomial.
+ */
+
+#include "common.h"
+
+#if defined(IS_INTEL) && defined(CRC32C_IS_64_BITS)
+
+#include "crc32c.h"
+
+#if defined(_MSC_VER)
+# include <intrin.h>
+# define ATTR_PCLMUL
+# define ATTR_VPCLMUL
+#else
+# include <immintrin.h>
+# define ATTR_PCLMUL __attribute__ ((target("sse4.2,pclmul")))
+# define ATTR_VPCLMUL __attribute__ ((target("sse4.2,pclmul,avx2,avx512f,vpclmulqdq")))
+#endif
+
+/* Fold-forward constants, x^(N+31) and x^(N-33) mod P, for N bits */
+#define K_128 0xf20c0dfe, 0, 0x493c7d27, 0
+#define K_256 0x3da6d0cb, 0, 0xba4fc28e, 0
+#define K_384 0x1c291d04, 0, 0xddc0152b, 0
+#define K_512 0x740eef02, 0, 0x9e4addf8, 0
+#define K_2048 0xdcb17aa4, 0, 0xb9e02b86, 0
+
+/* Multiplies the two halves of x by the two halves of k, and adds them up
+   into the data y that x is being folded onto. */
+#define FOLD128(x, k, y) \
+	_mm_xor_si128(_mm_xor_si128(_mm_clmulepi64_si128(x, k, 0x00), _mm_clmulepi64_si128(x, k, 0x11)), y)
+
+static ATTR_PCLMUL uint32_t crc32c_u128(uint32_t crc, __m128i x)
+{
+	crc = (uint32_t)_mm_crc32_u64(crc, (uint64_t)_mm_cvtsi128_si64(x));
+	return (uint32_t)_mm_crc32_u64(crc, (uint64_t)_mm_cvtsi128_si64(_mm_unpackhi_epi64(x, x)));
+}
+
+/* Compute CRC-32C using 128-bit carry-less multiplication folding. */
+ATTR_PCLMUL uint32_t _crc32c_hw_pclmul(uint32_t crc, const unsigned char *buf, unsigned long len)
+{
+	__m128i x0, x1, x2, x3, k;
+
+	/* align to 16 bytes so the main loop uses aligned loads */
+	for ( ; len && ((uintptr_t)buf & 7); len--) {
+		crc = _mm_crc32_u8(crc, *buf++);
+	}
+	if (((uintptr_t)buf & 8) && len >= 8) {
+		crc = (uint32_t)_mm_crc32_u64(crc, *(const uint64_t *)buf);
+		buf += 8;
+		len -= 8;
+	}
+
+	if (len >= 128) {
+		x0 = _mm_load_si128((const __m128i *)buf);
+		x1 = _mm_load_si128((const __m128i *)(buf + 16));
+		x2 = _mm_load_si128((const __m128i *)(buf + 32));
+		x3 = _mm_load_si128((const __m128i *)(buf + 48));
+		x0 = _mm_xor_si128(x0, _mm_cvtsi32_si128((int)crc));
+		buf += 64;
+		len -= 64;
+
+		k = _mm_setr_epi32(K_512);
+		while (len >= 64) {
+			x0 = FOLD128(x0, k, _mm_load_si128((const __m128i *)buf));
+			x1 = FOLD128(x1, k, _mm_load_si128((const __m128i *)(buf + 16)));
+			x2 = FOLD128(x2, k, _mm_load_si128((const __m128i *)(buf + 32)));
+			x3 = FOLD128(x3, k, _mm_load_si128((const __m128i *)(buf + 48)));
+			buf += 64;
+			len -= 64;
+		}
+
+		/* fold the four accumulators into one */
+		k = _mm_setr_epi32(K_128);
+		x0 = FOLD128(x0, k, x1);
+		x2 = FOLD128(x2, k, x3);
+		k = _mm_setr_epi32(K_256);
+		x0 = FOLD128(x0, k, x2);
+
+		/* remaining 16-byte blocks */
+		k = _mm_setr_epi32(K_128);
+		while (len >= 16) {
+			x0 = FOLD128(x0, k, _mm_load_si128((const __m128i *)buf));
+			buf += 16;
+			len -= 16;
+		}
+		crc = crc32c_u128(0, x0);
+	}
+
+	for ( ; len >= 8; buf += 8, len -= 8) {
+		crc = (uint32_t)_mm_crc32_u64(crc, *(const uint64_t *)buf);
+	}
+	for ( ; len; len--) {
+		crc = _mm_crc32_u8(crc, *buf++);
+	}
+	return crc;
+}
+
+#if defined(CRC32C_HAVE_VPCLMUL)
+
+#define FOLD512(x, k, y) \
+	_mm512_ternarylogic_epi64(_mm512_clmulepi64_epi128(x, k, 0x00), _mm512_clmulepi64_epi128(x, k, 0x11), y, 0x96)
+
+/* Below this many bytes, setting up and reducing the 512-bit accumulators
+   costs more than it saves, and the 128-bit implementation is faster */
+#define VPCLMUL_MIN_LEN 2048
+
+/* Compute CRC-32C using 512-bit carry-less multiplication folding. Inputs
+   shorter than VPCLMUL_MIN_LEN are handed to the 128-bit implementation;
+   otherwise the tail left after the 256-byte blocks is folded 16 bytes at a
+   time and finished with the crc32 instruction. */
+ATTR_VPCLMUL uint32_t _crc32c_hw_vpclmul(uint32_t crc, const unsigned char *buf, unsigned long len)
+{
+	__m512i x0, x1, x2, x3, k;
+	__m128i y0, y1, y2, y3, k128;
+
+	if (len < VPCLMUL_MIN_LEN) {
+		return _crc32c_hw_pclmul(crc, buf, len);
+	}
+
+	/* align to 64 bytes so the main loop uses aligned loads */
+	for ( ; (uintptr_t)buf & 7; len--) {
+		crc = _mm_crc32_u8(crc, *buf++);
+	}
+	for ( ; (uintptr_t)buf & 63; buf += 8, len -= 8) {
+		crc = (uint32_t)_mm_crc32_u64(crc, *(const uint64_t *)buf);
+	}
+
+	x0 = _mm512_load_si512((const void *)buf);
+	x1 = _mm512_load_si512((const void *)(buf + 64));
+	x2 = _mm512_load_si512((const void *)(buf + 128));
+	x3 = _mm512_load_si512((const void *)(buf + 192));
+	x0 = _mm512_xor_si512(x0, _mm512_castsi128_si512(_mm_cvtsi32_si128((int)crc)));
+	buf += 256;
+	len -= 256;
+
+	k = _mm512_broadcast_i32x4(_mm_setr_epi32(K_2048));
+	while (len >= 256) {
+		x0 = FOLD512(x0, k, _mm512_load_si512((const void *)buf));
+		x1 = FOLD512(x1, k, _mm512_load_si512((const void *)(buf + 64)));
+		x2 = FOLD512(x2, k, _mm512_load_si512((const void *)(buf + 128)));
+		x3 = FOLD512(x3, k, _mm512_load_si512((const void *)(buf + 192)));
+		buf += 256;
+		len -= 256;
+	}
+
+	/* fold the four 512-bit accumulators into one */
+	k = _mm512_broadcast_i32x4(_mm_setr_epi32(K_512));
+	x0 = FOLD512(x0, k, x1);
+	x0 = FOLD512(x0, k, x2);
+	x0 = FOLD512(x0, k, x3);
+
+	/* and its four 128-bit lanes into one */
+	y0 = _mm512_extracti32x4_epi32(x0, 0);
+	y1 = _mm512_extracti32x4_epi32(x0, 1);
+	y2 = _mm512_extracti32x4_epi32(x0, 2);
+	y3 = _mm512_extracti32x4_epi32(x0, 3);
+	k128 = _mm_setr_epi32(K_384);
+	y3 = FOLD128(y0, k128, y3);
+	k128 = _mm_setr_epi32(K_256);
+	y3 = FOLD128(y1, k128, y3);
+	k128 = _mm_setr_epi32(K_128);
+	y3 = FOLD128(y2, k128, y3);
+
+	/* remaining 16-byte blocks */
+	while (len >= 16) {
+		y3 = FOLD128(y3, k128, _mm_load_si128((const __m128i *)buf));
+		buf += 16;
+		len -= 16;
+	}
+	crc = crc32c_u128(0, y3);
+
+	for ( ; len >= 8; buf += 8, len -= 8) {
+		crc = (uint32_t)_mm_crc32_u64(crc, *(const uint64_t *)buf);
+	}
+	for ( ; len; len--) {
+		crc = _mm_crc32_u8(crc, *buf++);
+	}
+	return crc;
+}
+
+#endif // defined(CRC32C_HAVE_VPCLMUL)
+
+#endif // defined(IS_INTEL) && defined(CRC32C_IS_64_BITS)
@@ -0,0 +1,140 @@
+/*
+ * Rolling (sliding window) crc32c calculation
+ *
+ * ICRAR - International Centre for Radio Astronomy Research
+ * (c) UWA - The University of Western Australia, 2026
+ * Copyright by UWA (in the framework of the ICRAR)
+ * All rights reserved
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+ * MA 02111-1307  USA
+ *
+ */
+
+/*
+ * The register R of a window b[0..w-1] (before the final inversion) can be
+ * written as R = S_w(I) ^ f(b[0..w-1]), where I is the initial register,
+ * S_n multiplies by x^(8n) modulo the polynomial (appending n zeros), and f
+ * is the (linear) crc with a zero initial register. Appending b[w] to the
+ * window and removing b[0] from it then becomes
+ *
+ *   R' = step(R, b[w]) ^ S_w(T[b[0]]) ^ S_w(S_1(I) ^ I)
+ *
+ * where step is the usual byte-wise update and T the usual byte table. The
+ * second term only depends on the outgoing byte, and the last one on the
+ * window size, so both are precalculated.
+ */
+
+#include <string.h>
+
+#include "crc32c.h"
+
+int crc32c_rolling_init(struct crc32c_rolling *rolling, uint64_t window)
+{
+	uint32_t shift = crc32c_x8nmodp(window);
+	int i;
+
+	rolling->ring = malloc((size_t)window);
+	if (rolling->ring == NULL) {
+		return 0;
+	}
+	rolling->window = window;
+	crc32c_rolling_reset(rolling);
+	for (i = 0; i < 256; i++) {
+		rolling->out_table[i] = crc32c_multmodp(shift, crc_tableil8_o32[i]);
+	}
+	rolling->k = crc32c_multmodp(shift, crc32c_multmodp(crc32c_x8nmodp(1), 0xffffffff) ^ 0xffffffff);
+	return 1;
+}
+
+int crc32c_rolling_copy(struct crc32c_rolling *dst, const struct crc32c_rolling *src)
+{
+	unsigned char *ring = malloc((size_t)src->window);
+	if (ring == NULL) {
+		return 0;
+	}
+	memcpy(ring, src->ring, (size_t)src->window);
+	*dst = *src;
+	dst->ring = ring;
+	return 1;
+}
+
+void crc32c_rolling_free(struct crc32c_rolling *rolling)
+{
+	free(rolling->ring);
+	rolling->ring = NULL;
+}
+
+void crc32c_rolling_reset(struct crc32c_rolling *rolling)
+{
+	rolling->pos = 0;
+	rolling->filled = 0;
+	rolling->reg = 0xffffffff;
+}
+
+static CRC32C_INLINE uint32_t crc32c_step(uint32_t reg, unsigned char in)
+{
+	return crc_tableil8_o32[(reg ^ in) & 0xff] ^ (reg >> 8);
+}
+
+uint64_t crc32c_rolling_count(const struct crc32c_rolling *rolling, uint64_t length)
+{
+	uint64_t missing = rolling->window - rolling->filled;
+	if (!missing) {
+		return length;
+	}
+	return length < missing ? 0 : length - missing + 1;
+}
+
+void crc32c_rolling_update(struct crc32c_rolling *rolling, const unsigned char *data, uint64_t length, uint32_t *crcs)
+{
+	const uint32_t *out_table = rolling->out_table;
+	const uint32_t k = rolling->k;
+	const uint64_t window = rolling->window;
+	uint32_t reg = rolling->reg;
+	uint64_t i, n;
+
+	/* fill the window first */
+	for ( ; length && rolling->filled < window; length--, data++) {
+		reg = crc32c_step(reg, *data);
+		rolling->ring[rolling->filled++] = *data;
+		if (crcs && rolling->filled == window) {
+			*crcs++ = reg ^ 0xffffffff;
+		}
+	}
+
+	/* the first outgoing bytes come from the ring, and the rest from data */
+	n = length < window ? length : window;
+	for (i = 0; i < n; i++) {
+		reg = crc32c_step(reg, data[i]) ^ out_table[rolling->ring[rolling->pos]] ^ k;
+		rolling->ring[rolling->pos] = data[i];
+		rolling->pos = rolling->pos + 1 == window ? 0 : rolling->pos + 1;
+		if (crcs) {
+			*crcs++ = reg ^ 0xffffffff;
+		}
+	}
+	if (length > window) {
+		for ( ; i < length; i++) {
+			reg = crc32c_step(reg, data[i]) ^ out_table[data[i - window]] ^ k;
+			if (crcs) {
+				*crcs++ = reg ^ 0xffffffff;
+			}
+		}
+		memcpy(rolling->ring, data + length - window, (size_t)window);
+		rolling->pos = 0;
+	}
+
+	rolling->reg = reg;
+}
@@ -20,6 +20,7 @@
 #    MA 02111-1307  USA
 #
 
+import os
 import time
 
 import pytest
@@ -48,6 +49,15 @@ def skip_if_crc32c_unavailable(
         pytest.skip("crc32c is not available on this platform")
 
 
+@pytest.fixture(autouse=True)
+def skip_large_unless_requested(request: pytest.FixtureRequest) -> None:
+    if (
+        request.node.get_closest_marker("large")
+        and os.environ.get("CRC32C_LARGE_TESTS") != "1"
+    ):
+        pytest.skip("set CRC32C_LARGE_TESTS=1 to run tests needing GiBs of memory")
+
+
 def pytest_sessionstart(session: pytest.Session) -> None:
     print("crc32c is big endian? ", crc32c.big_endian)
     print("crc32c is hardware based? ", crc32c.hardware_based)
@@ -0,0 +1,19 @@
+"""Test data and file-like objects shared by several test modules."""
+
+import io
+
+DATA = bytes(range(256)) * 1001
+
+
+class ReadOnly:
+    """A file-like object offering only read() and close(), returning short reads"""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+        self.closed = False
+
+    def read(self, size: int) -> bytes:
+        return self._data.read(min(size, 1000))
+
+    def close(self) -> None:
+        self.closed = True
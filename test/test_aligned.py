@@ -0,0 +1,37 @@
+import ctypes
+import mmap
+
+import pytest
+
+import crc32c
+
+
+def _address(buffer: mmap.mmap) -> int:
+    return ctypes.addressof(ctypes.c_char.from_buffer(buffer))
+
+
+@pytest.mark.parametrize("huge_pages", [False, True])
+def test_aligned_buffer(huge_pages: bool) -> None:
+    for size in (1, 4095, 4 * 1024 * 1024):
+        buffer = crc32c.aligned_buffer(size, huge_pages=huge_pages)
+        assert len(buffer) == size
+        assert _address(buffer) % mmap.PAGESIZE == 0
+        assert buffer[:] == bytes(size)
+        buffer.close()
+
+
+@pytest.mark.calculates_crc32c
+def test_aligned_buffer_checksum() -> None:
+    data = b"123456789"
+    buffer = crc32c.aligned_buffer(4096)
+    view = memoryview(buffer)
+    for offset in range(8):
+        buffer[offset : offset + len(data)] = data
+        assert 0xE3069283 == crc32c.crc32c(view[offset : offset + len(data)])
+    view.release()
+    buffer.close()
+
+
+def test_aligned_buffer_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        crc32c.aligned_buffer(0)
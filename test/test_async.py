@@ -0,0 +1,77 @@
+import asyncio
+import concurrent.futures
+import typing
+
+import pytest
+
+import crc32c
+
+pytestmark = pytest.mark.calculates_crc32c
+
+DATA = b"123456789" * 10000
+EXPECTED = 0x7AD252A6
+
+
+@pytest.fixture(autouse=True)
+def restore_threshold() -> typing.Iterator[None]:
+    threshold = crc32c.get_gil_release_threshold()
+    yield
+    crc32c.set_gil_release_threshold(threshold)
+
+
+@pytest.mark.parametrize("threshold", (0, 2**40))
+def test_acrc32c(threshold: int) -> None:
+    crc32c.set_gil_release_threshold(threshold)
+    assert asyncio.run(crc32c.acrc32c(DATA)) == EXPECTED
+    assert asyncio.run(crc32c.acrc32c(DATA[5:], crc32c.crc32c(DATA[:5]))) == EXPECTED
+    assert asyncio.run(crc32c.acrc32c(memoryview(DATA))) == EXPECTED
+
+
+def test_acrc32c_executor() -> None:
+    crc32c.set_gil_release_threshold(0)
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        assert asyncio.run(crc32c.acrc32c(DATA, executor=executor)) == EXPECTED
+
+
+def test_async_hash() -> None:
+    crc32c.set_gil_release_threshold(1000)
+
+    async def checksum() -> crc32c.AsyncCRC32CHash:
+        crc32c_hash = crc32c.AsyncCRC32CHash()
+        chunks = [DATA[i : i + 3000] for i in range(0, len(DATA), 3000)]
+        await asyncio.gather(*(crc32c_hash.update(chunk) for chunk in chunks))
+        return crc32c_hash
+
+    crc32c_hash = asyncio.run(checksum())
+    assert crc32c_hash.checksum == EXPECTED
+    assert crc32c_hash.digest() == EXPECTED.to_bytes(4, "big")
+    assert crc32c_hash.hexdigest() == "%08x" % EXPECTED
+    assert crc32c_hash.copy().checksum == EXPECTED
+    assert crc32c_hash.length == len(DATA)
+
+
+def test_async_hash_data() -> None:
+    crc32c_hash = crc32c.AsyncCRC32CHash(DATA[:5])
+    asyncio.run(crc32c_hash.update(DATA[5:]))
+    assert crc32c_hash.checksum == EXPECTED
+    assert crc32c_hash.length == len(DATA)
+    assert (crc32c_hash.digest_size, crc32c_hash.block_size) == (4, 1)
+    assert crc32c_hash.name == "crc32c"
+
+
+@pytest.mark.parametrize("threshold", (0, 2**40))
+def test_async_hash_extend(threshold: int) -> None:
+    crc32c.set_gil_release_threshold(threshold)
+
+    async def checksum() -> crc32c.AsyncCRC32CHash:
+        crc32c_hash = crc32c.AsyncCRC32CHash()
+        await asyncio.gather(
+            crc32c_hash.update(DATA[:1000]),
+            crc32c_hash.extend(crc32c.CRC32CHash(DATA[1000:50000])),
+            crc32c_hash.extend(crc32c.AsyncCRC32CHash(DATA[50000:])),
+        )
+        return crc32c_hash
+
+    crc32c_hash = asyncio.run(checksum())
+    assert crc32c_hash.checksum == EXPECTED
+    assert crc32c_hash.length == len(DATA)
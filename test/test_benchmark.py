@@ -1,10 +1,102 @@
+import csv
+import io
+import json
 import subprocess
 import sys
 
 import pytest
 
+import crc32c
+
 
 @pytest.mark.calculates_crc32c
 def test_benchmark() -> None:
     out = subprocess.check_output([sys.executable, "-m", "crc32c.benchmark"])
     assert b"crc32c ran at" in out
+
+
+@pytest.mark.calculates_crc32c
+def test_benchmark_latency() -> None:
+    out = subprocess.check_output(
+        [sys.executable, "-m", "crc32c.benchmark", "-l", "-i", "1000"]
+    )
+    assert b"crc32c took" in out
+
+
+def test_benchmark_import_time() -> None:
+    out = subprocess.check_output(
+        [sys.executable, "-m", "crc32c.benchmark", "-I", "-i", "10"]
+    )
+    assert b"to initialise" in out
+
+
+@pytest.mark.calculates_crc32c
+def test_benchmark_suite_json() -> None:
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-m",
+            "crc32c.benchmark",
+            "--suite",
+            "--sizes",
+            "1,4K",
+            "--threads",
+            "1,2",
+            "--samples",
+            "3",
+            "--format",
+            "json",
+        ]
+    )
+    contents = json.loads(out)
+    assert contents["metadata"]["backend"] == crc32c.get_backend()
+    results = contents["results"]
+    # sizes x alignments x backends x GIL release modes x threads
+    assert len(results) == 2 * 2 * len(crc32c.available_backends()) * 2 * 2
+    for result in results:
+        assert result["size"] in (1, 4096)
+        assert result["gbps"] > 0
+        assert (
+            result["mean_latency_min_ns"]
+            <= result["mean_latency_p50_ns"]
+            <= result["mean_latency_p90_ns"]
+            <= result["mean_latency_p99_ns"]
+        )
+
+
+@pytest.mark.calculates_crc32c
+def test_benchmark_suite_csv() -> None:
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-m",
+            "crc32c.benchmark",
+            "--suite",
+            "--sizes",
+            "64",
+            "--alignments",
+            "3",
+            "--backends",
+            crc32c.get_backend() or "",
+            "--gil-release-modes",
+            "1",
+            "--samples",
+            "2",
+            "--format",
+            "csv",
+        ],
+        text=True,
+    )
+    rows = list(csv.DictReader(io.StringIO(out)))
+    assert len(rows) == 1
+    assert rows[0]["size"] == "64"
+    assert rows[0]["alignment"] == "3"
+    assert rows[0]["gil_release_mode"] == "1"
+
+
+def test_benchmark_suite_invalid_backend() -> None:
+    with pytest.raises(subprocess.CalledProcessError):
+        subprocess.check_output(
+            [sys.executable, "-m", "crc32c.benchmark", "--suite", "--backends", "nope"],
+            stderr=subprocess.DEVNULL,
+        )
@@ -0,0 +1,108 @@
+import json
+import os
+import pathlib
+import typing
+
+import pytest
+
+import crc32c
+
+pytestmark = pytest.mark.calculates_crc32c
+
+DATA = b"123456789"
+OLD = 10**18  # mtime_ns old enough for files to be cached
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, filename: str) -> int:
+        self.calls += 1
+        return crc32c.crc32c_file(filename)
+
+
+def _write(path: pathlib.Path, data: bytes, mtime_ns: int = OLD) -> str:
+    path.write_bytes(data)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def test_hits_and_misses(tmp_path: pathlib.Path) -> None:
+    filename = _write(tmp_path / "a", DATA)
+    compute = _Counter()
+    cache = crc32c.ChecksumCache()
+    assert cache.checksum(filename, compute) == 0xE3069283
+    assert cache.checksum(filename, compute) == 0xE3069283
+    assert compute.calls == 1
+
+    _write(tmp_path / "a", b"987654321", OLD + 1)
+    assert cache.checksum(filename, compute) == crc32c.crc32c(b"987654321")
+    assert compute.calls == 2
+
+
+def test_recently_modified_files_not_cached(tmp_path: pathlib.Path) -> None:
+    filename = str(tmp_path / "a")
+    pathlib.Path(filename).write_bytes(DATA)
+    compute = _Counter()
+    cache = crc32c.ChecksumCache()
+    cache.checksum(filename, compute)
+    cache.checksum(filename, compute)
+    assert compute.calls == 2
+    assert len(cache) == 0
+
+
+def test_lru_eviction(tmp_path: pathlib.Path) -> None:
+    filenames = [_write(tmp_path / str(i), DATA * i) for i in range(3)]
+    compute = _Counter()
+    cache = crc32c.ChecksumCache(max_entries=2)
+    cache.checksum(filenames[0], compute)
+    cache.checksum(filenames[1], compute)
+    cache.checksum(filenames[0], compute)
+    cache.checksum(filenames[2], compute)
+    assert len(cache) == 2
+    assert compute.calls == 3
+    cache.checksum(filenames[0], compute)
+    assert compute.calls == 3
+    cache.checksum(filenames[1], compute)
+    assert compute.calls == 4
+    with pytest.raises(ValueError):
+        crc32c.ChecksumCache(max_entries=0)
+
+
+def test_persistence(tmp_path: pathlib.Path) -> None:
+    filename = _write(tmp_path / "a", DATA)
+    cache_path = tmp_path / "cache.json"
+    with crc32c.ChecksumCache(cache_path) as cache:
+        cache.checksum(filename)
+    compute = _Counter()
+    cache = crc32c.ChecksumCache(cache_path)
+    assert cache.checksum(filename, compute) == 0xE3069283
+    assert compute.calls == 0
+
+    cache_path.write_text("not json")
+    assert len(crc32c.ChecksumCache(cache_path)) == 0
+    cache_path.write_text(json.dumps({"version": 1, "entries": [1]}))
+    assert len(crc32c.ChecksumCache(cache_path)) == 0
+
+
+def test_hits_dont_rewrite(tmp_path: pathlib.Path) -> None:
+    filenames = [_write(tmp_path / str(i), DATA * i) for i in range(3)]
+    cache_path = tmp_path / "cache.json"
+    with crc32c.ChecksumCache(cache_path) as cache:
+        cache.checksum(filenames[0])
+        cache.checksum(filenames[1])
+    with crc32c.ChecksumCache(cache_path) as cache:
+        cache_path.unlink()
+        cache.checksum(filenames[0])
+    assert not cache_path.exists()
+
+    # The LRU order is saved along with the next change
+    cache.checksum(filenames[0])
+    cache.checksum(filenames[2])
+    cache.save()
+    entries = json.loads(cache_path.read_text())["entries"]
+    assert len(entries) == 3
+    assert [checksum for _, checksum in entries] == [
+        crc32c.crc32c(DATA * i) for i in (1, 0, 2)
+    ]
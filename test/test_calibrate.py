@@ -0,0 +1,62 @@
+import json
+import pathlib
+import typing
+
+import pytest
+
+import crc32c
+
+
+@pytest.fixture(autouse=True)
+def restore_settings() -> typing.Iterator[None]:
+    backend = crc32c.get_backend()
+    threshold = crc32c.get_gil_release_threshold()
+    yield
+    if backend is not None:
+        crc32c.set_backend(backend)
+    crc32c.set_gil_release_threshold(threshold)
+
+
+def test_gil_release_threshold() -> None:
+    crc32c.set_gil_release_threshold(10)
+    assert crc32c.get_gil_release_threshold() == 10
+    with pytest.raises(ValueError):
+        crc32c.set_gil_release_threshold(-1)
+
+
+@pytest.mark.calculates_crc32c
+def test_calibrate() -> None:
+    calibration = crc32c.calibrate()
+    assert calibration.backend in crc32c.available_backends()
+    assert calibration.backend == crc32c.get_backend()
+    assert calibration.gil_release_threshold == crc32c.get_gil_release_threshold()
+    assert calibration.gil_release_threshold >= 0
+
+
+@pytest.mark.calculates_crc32c
+def test_calibrate_keeps_backend() -> None:
+    backend = crc32c.available_backends()[0]
+    crc32c.set_backend(backend)
+    assert crc32c.calibrate(select_backend=False).backend == backend
+    assert crc32c.get_backend() == backend
+
+
+@pytest.mark.calculates_crc32c
+def test_calibrate_cache(tmp_path: pathlib.Path) -> None:
+    cache_file = str(tmp_path / "calibration.json")
+    calibration = crc32c.calibrate(cache_file=cache_file)
+    with open(cache_file) as f:
+        assert list(json.load(f).values()) == [calibration._asdict()]
+
+    # Results come from the cache file
+    cached = crc32c.Calibration(crc32c.available_backends()[0], 1234)
+    with open(cache_file) as f:
+        cache = json.load(f)
+    cache = {key: cached._asdict() for key in cache}
+    with open(cache_file, "w") as f:
+        json.dump(cache, f)
+    assert crc32c.calibrate(cache_file=cache_file) == cached
+    assert crc32c.get_gil_release_threshold() == 1234
+    assert crc32c.get_backend() == cached.backend
+
+    assert crc32c.calibrate(cache_file=cache_file, recalibrate=True) != cached
@@ -1,10 +1,11 @@
+import pathlib
 import subprocess
 import sys
 import typing
 
 import pytest
 
-from crc32c import crc32c
+from crc32c import crc32c, read_manifests
 
 
 @pytest.mark.parametrize("filename", [__file__, sys.executable])
@@ -13,6 +14,103 @@ from crc32c import crc32c
 def test_cli_outputs_checksum(filename: str, opts: typing.List[str]) -> None:
     with open(filename, "rb") as f:
         expected_checksum = crc32c(f.read())
-    output = subprocess.check_output([sys.executable, "-m", "crc32c._cli", filename])
+    output = subprocess.check_output(
+        [sys.executable, "-m", "crc32c._cli", *opts, filename]
+    )
     checksum, _, _ = output.partition(b" ")
     assert expected_checksum == int(checksum, 16)
+
+
+def _expected_output(filenames: typing.List[str]) -> str:
+    lines = []
+    for filename in filenames:
+        with open(filename, "rb") as f:
+            lines.append(f"{crc32c(f.read()):08x} {filename}\n")
+    return "".join(lines)
+
+
+@pytest.mark.parametrize("jobs", ["1", "3", "0"])
+@pytest.mark.calculates_crc32c
+def test_cli_jobs_keep_order(jobs: str) -> None:
+    filenames = [__file__, sys.executable, __file__] * 3
+    output = subprocess.check_output(
+        [sys.executable, "-m", "crc32c._cli", "-j", jobs, *filenames], text=True
+    )
+    assert output == _expected_output(filenames)
+
+
+@pytest.mark.calculates_crc32c
+def test_cli_filenames_from_stdin_and_file(tmp_path: pathlib.Path) -> None:
+    files_from = tmp_path / "files.txt"
+    files_from.write_text(f"{sys.executable}\n\n{__file__}\n")
+    output = subprocess.check_output(
+        [sys.executable, "-m", "crc32c._cli", "-j2"]
+        + [__file__, "-", "--files-from", str(files_from)],
+        input=f"{sys.executable}\n",
+        text=True,
+    )
+    filenames = [__file__, sys.executable, sys.executable, __file__]
+    assert output == _expected_output(filenames)
+
+
+def test_cli_requires_filenames() -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "crc32c._cli"], capture_output=True, text=True
+    )
+    assert result.returncode != 0
+    assert "no input files given" in result.stderr
+
+
+def _run_cli(*args: str) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run(
+        [sys.executable, "-m", "crc32c._cli", *args], capture_output=True, text=True
+    )
+
+
+@pytest.mark.calculates_crc32c
+def test_cli_manifest_and_verify(tmp_path: pathlib.Path) -> None:
+    data_path = tmp_path / "data"
+    data_path.write_bytes(bytes(range(256)) * 1000)
+    manifest_path = tmp_path / "manifest.json"
+    result = _run_cli(
+        "--manifest", str(manifest_path), "--chunk-size", "1K", "-j2", str(data_path)
+    )
+    assert result.returncode == 0
+    assert result.stdout == _expected_output([str(data_path)])
+    (manifest,) = read_manifests(manifest_path)
+    assert manifest.chunk_size == 1024
+    assert len(manifest.chunks) == 250
+
+    result = _run_cli("--verify", str(manifest_path), "-j0")
+    assert result.returncode == 0
+    assert result.stdout == f"{data_path}: OK\n"
+
+    with open(data_path, "r+b") as f:
+        f.seek(1024 * 7 + 3)
+        f.write(b"\xff")
+    result = _run_cli("--verify", str(manifest_path))
+    assert result.returncode == 1
+    assert result.stdout == f"{data_path}: FAILED chunks 7\n"
+    result = _run_cli("--verify", str(manifest_path), "--chunks", "0-6,8,1000")
+    assert result.returncode == 0
+
+    data_path.unlink()
+    result = _run_cli("--verify", str(manifest_path))
+    assert result.returncode == 1
+    assert "FAILED (No such file or directory)" in result.stdout
+
+
+def test_cli_manifest_option_errors() -> None:
+    assert _run_cli("--chunks", "1", __file__).returncode != 0
+    assert _run_cli("--chunk-size", "0", __file__).returncode != 0
+    assert _run_cli("--verify", "a.json", "--chunks", "x").returncode != 0
+
+
+@pytest.mark.calculates_crc32c
+def test_cli_cache(tmp_path: pathlib.Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    for _ in range(2):
+        result = _run_cli("--cache", str(cache_path), __file__, sys.executable)
+        assert result.returncode == 0
+        assert result.stdout == _expected_output([__file__, sys.executable])
+    assert cache_path.exists()
@@ -22,12 +22,17 @@
 
 from __future__ import annotations
 
+import array
+import hmac
 import os
+import pathlib
 import struct
+import sysconfig
 import warnings
 from typing import Generator, List, NamedTuple
 
 import pytest
+from helpers import DATA
 
 import crc32c
 
@@ -41,6 +46,15 @@ def test_software_mode(crc32c_is_available: bool) -> None:
         assert crc32c.hardware_based
 
 
+def test_backend(crc32c_is_available: bool) -> None:
+    if not crc32c_is_available:
+        assert crc32c.backend is None
+    elif crc32c.hardware_based:
+        assert crc32c.backend in ("sse42", "pclmul", "vpclmul", "arm64")
+    else:
+        assert crc32c.backend == "sw_multi"
+
+
 def ulonglong_as_bytes(x: int) -> bytes:
     return struct.pack("<Q", x)
 
@@ -68,6 +82,39 @@ def as_individual_bytes(x: bytes) -> Generator[bytes, None, None]:
         yield bytes([b])
 
 
+# Lengths of at least 512 MiB need x^(2^k) for k >= 32 when combining
+LARGE_LENGTHS = [2**29, 2**29 + 2**20 + 3]
+_ZEROS = bytes(1024 * 1024)
+
+
+def crc32c_zeros(length: int, value: int = 0) -> int:
+    """The crc32c of length zero bytes, calculated without combining checksums"""
+    for _ in range(length // len(_ZEROS)):
+        value = crc32c.crc32c(_ZEROS, value)
+    return crc32c.crc32c(_ZEROS[: length % len(_ZEROS)], value)
+
+
+def multmodp(a: int, b: int) -> int:
+    """a(x) * b(x) modulo the CRC-32C polynomial, in reversed bit order"""
+    p = 0
+    for i in range(32):
+        if a & (1 << (31 - i)):
+            p ^= b
+        b = (b >> 1) ^ 0x82F63B78 if b & 1 else b >> 1
+    return p
+
+
+def x8nmodp(n: int) -> int:
+    """x^(8 * n) modulo the CRC-32C polynomial, by repeated squaring of x"""
+    p, x, e = 1 << 31, 1 << 30, 8 * n
+    while e:
+        if e & 1:
+            p = multmodp(x, p)
+        x = multmodp(x, x)
+        e >>= 1
+    return p
+
+
 @pytest.mark.calculates_crc32c
 class TestMisc:
 
@@ -87,6 +134,52 @@ class TestMisc:
         _test(b"this_doesnt_release_the_gil_by_default")
         _test(b"this_releases_the_gil_by_default" * 1024 * 1024)
 
+    def test_lengths_and_alignments(self) -> None:
+        # Checksumming in small pieces goes through different code paths
+        # than checksumming the data in one go
+        data = bytes(range(256)) * 24
+        for length in list(range(0, 1100)) + [
+            2047,
+            2048,
+            2049,
+            2319,
+            4095,
+            4096,
+            4097,
+            6000,
+        ]:
+            for offset in (0, 1, 7, 8, 13, 63):
+                view = memoryview(data)[offset : offset + length]
+                expected = 0
+                for chunk in batched(bytes(view), 7):
+                    expected = crc32c.crc32c(chunk, expected)
+                for backend in crc32c.available_backends():
+                    assert expected == crc32c.crc32c(view, backend=backend), (
+                        length,
+                        offset,
+                        backend,
+                    )
+
+    def test_buffer_types(self) -> None:
+        expected = crc32c.crc32c(b"hello world")
+        assert expected == crc32c.crc32c(bytearray(b"hello world"))
+        assert expected == crc32c.crc32c(memoryview(b"hello world"))
+        assert expected == crc32c.crc32c(array.array("B", b"hello world"))
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(TypeError):
+            crc32c.crc32c()  # type: ignore[call-arg]
+        with pytest.raises(TypeError):
+            crc32c.crc32c("hello")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            crc32c.crc32c(b"", 0, -1, None, 0)  # type: ignore[call-arg]
+        with pytest.raises(TypeError):
+            crc32c.crc32c(b"", 0, data=b"")  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            crc32c.crc32c(b"", other=0)  # type: ignore[call-arg]
+        with pytest.raises(TypeError):
+            crc32c.crc32c(b"", 1.0)  # type: ignore[arg-type]
+
     def test_crc32_deprecated(self) -> None:
         with warnings.catch_warnings(record=True) as warns:
             crc32c.crc32(b"")
@@ -169,6 +262,86 @@ class TestCRC32CHash:
         assert crc32c_hash.digest() != crc32c_hash_copy.digest()
         assert crc32c_hash.hexdigest() != crc32c_hash_copy.hexdigest()
 
+    def test_update_many(self) -> None:
+        crc32c_hash = crc32c.CRC32CHash(b"hello")
+        crc32c_hash.update_many([b" ", bytearray(b"wor"), memoryview(b"ld")])
+        assert crc32c_hash.checksum == crc32c.crc32c(b"hello world")
+        with pytest.raises(TypeError):
+            crc32c_hash.update_many([b"1", "2"])  # type: ignore[list-item]
+        assert crc32c_hash.checksum == crc32c.crc32c(b"hello world1")
+
+    def test_length(self) -> None:
+        crc32c_hash = crc32c.CRC32CHash(b"hello")
+        crc32c_hash.update(b" world")
+        crc32c_hash.update_many([b"!", b""])
+        assert crc32c_hash.length == 12
+        assert crc32c_hash.copy().length == 12
+
+    def test_extend_and_concat(self) -> None:
+        parts = [b"hello", b"", b" ", b"world" * 1000]
+        hashes = [crc32c.CRC32CHash(part) for part in parts]
+        expected = crc32c.crc32c(b"".join(parts))
+
+        crc32c_hash = hashes[0].copy()
+        for other in hashes[1:]:
+            crc32c_hash.extend(other)
+        assert crc32c_hash.checksum == expected
+        assert crc32c_hash.length == len(b"".join(parts))
+
+        concatenated = crc32c.CRC32CHash.concat(hashes)
+        assert concatenated.checksum == expected
+        assert concatenated.length == crc32c_hash.length
+        concatenated.update(b"!")
+        assert concatenated.checksum == crc32c.crc32c(b"".join(parts) + b"!")
+        assert crc32c.CRC32CHash.concat([]).checksum == 0
+
+        with pytest.raises(TypeError):
+            crc32c_hash.extend(b"data")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            crc32c.CRC32CHash.concat([crc32c_hash, 1])  # type: ignore[list-item]
+
+    @pytest.mark.parametrize("length", LARGE_LENGTHS)
+    def test_extend_large_length(self, length: int) -> None:
+        zeros = crc32c.CRC32CHash()
+        zeros.update_many([_ZEROS] * (length // len(_ZEROS)))
+        zeros.update(_ZEROS[: length % len(_ZEROS)])
+        assert zeros.length == length
+        expected = crc32c_zeros(length, crc32c.crc32c(b"hello world"))
+
+        crc32c_hash = crc32c.CRC32CHash(b"hello world")
+        crc32c_hash.extend(zeros)
+        assert crc32c_hash.checksum == expected
+        assert crc32c_hash.length == length + 11
+        concatenated = crc32c.CRC32CHash.concat(
+            [crc32c.CRC32CHash(b"hello world"), zeros]
+        )
+        assert concatenated.checksum == expected
+
+    @pytest.mark.parametrize("gil_release_mode", [-1, 0, 1])
+    def test_gil_release_mode(self, gil_release_mode: int) -> None:
+        data = b"0123456789" * 10000
+        crc32c_hash = crc32c.CRC32CHash(data[:5], gil_release_mode=gil_release_mode)
+        crc32c_hash.update(data[5:])
+        assert crc32c_hash.checksum == crc32c.crc32c(data)
+        assert crc32c_hash.copy().checksum == crc32c.crc32c(data)
+
+    def test_subclass_and_factory(self) -> None:
+        class SubHash(crc32c.CRC32CHash):
+            pass
+
+        crc32c_hash = SubHash(b"hello")
+        assert isinstance(crc32c_hash.copy(), SubHash)
+        assert crc32c_hash.checksum == crc32c.new(b"hello").checksum
+        assert crc32c.new().name == "crc32c"
+
+    def test_hmac(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mac = hmac.new(b"key", b"message", digestmod=crc32c)
+            expected = hmac.new(b"key", b"message", digestmod=crc32c.new)
+        assert len(mac.digest()) == 4
+        assert mac.hexdigest() == expected.hexdigest()
+
     @pytest.mark.parametrize(
         "data,crc",
         [pytest.param(value.data, value.crc, id=value.name) for value in test_values],
@@ -223,3 +396,602 @@ class TestCRC32CValues:
             assert checksum == c, (
                 "Invalid checksum when splitting at offset %d" % offset
             )
+
+
+@pytest.mark.calculates_crc32c
+@pytest.mark.parametrize(
+    "data,checksum",
+    [pytest.param(value.data, value.crc, id=value.name) for value in test_values],
+)
+class TestCombine:
+
+    def test_combine(self, data: bytes, checksum: int) -> None:
+        for offset in range(len(data) + 1):
+            crc_a = crc32c.crc32c(data[:offset])
+            crc_b = crc32c.crc32c(data[offset:])
+            assert checksum == crc32c.crc32c_combine(crc_a, crc_b, len(data) - offset)
+
+    def test_combine_many(self, data: bytes, checksum: int) -> None:
+        for chunk_size in range(1, 33):
+            pairs = [
+                (crc32c.crc32c(chunk), len(chunk))
+                for chunk in batched(data, chunk_size)
+            ]
+            assert checksum == crc32c.crc32c_combine_many(pairs)
+            assert checksum == crc32c.crc32c_combine_many(iter(pairs))
+
+
+@pytest.mark.calculates_crc32c
+@pytest.mark.parametrize("length", LARGE_LENGTHS)
+def test_combine_large_lengths(length: int) -> None:
+    crc = crc32c.crc32c(b"hello world")
+    expected = crc32c_zeros(length, crc)
+    assert expected == crc32c.crc32c_combine(crc, crc32c_zeros(length), length)
+    assert expected == crc32c.crc32c_combine_many(
+        [(crc, 11), (crc32c_zeros(length), length)]
+    )
+
+
+@pytest.mark.parametrize("length", [2**31 - 1, 2**32 + 5, 2**40, 2**63 - 1])
+def test_combine_huge_lengths(length: int) -> None:
+    # Appending zero bytes to a crc multiplies it by x^(8 * length)
+    crc = 0xE3069283
+    assert multmodp(x8nmodp(length), crc) == crc32c.crc32c_combine(crc, 0, length)
+    assert 0 == crc32c.crc32c_combine(0, 0, length)
+    assert 0 == crc32c.crc32c_combine_many([])
+
+
+def test_combine_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        crc32c.crc32c_combine(0, 0, -1)
+    with pytest.raises(ValueError):
+        crc32c.crc32c_combine_many([(0, 1, 2)])  # type: ignore[list-item]
+    with pytest.raises(ValueError):
+        crc32c.crc32c_combine_many([(0, -1)])
+    with pytest.raises(TypeError):
+        crc32c.crc32c_combine_many([0])  # type: ignore[list-item]
+
+
+@pytest.mark.calculates_crc32c
+class TestParallel:
+
+    @pytest.mark.parametrize("threads", [0, 1, 2, 3, 7])
+    @pytest.mark.parametrize("min_chunk_size", [1, 5, 1024])
+    def test_parallel(self, threads: int, min_chunk_size: int) -> None:
+        data = bytes(range(256)) * 201
+        for value in (0, 0xDEADBEEF):
+            expected = crc32c.crc32c(data, value)
+            assert expected == crc32c.crc32c_parallel(
+                data, value, threads=threads, min_chunk_size=min_chunk_size
+            )
+
+    def test_parallel_values(self) -> None:
+        for value in test_values:
+            assert value.crc == crc32c.crc32c_parallel(value.data, min_chunk_size=1)
+
+    @pytest.mark.large
+    def test_large_chunks(self) -> None:
+        # Two chunks of 512 MiB, whose crcs need combining with large lengths
+        # (combining itself is covered by test_combine_large_lengths)
+        data = bytes(2 * LARGE_LENGTHS[0])
+        expected = crc32c_zeros(len(data), 0xDEADBEEF)
+        assert expected == crc32c.crc32c_parallel(
+            data, 0xDEADBEEF, threads=2, min_chunk_size=LARGE_LENGTHS[0]
+        )
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            crc32c.crc32c_parallel(b"", threads=-1)
+        with pytest.raises(ValueError):
+            crc32c.crc32c_parallel(b"", min_chunk_size=0)
+
+
+@pytest.mark.calculates_crc32c
+class TestCopy:
+
+    data = bytes(range(256)) * 201
+
+    @pytest.mark.parametrize("offset", [0, 1, 3])
+    @pytest.mark.parametrize("gil_release_mode", [0, 1])
+    def test_copy(self, offset: int, gil_release_mode: int) -> None:
+        dst = bytearray(len(self.data) + offset + 10)
+        for value in (0, 0xDEADBEEF):
+            crc = crc32c.copy_crc32c(
+                self.data, memoryview(dst)[offset:], value, gil_release_mode
+            )
+            assert crc == crc32c.crc32c(self.data, value)
+            assert dst[offset : offset + len(self.data)] == self.data
+            assert dst[:offset] == bytes(offset)
+            assert dst[offset + len(self.data) :] == bytes(10)
+
+    def test_copy_values(self) -> None:
+        for value in test_values:
+            dst = bytearray(len(value.data))
+            assert value.crc == crc32c.copy_crc32c(value.data, dst)
+            assert dst == value.data
+
+    @pytest.mark.parametrize("shift", [-5, 0, 5])
+    def test_overlapping(self, shift: int) -> None:
+        buf = bytearray(10) + bytearray(self.data) + bytearray(10)
+        view = memoryview(buf)
+        src = view[10 : 10 + len(self.data)]
+        dst = view[10 + shift :]
+        assert crc32c.crc32c(self.data) == crc32c.copy_crc32c(src, dst)
+        assert buf[10 + shift : 10 + shift + len(self.data)] == self.data
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            crc32c.copy_crc32c(b"abc", bytearray(2))
+        with pytest.raises(TypeError):
+            crc32c.copy_crc32c(b"abc", b"abc")
+
+
+@pytest.mark.calculates_crc32c
+class TestFile:
+
+    data = DATA
+
+    @pytest.fixture
+    def path(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        path = tmp_path / "data"
+        path.write_bytes(self.data)
+        return path
+
+    @pytest.mark.parametrize("offset", [0, 1, 4095, 4096, 10000, 256256, 300000])
+    @pytest.mark.parametrize("length", [None, 0, 1, 5000, 1000000])
+    def test_file(self, path: pathlib.Path, offset: int, length: int | None) -> None:
+        end = None if length is None else offset + length
+        expected = crc32c.crc32c(self.data[offset:end])
+        assert expected == crc32c.crc32c_file(path, offset, length)
+        assert expected == crc32c.crc32c_file(str(path), offset=offset, length=length)
+        with open(path, "rb") as f:
+            assert expected == crc32c.crc32c_file(f.fileno(), offset, length)
+
+    @pytest.mark.parametrize("offset", [0, 12345, 64 * 1024 * 1024 - 1])
+    @pytest.mark.parametrize("length", [70 * 1024 * 1024, 140 * 1024 * 1024 + 3])
+    def test_range_across_windows(
+        self, tmp_path: pathlib.Path, offset: int, length: int
+    ) -> None:
+        # Files are mapped in 64 MiB windows, so these ranges span several
+        path = tmp_path / "sparse"
+        with open(path, "wb") as f:
+            for position in range(0, 160 * 1024 * 1024, 10 * 1024 * 1024):
+                f.seek(position)
+                f.write(self.data)
+        with open(path, "rb") as f:
+            f.seek(offset)
+            expected = crc32c.crc32c(f.read(length))
+            assert expected == crc32c.crc32c_file(f.fileno(), offset, length)
+        assert expected == crc32c.crc32c_file(path, offset, length)
+
+    def test_value(self, path: pathlib.Path) -> None:
+        value = crc32c.crc32c(b"header")
+        expected = crc32c.crc32c(self.data, value)
+        assert expected == crc32c.crc32c_file(path, value=value)
+
+    def test_pipe(self) -> None:
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, b"123456789")
+            os.close(write_fd)
+            assert 0xE3069283 == crc32c.crc32c_file(read_fd)
+        finally:
+            os.close(read_fd)
+
+    def test_empty(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+        assert 0 == crc32c.crc32c_file(path)
+        assert 0 == crc32c.crc32c_file(path, offset=10)
+
+    @pytest.mark.skipif(not os.path.exists("/proc/version"), reason="requires procfs")
+    def test_zero_sized_regular_file(self) -> None:
+        # procfs files are regular but report a size of 0
+        path = "/proc/version"
+        assert 0 == os.stat(path).st_size
+        with open(path, "rb") as f:
+            data = f.read()
+        assert data
+        assert crc32c.crc32c(data) == crc32c.crc32c_file(path)
+        assert crc32c.crc32c(data[5:]) == crc32c.crc32c_file(path, offset=5)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            assert crc32c.crc32c(data) == crc32c.crc32c_file(fd)
+        finally:
+            os.close(fd)
+
+    def test_errors(self, tmp_path: pathlib.Path) -> None:
+        missing = tmp_path / "missing"
+        with pytest.raises(FileNotFoundError) as excinfo:
+            crc32c.crc32c_file(missing)
+        assert excinfo.value.filename == missing
+        with pytest.raises(ValueError):
+            crc32c.crc32c_file(missing, offset=-1)
+        with pytest.raises(ValueError):
+            crc32c.crc32c_file(missing, length=-1)
+        with pytest.raises(ValueError):
+            crc32c.crc32c_file(-1)
+
+
+@pytest.mark.calculates_crc32c
+class TestMany:
+
+    def test_many(self) -> None:
+        buffers = [value.data for value in test_values]
+        result = crc32c.crc32c_many(buffers)
+        assert result.typecode == "I"
+        assert list(result) == [value.crc for value in test_values]
+        assert list(crc32c.crc32c_many(iter(buffers))) == list(result)
+
+    def test_values(self) -> None:
+        buffers = [memoryview(value.data)[3:] for value in test_values[:-1]]
+        values = [crc32c.crc32c(value.data[:3]) for value in test_values[:-1]]
+        result = crc32c.crc32c_many(buffers, values)
+        assert list(result) == [value.crc for value in test_values[:-1]]
+
+    def test_gil_behaviour(self) -> None:
+        buffers = [b"a" * 1024] * 64
+        expected = [crc32c.crc32c(buffer) for buffer in buffers]
+        for gil_release_mode in (-1, 0, 1):
+            result = crc32c.crc32c_many(buffers, gil_release_mode=gil_release_mode)
+            assert list(result) == expected
+
+    def test_empty(self) -> None:
+        assert len(crc32c.crc32c_many([])) == 0
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            crc32c.crc32c_many([b"a"], values=[0, 0])
+        with pytest.raises(TypeError):
+            crc32c.crc32c_many([b"a", "not a buffer"])  # type: ignore[list-item]
+
+
+@pytest.mark.calculates_crc32c
+class TestStrided:
+
+    data = bytes(range(256)) * 40
+
+    @pytest.mark.parametrize("record_size", [1, 3, 7, 8, 9, 64, 100, 4096])
+    @pytest.mark.parametrize("stride", [None, 1, 13, 4096])
+    def test_strided(self, record_size: int, stride: int | None) -> None:
+        step = stride or record_size
+        expected = [
+            crc32c.crc32c(self.data[offset : offset + record_size])
+            for offset in range(0, len(self.data) - record_size + 1, step)
+        ]
+        result = crc32c.crc32c_strided(self.data, record_size, stride)
+        assert result.typecode == "I"
+        assert list(result) == expected
+
+    def test_out(self) -> None:
+        out = array.array("I", [0] * 11)
+        result = crc32c.crc32c_strided(self.data, 1000, out=out)
+        assert result is out
+        expected = [
+            crc32c.crc32c(self.data[i : i + 1000]) for i in range(0, 10000, 1000)
+        ]
+        assert list(out[:10]) == expected
+        assert out[10] == 0
+
+    def test_gil_behaviour(self) -> None:
+        expected = list(crc32c.crc32c_strided(self.data, 10))
+        for gil_release_mode in (-1, 0, 1):
+            result = crc32c.crc32c_strided(
+                self.data, 10, gil_release_mode=gil_release_mode
+            )
+            assert list(result) == expected
+
+    def test_buffer_smaller_than_record(self) -> None:
+        assert len(crc32c.crc32c_strided(b"abc", 4)) == 0
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            crc32c.crc32c_strided(self.data, 0)
+        with pytest.raises(ValueError):
+            crc32c.crc32c_strided(self.data, 10, stride=0)
+        with pytest.raises(ValueError):
+            crc32c.crc32c_strided(self.data, 10, out=array.array("I", [0]))
+        with pytest.raises(TypeError):
+            crc32c.crc32c_strided(self.data, 10, out=bytearray(4000))
+        with pytest.raises(TypeError):
+            crc32c.crc32c_strided(self.data, 10, out=array.array("f", [0] * 1000))
+
+
+class TestBackends:
+
+    def test_available_backends(self, crc32c_is_available: bool) -> None:
+        backends = crc32c.available_backends()
+        assert crc32c.get_backend() == crc32c.backend
+        if crc32c_is_available:
+            assert crc32c.backend in backends
+        if os.environ.get("CRC32C_SW_MODE") == "none":
+            assert "sw" not in backends
+        else:
+            assert "sw" in backends
+
+    @pytest.mark.parametrize(
+        "data,checksum",
+        [pytest.param(value.data, value.crc, id=value.name) for value in test_values],
+    )
+    def test_explicit_backend(self, data: bytes, checksum: int) -> None:
+        for backend in crc32c.available_backends():
+            assert checksum == crc32c.crc32c(data, backend=backend)
+            c = crc32c.crc32c(data[:100], backend=backend)
+            assert checksum == crc32c.crc32c(data[100:], c, backend=backend)
+
+    def test_software_backends(self) -> None:
+        backends = crc32c.available_backends()
+        if "sw" not in backends:
+            pytest.skip("software backends are unavailable")
+        assert "sw16" in backends and "sw_multi" in backends
+        # Long enough to go through several of the multi-stream rounds
+        data = os.urandom(3 * 3 * 4096 + 100)
+        for length in (0, 15, 16, 17, 12287, 12288, 12289, 24576, 24591, len(data)):
+            for offset in (0, 3):
+                view = memoryview(data)[offset : offset + length]
+                expected = crc32c.crc32c(view, backend="sw")
+                assert expected == crc32c.crc32c(view, backend="sw16"), length
+                assert expected == crc32c.crc32c(view, backend="sw_multi"), length
+                c = crc32c.crc32c(view[:5000], backend="sw_multi")
+                assert expected == crc32c.crc32c(view[5000:], c, backend="sw_multi")
+
+    def test_set_backend(self) -> None:
+        original = crc32c.get_backend()
+        try:
+            for backend in crc32c.available_backends():
+                crc32c.set_backend(backend)
+                assert backend == crc32c.get_backend()
+                assert 0xE3069283 == crc32c.crc32c(b"123456789")
+        finally:
+            if original is not None:
+                crc32c.set_backend(original)
+        assert crc32c.backend == original
+
+    def test_invalid_backend(self) -> None:
+        with pytest.raises(ValueError):
+            crc32c.crc32c(b"", backend="does-not-exist")
+        with pytest.raises(ValueError):
+            crc32c.set_backend("does-not-exist")
+        with pytest.raises(TypeError):
+            crc32c.set_backend(1)  # type: ignore[arg-type]
+
+
+@pytest.mark.calculates_crc32c
+class TestStats:
+
+    @pytest.fixture(autouse=True)
+    def stats_enabled(self) -> Generator[None, None, None]:
+        was_enabled = crc32c.stats()["enabled"]
+        crc32c.enable_stats()
+        crc32c.reset_stats()
+        yield
+        crc32c.enable_stats(was_enabled)
+        crc32c.reset_stats()
+
+    def test_disabled(self) -> None:
+        crc32c.enable_stats(False)
+        crc32c.crc32c(b"123456789")
+        stats = crc32c.stats()
+        assert not stats["enabled"]
+        assert {} == stats["backends"]
+        assert 0 == stats["gil_held"] + stats["gil_released"]
+
+    def test_counters(self) -> None:
+        backend = crc32c.get_backend()
+        assert backend is not None
+        crc32c.crc32c(b"")
+        crc32c.crc32c(b"123456789", gil_release_mode=0)
+        crc32c.crc32c(b" " * 100000, gil_release_mode=1)
+        crc32c.CRC32CHash(b"1234")
+        stats = crc32c.stats()
+        assert stats["enabled"]
+        assert {backend} == set(stats["backends"])
+        backend_stats = stats["backends"][backend]
+        assert 4 == backend_stats["calls"]
+        assert 100013 == backend_stats["bytes"]
+        # only large calls are timed
+        assert 100000 == backend_stats["timed_bytes"]
+        assert backend_stats["time_ns"] > 0
+        assert {0: 1, 4: 1, 8: 1, 65536: 1} == stats["sizes"]
+        if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+            assert 1 == stats["gil_released"]
+            assert 3 == stats["gil_held"]
+
+    def test_batches(self) -> None:
+        backend = crc32c.get_backend()
+        assert backend is not None
+        crc32c.crc32c_many([b"", b"1234", bytes(100000)], gil_release_mode=1)
+        crc32c.crc32c_strided(bytes(100), 10, gil_release_mode=0)
+        crc32c.crc32c_parallel(b"123456789")
+        crc32c.copy_crc32c(b"123456789", bytearray(9), gil_release_mode=0)
+        framed = crc32c.frame_records([b"1234"], gil_release_mode=0)
+        crc32c.scan_masked_records(framed, gil_release_mode=0)
+        stats = crc32c.stats()
+        backend_stats = stats["backends"][backend]
+        # each buffer, record, header and payload is a call
+        assert 3 + 10 + 1 + 1 + 2 + 2 == backend_stats["calls"]
+        assert 100004 + 100 + 9 + 9 + 12 + 12 == backend_stats["bytes"]
+        # only batches adding up to large inputs are timed
+        assert 100004 == backend_stats["timed_bytes"]
+        assert backend_stats["time_ns"] > 0
+        assert {0: 1, 4: 3, 8: 14, 65536: 1} == stats["sizes"]
+        if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+            assert 3 == stats["gil_released"]
+            assert 16 == stats["gil_held"]
+
+    @pytest.mark.skipif(
+        bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        reason="the GIL is never released on free-threaded builds",
+    )
+    def test_strided_overlapping_records(self) -> None:
+        # 501 records of 500 bytes add up to far more than the buffer
+        threshold = crc32c.get_gil_release_threshold()
+        crc32c.set_gil_release_threshold(100000)
+        try:
+            crc32c.crc32c_strided(bytes(1000), 500, stride=1)
+        finally:
+            crc32c.set_gil_release_threshold(threshold)
+        stats = crc32c.stats()
+        assert 501 == stats["gil_released"]
+        assert 250500 == stats["backends"][crc32c.get_backend()]["timed_bytes"]
+
+    def test_file(self, tmp_path: pathlib.Path) -> None:
+        backend = crc32c.get_backend()
+        assert backend is not None
+        path = tmp_path / "data"
+        path.write_bytes(bytes(100000))
+        crc32c.crc32c_file(path)
+        crc32c.crc32c_file(path, offset=99996)
+        stats = crc32c.stats()
+        backend_stats = stats["backends"][backend]
+        assert 2 == backend_stats["calls"]
+        assert 100004 == backend_stats["bytes"]
+        assert 100000 == backend_stats["timed_bytes"]
+        assert {4: 1, 65536: 1} == stats["sizes"]
+
+    def test_explicit_backend(self) -> None:
+        for backend in crc32c.available_backends():
+            crc32c.crc32c(b"123456789", backend=backend)
+        stats = crc32c.stats()
+        assert set(crc32c.available_backends()) == set(stats["backends"])
+        for backend_stats in stats["backends"].values():
+            assert 1 == backend_stats["calls"]
+            assert 9 == backend_stats["bytes"]
+
+    def test_reset(self) -> None:
+        crc32c.crc32c(b"123456789")
+        crc32c.reset_stats()
+        stats = crc32c.stats()
+        assert stats["enabled"]
+        assert {} == stats["backends"]
+        assert {} == stats["sizes"]
+
+
+def masked(crc: int) -> int:
+    return (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+@pytest.mark.calculates_crc32c
+class TestMaskedRecords:
+
+    payloads = [b"", b"a", b"123456789", os.urandom(1000), os.urandom(70000)]
+
+    def framed(self, payload: bytes) -> bytes:
+        header = struct.pack("<Q", len(payload))
+        return (
+            header
+            + struct.pack("<I", masked(crc32c.crc32c(header)))
+            + payload
+            + struct.pack("<I", masked(crc32c.crc32c(payload)))
+        )
+
+    def test_mask(self) -> None:
+        assert 0xA282EAD8 == crc32c.mask_crc32c(0)
+        for crc in (0, 1, 0xE3069283, 0xFFFFFFFF):
+            assert masked(crc) == crc32c.mask_crc32c(crc)
+            assert crc == crc32c.unmask_crc32c(crc32c.mask_crc32c(crc))
+
+    @pytest.mark.parametrize("gil_release_mode", [0, 1])
+    def test_frame_records(self, gil_release_mode: int) -> None:
+        expected = b"".join(self.framed(payload) for payload in self.payloads)
+        assert expected == crc32c.frame_records(self.payloads, gil_release_mode)
+        assert b"" == crc32c.frame_records([])
+        with pytest.raises(TypeError):
+            crc32c.frame_records([b"", "not a buffer"])  # type: ignore[list-item]
+
+    @pytest.mark.parametrize("gil_release_mode", [0, 1])
+    def test_scan_masked_records(self, gil_release_mode: int) -> None:
+        data = crc32c.frame_records(self.payloads)
+        offsets, lengths, valid, end = crc32c.scan_masked_records(
+            data, gil_release_mode
+        )
+        assert len(data) == end
+        assert b"\x01" * len(self.payloads) == valid
+        assert self.payloads == [
+            data[offset : offset + length] for offset, length in zip(offsets, lengths)
+        ]
+        assert 12 == offsets[0]
+
+    def test_scan_empty(self) -> None:
+        offsets, lengths, valid, end = crc32c.scan_masked_records(b"")
+        assert (0, 0, b"", 0) == (len(offsets), len(lengths), valid, end)
+
+    def test_scan_corrupted_payload(self) -> None:
+        data = bytearray(crc32c.frame_records(self.payloads))
+        offsets, _, _, _ = crc32c.scan_masked_records(data)
+        data[offsets[2] + 4] ^= 0x10
+        _, _, valid, end = crc32c.scan_masked_records(data)
+        assert b"\x01\x01\x00\x01\x01" == valid
+        assert len(data) == end
+
+    def test_scan_stops_at_corrupted_header(self) -> None:
+        data = bytearray(crc32c.frame_records(self.payloads))
+        offsets, _, _, _ = crc32c.scan_masked_records(data)
+        data[offsets[3] - 12] ^= 0x01
+        new_offsets, _, valid, end = crc32c.scan_masked_records(data)
+        assert list(offsets[:3]) == list(new_offsets)
+        assert b"\x01" * 3 == valid
+        assert offsets[3] - 12 == end
+
+    def test_scan_stops_at_incomplete_record(self) -> None:
+        data = crc32c.frame_records(self.payloads)
+        last_record = len(data) - len(self.framed(self.payloads[-1]))
+        for size in (last_record, last_record + 11, len(data) - 1):
+            offsets, _, valid, end = crc32c.scan_masked_records(data[:size])
+            assert len(self.payloads) - 1 == len(offsets) == len(valid)
+            assert last_record == end
+
+
+@pytest.mark.calculates_crc32c
+class TestRolling:
+
+    data = os.urandom(3000)
+
+    @pytest.mark.parametrize("window", [1, 2, 7, 64, 1000, 5000])
+    def test_roll(self, window: int) -> None:
+        rolling = crc32c.RollingCRC32C(window)
+        assert rolling.window == window
+        crcs = rolling.roll(self.data[:5])
+        crcs.extend(rolling.roll(self.data[5:1500]))
+        crcs.extend(rolling.roll(self.data[1500:]))
+        expected = [
+            crc32c.crc32c(self.data[end - window : end])
+            for end in range(window, len(self.data) + 1)
+        ]
+        assert crcs.tolist() == expected
+
+    @pytest.mark.parametrize("window", [1, 16, 1000])
+    def test_update(self, window: int) -> None:
+        rolling = crc32c.RollingCRC32C(window)
+        for end in (0, 3, 10, 999, 1000, 1001, 2500, 3000):
+            rolling.reset()
+            rolling.update(self.data[:end])
+            assert rolling.full == (end >= window)
+            assert rolling.checksum == crc32c.crc32c(
+                self.data[max(0, end - window) : end]
+            )
+
+    @pytest.mark.large
+    def test_large_window(self) -> None:
+        window = LARGE_LENGTHS[-1]
+        rolling = crc32c.RollingCRC32C(window)
+        for _ in range(window // len(_ZEROS)):
+            rolling.update(_ZEROS)
+        rolling.update(_ZEROS[: window % len(_ZEROS)])
+        assert rolling.checksum == crc32c_zeros(window)
+        crcs = rolling.roll(b"hello")
+        assert crcs[0] == crc32c.crc32c(b"h", crc32c_zeros(window - 1))
+        assert crcs[-1] == crc32c.crc32c(b"hello", crc32c_zeros(window - 5))
+
+    def test_copy(self) -> None:
+        rolling = crc32c.RollingCRC32C(100)
+        rolling.update(self.data[:150])
+        copy = rolling.copy()
+        rolling.update(self.data[150:200])
+        copy.update(self.data[150:200])
+        assert copy.checksum == rolling.checksum == crc32c.crc32c(self.data[100:200])
+
+    def test_invalid_window(self) -> None:
+        for window in (0, -1):
+            with pytest.raises(ValueError):
+                crc32c.RollingCRC32C(window)
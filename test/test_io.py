@@ -0,0 +1,109 @@
+import io
+import shutil
+import typing
+
+import pytest
+from helpers import DATA, ReadOnly
+
+import crc32c
+
+pytestmark = pytest.mark.calculates_crc32c
+
+
+class _ShortWriter(io.RawIOBase):
+    """A raw stream writing at most 1000 bytes at a time"""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: typing.Any) -> int:
+        with memoryview(buffer) as view:
+            self.data += view[:1000]
+            return min(len(view), 1000)
+
+
+@pytest.mark.parametrize("raw_type", [io.BytesIO, ReadOnly])
+def test_reader(raw_type: typing.Callable[[bytes], typing.Any]) -> None:
+    reader = crc32c.ChecksumReader(raw_type(DATA))
+    buffer = bytearray(4096)
+    read = bytearray()
+    while True:
+        n = reader.readinto(buffer)
+        if not n:
+            break
+        read += buffer[:n]
+    assert read == DATA
+    assert reader.checksum == crc32c.crc32c(DATA)
+    assert reader.length == len(DATA)
+    assert reader.verify(crc32c.crc32c(DATA))
+    assert not reader.verify(crc32c.crc32c(DATA) ^ 1)
+
+
+def test_reader_read_and_close() -> None:
+    raw = io.BytesIO(DATA)
+    with crc32c.ChecksumReader(raw) as reader:
+        assert reader.read(10) == DATA[:10]
+        assert reader.read() == DATA[10:]
+    assert reader.checksum == crc32c.crc32c(DATA)
+    assert raw.closed
+
+
+def test_reader_buffered() -> None:
+    with io.BufferedReader(crc32c.ChecksumReader(io.BytesIO(DATA))) as buffered:
+        lines = buffered.readlines()
+        reader = buffered.raw
+        assert isinstance(reader, crc32c.ChecksumReader)
+        assert b"".join(lines) == DATA
+        assert reader.verify(crc32c.crc32c(DATA))
+
+
+@pytest.mark.parametrize("background_threshold", [None, 1, 5000])
+def test_writer(background_threshold: typing.Optional[int]) -> None:
+    raw = io.BytesIO()
+    writer = crc32c.ChecksumWriter(raw, background_threshold)
+    for i in range(0, len(DATA), 4096):
+        assert writer.write(memoryview(DATA)[i : i + 4096]) == len(DATA[i : i + 4096])
+    writer.flush()
+    assert raw.getvalue() == DATA
+    assert writer.checksum == crc32c.crc32c(DATA)
+    assert writer.length == len(DATA)
+    assert writer.verify(crc32c.crc32c(DATA))
+    writer.close()
+    assert raw.closed
+
+
+@pytest.mark.parametrize("background_threshold", [None, 1])
+def test_writer_short_writes(background_threshold: typing.Optional[int]) -> None:
+    raw = _ShortWriter()
+    writer = crc32c.ChecksumWriter(raw, background_threshold)
+    view = memoryview(DATA)
+    while view:
+        n = writer.write(view)
+        assert n is not None
+        view = view[n:]
+    assert raw.data == DATA
+    assert writer.verify(crc32c.crc32c(DATA))
+
+
+def test_writer_shutil() -> None:
+    raw = io.BytesIO()
+    with crc32c.ChecksumWriter(raw) as writer:
+        shutil.copyfileobj(io.BytesIO(DATA), writer)
+        assert writer.verify(crc32c.crc32c(DATA))
+
+
+def test_writer_errors() -> None:
+    with pytest.raises(ValueError):
+        crc32c.ChecksumWriter(io.BytesIO(), 0)
+    raw = io.BytesIO()
+    raw.close()
+    writer = crc32c.ChecksumWriter(raw, 1)
+    with pytest.raises(ValueError):
+        writer.write(DATA)
+    assert writer.checksum == 0
+    with pytest.raises(ValueError):
+        writer.close()
+    assert writer.closed
@@ -0,0 +1,80 @@
+import pathlib
+
+import pytest
+from helpers import DATA
+
+import crc32c
+
+pytestmark = pytest.mark.calculates_crc32c
+
+
+@pytest.fixture
+def path(tmp_path: pathlib.Path) -> str:
+    path = tmp_path / "data"
+    path.write_bytes(DATA)
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 4096, len(DATA), 10**9])
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_create_manifest(path: str, chunk_size: int, jobs: int) -> None:
+    manifest = crc32c.create_manifest(path, chunk_size, jobs)
+    assert manifest.size == len(DATA)
+    assert manifest.checksum == crc32c.crc32c(DATA)
+    assert len(manifest.chunks) == -(-len(DATA) // chunk_size)
+    for index, crc in enumerate(manifest.chunks):
+        offset, length = manifest.chunk_range(index)
+        assert crc == crc32c.crc32c(DATA[offset : offset + length])
+    assert crc32c.verify_manifest(manifest, jobs=jobs) == []
+
+
+@pytest.mark.large
+def test_large_chunks(tmp_path: pathlib.Path) -> None:
+    # A file with chunks of more than 512 MiB, whose crcs need combining
+    # with large lengths. It's sparse where the filesystem allows it
+    chunk_size = 2**29 + 4096
+    path = tmp_path / "large"
+    with open(path, "wb") as f:
+        f.write(DATA)
+        f.truncate(2 * chunk_size + 1000)
+        f.seek(-len(DATA), 2)
+        f.write(DATA)
+    manifest = crc32c.create_manifest(str(path), chunk_size, jobs=3)
+    assert len(manifest.chunks) == 3
+    assert manifest.checksum == crc32c.crc32c_file(str(path))
+    assert crc32c.verify_manifest(manifest) == []
+
+
+def test_empty_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    manifest = crc32c.create_manifest(str(path), 1024)
+    assert manifest.checksum == 0
+    assert manifest.chunks == []
+    assert crc32c.verify_manifest(manifest) == []
+
+
+def test_verify_localises_corruption(path: str) -> None:
+    manifest = crc32c.create_manifest(path, 1000)
+    with open(path, "r+b") as f:
+        f.seek(5500)
+        f.write(b"\xff")
+    assert crc32c.verify_manifest(manifest) == [5]
+    assert crc32c.verify_manifest(manifest, [0, 1, 5], jobs=2) == [5]
+    assert crc32c.verify_manifest(manifest, [4, 6]) == []
+    with pytest.raises(IndexError):
+        crc32c.verify_manifest(manifest, [len(manifest.chunks)])
+
+
+def test_verify_size_change(path: str) -> None:
+    manifest = crc32c.create_manifest(path, 1000)
+    with open(path, "ab") as f:
+        f.write(b"more")
+    assert crc32c.verify_manifest(manifest, [0, 1]) == [0, 1]
+
+
+def test_read_write(path: str, tmp_path: pathlib.Path) -> None:
+    manifests = [crc32c.create_manifest(path, 1000), crc32c.create_manifest(path, 7)]
+    manifest_path = tmp_path / "manifest.json"
+    crc32c.write_manifests(manifest_path, manifests)
+    assert crc32c.read_manifests(manifest_path) == manifests
@@ -0,0 +1,35 @@
+import io
+
+import pytest
+from helpers import DATA, ReadOnly
+
+import crc32c
+
+pytestmark = pytest.mark.calculates_crc32c
+
+
+class _Failing:
+    def read(self, size: int) -> bytes:
+        raise OSError("read failed")
+
+
+@pytest.mark.parametrize("block_size", [1, 1000, 4096, 1024 * 1024])
+def test_stream(block_size: int) -> None:
+    expected = crc32c.crc32c(DATA)
+    assert expected == crc32c.crc32c_stream(io.BytesIO(DATA), block_size)
+    assert expected == crc32c.crc32c_stream(ReadOnly(DATA), block_size=block_size)
+
+
+def test_stream_value_and_position() -> None:
+    fileobj = io.BytesIO(DATA)
+    fileobj.seek(10)
+    value = crc32c.crc32c(DATA[:10])
+    assert crc32c.crc32c(DATA) == crc32c.crc32c_stream(fileobj, value=value)
+    assert crc32c.crc32c_stream(io.BytesIO()) == 0
+
+
+def test_stream_errors() -> None:
+    with pytest.raises(OSError, match="read failed"):
+        crc32c.crc32c_stream(_Failing())
+    with pytest.raises(ValueError):
+        crc32c.crc32c_stream(io.BytesIO(DATA), 0)